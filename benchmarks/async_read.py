@@ -0,0 +1,112 @@
+"""Async read path benchmark.
+
+Serves product list through the ASGI handler in process, comparing the \
+    sync DRF viewset (`/commerce/products/`) with the async view \
+    (`/commerce/async/products/`) under concurrent requests, on a temporary \
+    SQLite database seeded with synthetic products.
+
+Usage
+-----
+- `python -m benchmarks.async_read [--products 1000] [--requests 500] \
+    [--concurrency 50]`
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from benchmarks.data import percentile
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "djarf.settings")
+
+
+def setup_database(directory: str, products: int) -> None:
+    """Migrates temporary database and seeds synthetic products."""
+    from django.conf import settings
+
+    settings.DEBUG = False
+    settings.ALLOWED_HOSTS = ["*"]
+    settings.DATABASES["default"]["NAME"] = os.path.join(directory, "db")
+    settings.CACHES["benchmark"] = {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache"
+    }
+    settings.RESPONSE_CACHE_ALIAS = "benchmark"
+
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command("migrate", verbosity=0)
+
+    from commerce.models import Category, Product, Review, Tag
+    from common.models import User
+
+    users = User.objects.bulk_create(
+        User(username=f"user{index}") for index in range(10)
+    )
+    category = Category.objects.create(title="category")
+    tag = Tag.objects.create(title="tag")
+    created = Product.objects.bulk_create(
+        Product(
+            vendor=users[index % len(users)],
+            category=category,
+            title=f"product{index}",
+            price=index,
+        )
+        for index in range(products)
+    )
+    Product.tags.through.objects.bulk_create(
+        Product.tags.through(product=product, tag=tag) for product in created
+    )
+    Review.objects.bulk_create(
+        Review(reviewer=user, product=product, rating=5.0)
+        for product in created
+        for user in users[:3]
+    )
+
+
+async def measure(path: str, requests: int, concurrency: int) -> list:
+    """Measures latency seconds of concurrent GET requests to path."""
+    from django.test import AsyncClient
+
+    client = AsyncClient()
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def request() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.status_code
+
+    await asyncio.gather(*[request() for _ in range(requests)])
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        setup_database(directory, args.products)
+        for path in ["/commerce/products/", "/commerce/async/products/"]:
+            start = time.perf_counter()
+            latencies = asyncio.run(
+                measure(path, args.requests, args.concurrency)
+            )
+            seconds = time.perf_counter() - start
+            print(
+                f"{path}: {args.requests / seconds:.1f} req/s, "
+                f"p50 {statistics.median(latencies) * 1000:.1f} ms, "
+                f"p99 {percentile(latencies, 99) * 1000:.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
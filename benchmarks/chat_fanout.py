@@ -0,0 +1,75 @@
+"""Chat room fan-out benchmark.
+
+Connects clients to one chat room through `chat.consumers.ChatConsumer` and \
+    the configured channel layer, sends messages from one client and \
+    measures latency until each client receives them.
+
+Usage
+-----
+- `python -m benchmarks.chat_fanout [--clients 1000] [--messages 10]`
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from benchmarks.data import percentile
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "djarf.settings")
+
+
+async def run(clients: int, messages: int) -> list:
+    """Runs fan-out, returning latency seconds of every received message."""
+    from channels.routing import URLRouter
+    from channels.testing import WebsocketCommunicator
+    from chat.routing import websocket_urlpatterns
+
+    application = URLRouter(websocket_urlpatterns)
+    communicators = [
+        WebsocketCommunicator(application, "/ws/chat/benchmark/")
+        for _ in range(clients)
+    ]
+    await asyncio.gather(
+        *[communicator.connect() for communicator in communicators]
+    )
+
+    latencies = []
+    for index in range(messages):
+        start = time.perf_counter()
+        await communicators[0].send_json_to({"message": str(index)})
+
+        async def receive(communicator: WebsocketCommunicator) -> None:
+            await communicator.receive_json_from(timeout=60)
+            latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(
+            *[receive(communicator) for communicator in communicators]
+        )
+
+    await asyncio.gather(
+        *[communicator.disconnect() for communicator in communicators]
+    )
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--messages", type=int, default=10)
+    args = parser.parse_args()
+
+    import django
+
+    django.setup()
+    latencies = asyncio.run(run(args.clients, args.messages))
+    print(
+        f"{args.clients} clients, {args.messages} messages: "
+        f"p50 {statistics.median(latencies) * 1000:.1f} ms, "
+        f"p99 {percentile(latencies, 99) * 1000:.1f} ms, "
+        f"max {max(latencies) * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
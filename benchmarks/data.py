@@ -0,0 +1,185 @@
+"""Synthetic data generator of benchmarks.
+
+Generates related users, categories, tags, products, reviews and orders \
+    at configurable scale in bulk, then rebuilds Product ratings, search \
+    index and daily sales rollups, which bulk writes bypass.
+Every generated user has password `PASSWORD`.
+
+Usage
+-----
+- `python -m benchmarks.data --database db.sqlite3 [--scale 1]`
+"""
+
+import argparse
+import os
+import random
+
+WORDS = [
+    "red", "blue", "green", "black", "white", "wooden", "steel", "plastic",
+    "glass", "leather", "chair", "table", "lamp", "sofa", "desk", "shelf",
+    "bed", "rug", "mirror", "clock", "small", "large", "modern", "vintage",
+    "folding", "outdoor", "kitchen", "office", "garden", "kids",
+]  # fmt: skip
+PASSWORD = "password123"
+BATCH_SIZE = 1000
+
+
+def get_text(rng: random.Random, words: int) -> str:
+    """Gets synthetic text of random words with a rare serial word."""
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return f"{text} serial{rng.randrange(100000)}"
+
+
+def percentile(values: list, percent: float) -> float:
+    """Gets percentile of values by nearest rank."""
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def setup_django(database: str) -> None:
+    """Sets up Django with `benchmarks.settings` and migrates database."""
+    os.environ["DJANGO_SETTINGS_MODULE"] = "benchmarks.settings"
+    os.environ["BENCHMARK_DATABASE"] = database
+
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command("migrate", verbosity=0)
+
+
+def generate(
+    users: int = 100,
+    products: int = 1000,
+    reviews: int = 3,
+    orders: int = 2,
+    seed: int = 0,
+) -> None:
+    """Generates synthetic objects in bulk.
+
+    Parameters
+    ----------
+    - `users` number of users, each also a vendor
+    - `products` number of products, each with two tags
+    - `reviews` number of reviews per product, by distinct users
+    - `orders` number of orders per user, each of three products
+    """
+    from django.contrib.auth.hashers import make_password
+    from commerce.models import (
+        Category,
+        Order,
+        Order2Product,
+        Product,
+        Review,
+        Tag,
+    )
+    from commerce.ratings import rebuild_product_ratings
+    from commerce.sales import rebuild_product_sales
+    from commerce.search import get_search_backend
+    from common.models import User
+
+    rng = random.Random(seed)
+    password = make_password(PASSWORD)
+    created_users = User.objects.bulk_create(
+        (
+            User(username=f"user{index}", password=password)
+            for index in range(users)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    categories = Category.objects.bulk_create(
+        Category(title=f"category{index}") for index in range(20)
+    )
+    tags = Tag.objects.bulk_create(
+        Tag(title=f"tag{index}") for index in range(50)
+    )
+    created_products = Product.objects.bulk_create(
+        (
+            Product(
+                vendor=rng.choice(created_users),
+                category=rng.choice(categories),
+                title=get_text(rng, 3),
+                price=rng.randint(1, 1000),
+                description=get_text(rng, 20),
+            )
+            for _ in range(products)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    Product.tags.through.objects.bulk_create(
+        (
+            Product.tags.through(product=product, tag=tag)
+            for product in created_products
+            for tag in rng.sample(tags, 2)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    Review.objects.bulk_create(
+        (
+            Review(
+                reviewer=reviewer,
+                product=product,
+                rating=rng.randint(1, 10) / 2,
+                description=get_text(rng, 10),
+            )
+            for product in created_products
+            for reviewer in rng.sample(
+                created_users, min(reviews, len(created_users))
+            )
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    customers = [user for user in created_users for _ in range(orders)]
+    lines = [
+        [
+            (product, rng.randint(1, 3))
+            for product in rng.sample(
+                created_products, min(3, len(created_products))
+            )
+        ]
+        for _ in customers
+    ]
+    created_orders = Order.objects.bulk_create(
+        (
+            Order(
+                customer=customer,
+                total=sum(
+                    product.price * quantity
+                    for product, quantity in order_lines
+                ),
+            )
+            for customer, order_lines in zip(customers, lines)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    Order2Product.objects.bulk_create(
+        (
+            Order2Product(
+                order=order,
+                product=product,
+                quantity=quantity,
+                unit_price=product.price,
+            )
+            for order, order_lines in zip(created_orders, lines)
+            for product, quantity in order_lines
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    rebuild_product_ratings(Product.objects.all())
+    get_search_backend().rebuild()
+    rebuild_product_sales()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database", required=True)
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    setup_django(args.database)
+    generate(users=100 * args.scale, products=1000 * args.scale, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Product search benchmark.
+
+Compares `SQLiteFTS5SearchBackend` with `ContainsSearchBackend` on a \
+    temporary SQLite database seeded with synthetic products, measuring \
+    index build time and latency of ranked first pages of search results.
+
+Usage
+-----
+- `python -m benchmarks.product_search [--products 1000000] [--queries 50]`
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from benchmarks.data import WORDS, get_text, percentile
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "djarf.settings")
+
+
+def setup_database(directory: str, products: int, batch_size: int) -> None:
+    """Migrates temporary database and seeds synthetic products in bulk."""
+    from django.conf import settings
+
+    settings.DEBUG = False
+    settings.DATABASES["default"]["NAME"] = os.path.join(directory, "db")
+
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command("migrate", verbosity=0)
+
+    from django.db import transaction
+    from commerce.models import Category, Product
+    from common.models import User
+
+    rng = random.Random(0)
+    user = User.objects.create(username="vendor")
+    category = Category.objects.create(title="category")
+    with transaction.atomic():
+        for start in range(0, products, batch_size):
+            Product.objects.bulk_create(
+                Product(
+                    vendor=user,
+                    category=category,
+                    title=get_text(rng, 3),
+                    price=index,
+                    description=get_text(rng, 20),
+                )
+                for index in range(start, min(start + batch_size, products))
+            )
+
+
+def measure(backend, queries: list, page_size: int) -> list:
+    """Measures latency seconds of ranked first page of each query."""
+    from commerce.models import Product
+
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        _ = list(
+            backend.search(Product.objects.only("id", "title"), query)[
+                :page_size
+            ]
+        )
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=1000000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        setup_database(directory, args.products, args.batch_size)
+        seconds = time.perf_counter() - start
+        print(f"seeded {args.products} products in {seconds:.1f} s")
+
+        from django.conf import settings
+        from commerce.search import (
+            ContainsSearchBackend,
+            SQLiteFTS5SearchBackend,
+        )
+
+        start = time.perf_counter()
+        SQLiteFTS5SearchBackend().rebuild()
+        print(f"built index in {time.perf_counter() - start:.1f} s")
+
+        rng = random.Random(1)
+        workloads = {
+            "rare": [
+                f"serial{rng.randrange(100000)}" for _ in range(args.queries)
+            ],
+            "common": [
+                f"{rng.choice(WORDS)} {rng.choice(WORDS)}"
+                for _ in range(args.queries)
+            ],
+        }
+        page_size = settings.REST_FRAMEWORK["PAGE_SIZE"]
+        for backend in [SQLiteFTS5SearchBackend(), ContainsSearchBackend()]:
+            for workload, queries in workloads.items():
+                latencies = measure(backend, queries, page_size)
+                print(
+                    f"{type(backend).__name__} {workload}: "
+                    f"p50 {statistics.median(latencies) * 1000:.1f} ms, "
+                    f"p99 {percentile(latencies, 99) * 1000:.1f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""Settings of benchmarks, overriding `djarf.settings`.
+
+- `BENCHMARK_DATABASE` environment variable path of SQLite database
+- Production-like `DEBUG = False`, so queries are not recorded
+- Fast password hasher, so HTTP Basic authentication of every request does \
+    not dominate latencies
+"""
+
+import os
+from djarf.settings import *  # noqa: F401, F403
+from djarf.settings import DATABASES
+
+DEBUG = False
+ALLOWED_HOSTS = ["*"]
+DATABASES["default"]["NAME"] = os.environ["BENCHMARK_DATABASE"]
+DATABASES["default"]["OPTIONS"] = {"timeout": 30}
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
@@ -0,0 +1,69 @@
+"""Startup time benchmark.
+
+Measures wall time of `django.setup()` in fresh interpreters, the cost paid \
+    by every gunicorn worker boot and every `manage.py` command, and of \
+    discovering Pygments lexers and styles for comparison.
+
+Usage
+-----
+- `python -m benchmarks.startup [--runs 10]`
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SETUP = """
+import os, time
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "djarf.settings")
+start = time.perf_counter()
+import django
+django.setup()
+print(time.perf_counter() - start)
+"""
+
+PYGMENTS = """
+import time
+start = time.perf_counter()
+from pygments.lexers import get_all_lexers
+from pygments.styles import get_all_styles
+_ = [item for item in get_all_lexers() if item[1]]
+_ = list(get_all_styles())
+print(time.perf_counter() - start)
+"""
+
+
+def measure(code: str, runs: int) -> list:
+    """Measures seconds of code in fresh interpreters."""
+    return [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(runs)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for name, code in [
+        ("django.setup", SETUP),
+        ("pygments discovery", PYGMENTS),
+    ]:
+        seconds = measure(code, args.runs)
+        print(
+            f"{name}: median {statistics.median(seconds) * 1000:.1f} ms, "
+            f"min {min(seconds) * 1000:.1f} ms over {args.runs} runs"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+"""Load-test benchmark suite of the API.
+
+Generates synthetic data by `benchmarks.data` into a temporary SQLite \
+    database, starts a local server on it, and runs virtual users through \
+    scripted scenarios for a fixed duration, each virtual user a thread with \
+    its own account authenticated by HTTP Basic.
+Records throughput and latency percentiles per scenario and per request, \
+    and stores results as JSON named by time and commit for comparison.
+
+Scenarios
+---------
+- `browse` lists categories, lists products of a category, retrieves a \
+    product and searches products
+- `cart` adds a product to cart and lists cart
+- `checkout` adds two products to cart, creates order and lists orders
+- `review` retrieves a product and reviews it
+
+Usage
+-----
+- `python -m benchmarks.suite [--scale 1] [--users 8] [--duration 10] \
+    [--scenarios browse,cart,checkout,review] [--server runserver|daphne] \
+    [--output benchmarks/results] [--compare RESULTS_JSON]`
+"""
+
+import argparse
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from base64 import b64encode
+from datetime import datetime, timezone
+from http.client import HTTPConnection
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from benchmarks.data import PASSWORD, WORDS, generate, percentile, setup_django
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+PERCENTILES = [50, 90, 99]
+
+
+class Client:
+    """HTTP client of a virtual user, recording latency of every request.
+
+    Attributes
+    ----------
+    - `records` list of (scenario, request name, seconds, success)
+    - `products` ids of products to add to cart or review, in order, so \
+        unique constraints are never hit
+    """
+
+    def __init__(
+        self, host: str, port: int, username: str, products: List[int]
+    ):
+        self.host, self.port = host, port
+        credentials = b64encode(f"{username}:{PASSWORD}".encode()).decode()
+        self.headers = {
+            "Authorization": f"Basic {credentials}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        self.records: List[Tuple[str, str, float, bool]] = []
+        self.products = iter(products)
+        self.scenario = ""
+
+    def request(
+        self, name: str, method: str, path: str, data: Optional[dict] = None
+    ) -> Optional[dict]:
+        """Requests path, recording latency by request name."""
+        body = json.dumps(data) if data is not None else None
+        start = time.perf_counter()
+        connection = HTTPConnection(self.host, self.port, timeout=60)
+        try:
+            connection.request(method, path, body=body, headers=self.headers)
+            response = connection.getresponse()
+            content = response.read()
+            success = 200 <= response.status < 300
+        except OSError:
+            content, success = b"", False
+        finally:
+            connection.close()
+        self.records.append(
+            (self.scenario, name, time.perf_counter() - start, success)
+        )
+        return json.loads(content) if success and content else None
+
+    def next_product(self) -> int:
+        return next(self.products)
+
+
+def browse(client: Client, rng: random.Random, catalog: dict) -> None:
+    client.request("categories", "GET", "/commerce/categories/")
+    category = rng.choice(catalog["categories"])
+    client.request(
+        "products by category",
+        "GET",
+        f"/commerce/products/?category={category}",
+    )
+    product = rng.choice(catalog["products"])
+    client.request("product", "GET", f"/commerce/products/{product}/")
+    client.request(
+        "search",
+        "GET",
+        f"/commerce/products-search/?q={rng.choice(WORDS)}",
+    )
+
+
+def cart(client: Client, rng: random.Random, catalog: dict) -> None:
+    client.request(
+        "add to cart",
+        "POST",
+        "/commerce/carts/",
+        {"product": f"/commerce/products/{client.next_product()}/"},
+    )
+    client.request("cart", "GET", "/commerce/carts/")
+
+
+def checkout(client: Client, rng: random.Random, catalog: dict) -> None:
+    for _ in range(2):
+        client.request(
+            "add to cart",
+            "POST",
+            "/commerce/carts/",
+            {"product": f"/commerce/products/{client.next_product()}/"},
+        )
+    client.request("order", "POST", "/commerce/orders/", {})
+    client.request("orders", "GET", "/commerce/orders/")
+
+
+def review(client: Client, rng: random.Random, catalog: dict) -> None:
+    product = client.next_product()
+    client.request("product", "GET", f"/commerce/products/{product}/")
+    client.request(
+        "review",
+        "POST",
+        "/commerce/reviews/",
+        {
+            "product": f"/commerce/products/{product}/",
+            "rating": rng.randint(1, 10) / 2,
+            "description": " ".join(rng.choices(WORDS, k=10)),
+        },
+    )
+
+
+SCENARIOS: Dict[str, Callable[[Client, random.Random, dict], None]] = {
+    "browse": browse,
+    "cart": cart,
+    "checkout": checkout,
+    "review": review,
+}
+
+
+def setup_data(database: str, scale: int, users: int) -> dict:
+    """Generates data and virtual user accounts, returning the catalog."""
+    setup_django(database)
+    generate(users=100 * scale, products=1000 * scale)
+
+    from django.contrib.auth.hashers import make_password
+    from commerce.models import Category, Product
+    from common.models import User
+
+    password = make_password(PASSWORD)
+    User.objects.bulk_create(
+        User(username=f"bench{index}", password=password)
+        for index in range(users)
+    )
+    return {
+        "categories": list(Category.objects.values_list("id", flat=True)),
+        "products": list(Product.objects.values_list("id", flat=True)),
+    }
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(server: str, database: str, port: int) -> subprocess.Popen:
+    """Starts local server on database, waiting until it responds."""
+    if server == "daphne":
+        command = ["daphne", "-b", "127.0.0.1", "-p", str(port)]
+        command += ["djarf.asgi:application"]
+    else:
+        command = [sys.executable, "manage.py", "runserver", "--noreload"]
+        command += [f"127.0.0.1:{port}"]
+    env = dict(
+        os.environ,
+        DJANGO_SETTINGS_MODULE="benchmarks.settings",
+        BENCHMARK_DATABASE=database,
+    )
+    process = subprocess.Popen(
+        command,
+        cwd=BASE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            connection = HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/commerce/")
+            connection.getresponse().read()
+            connection.close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"{server} did not start on port {port}")
+
+
+def run(
+    port: int,
+    catalog: dict,
+    users: int,
+    duration: float,
+    scenarios: List[str],
+) -> Tuple[List[Tuple[str, str, float, bool]], float]:
+    """Runs virtual users through scenarios in turn for duration seconds."""
+    deadline = time.monotonic() + duration
+    clients = []
+    for index in range(users):
+        rng = random.Random(index)
+        products = list(catalog["products"])
+        rng.shuffle(products)
+        clients.append(Client("127.0.0.1", port, f"bench{index}", products))
+
+    def loop(index: int, client: Client) -> None:
+        rng = random.Random(index)
+        turn = index
+        while time.monotonic() < deadline:
+            client.scenario = scenarios[turn % len(scenarios)]
+            try:
+                SCENARIOS[client.scenario](client, rng, catalog)
+            except StopIteration:
+                return
+            turn += 1
+
+    threads = [
+        threading.Thread(target=loop, args=(index, client))
+        for index, client in enumerate(clients)
+    ]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+    return [record for client in clients for record in client.records], elapsed
+
+
+def summarize(
+    records: List[Tuple[str, str, float, bool]], elapsed: float
+) -> Dict[str, dict]:
+    """Summarizes records by scenario and by request name."""
+    groups: Dict[str, List[Tuple[float, bool]]] = {}
+    for scenario, name, seconds, success in records:
+        for key in ["total", f"scenario:{scenario}", f"request:{name}"]:
+            groups.setdefault(key, []).append((seconds, success))
+
+    summary = {}
+    for key, values in sorted(groups.items()):
+        latencies = [seconds * 1000 for seconds, _ in values]
+        summary[key] = {
+            "requests": len(values),
+            "errors": sum(1 for _, success in values if not success),
+            "throughput": round(len(values) / elapsed, 2),
+            "mean_ms": round(statistics.mean(latencies), 2),
+            **{
+                f"p{percent}_ms": round(percentile(latencies, percent), 2)
+                for percent in PERCENTILES
+            },
+        }
+    return summary
+
+
+def get_commit() -> Tuple[str, bool]:
+    """Gets current commit hash and whether the working tree is dirty."""
+
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=BASE_DIR, capture_output=True, text=True
+        ).stdout.strip()
+
+    return git("rev-parse", "HEAD") or "unknown", bool(
+        git("status", "--porcelain", "--untracked-files=no")
+    )
+
+
+def compare(summary: Dict[str, dict], baseline: Dict[str, dict]) -> None:
+    """Prints relative changes of throughput and percentiles to baseline."""
+    print(f"\n{'vs baseline':<32}{'throughput':>12}{'p50':>10}{'p99':>10}")
+    for key, values in summary.items():
+        if key not in baseline:
+            continue
+        changes = []
+        for metric in ["throughput", "p50_ms", "p99_ms"]:
+            before = baseline[key][metric]
+            change = (values[metric] - before) / before * 100 if before else 0
+            changes.append(f"{change:+.1f}%")
+        print(f"{key:<32}{changes[0]:>12}{changes[1]:>10}{changes[2]:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--users", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument(
+        "--server", choices=["runserver", "daphne"], default="runserver"
+    )
+    parser.add_argument(
+        "--output", default=str(BASE_DIR / "benchmarks" / "results")
+    )
+    parser.add_argument("--compare")
+    args = parser.parse_args()
+    scenarios = args.scenarios.split(",")
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, "db")
+        catalog = setup_data(database, args.scale, args.users)
+        port = get_free_port()
+        process = start_server(args.server, database, port)
+        try:
+            records, elapsed = run(
+                port, catalog, args.users, args.duration, scenarios
+            )
+        finally:
+            process.terminate()
+            process.wait()
+
+    summary = summarize(records, elapsed)
+    print(
+        f"{'':<32}{'requests':>10}{'errors':>8}{'req/s':>10}"
+        + "".join(f"{f'p{percent}':>10}" for percent in PERCENTILES)
+    )
+    for key, values in summary.items():
+        print(
+            f"{key:<32}{values['requests']:>10}{values['errors']:>8}"
+            f"{values['throughput']:>10}"
+            + "".join(
+                f"{values[f'p{percent}_ms']:>10}" for percent in PERCENTILES
+            )
+        )
+
+    commit, dirty = get_commit()
+    created = datetime.now(timezone.utc)
+    output = Path(args.output)
+    output.mkdir(parents=True, exist_ok=True)
+    path = output / f"{created:%Y%m%dT%H%M%S}-{commit[:7]}.json"
+    path.write_text(
+        json.dumps(
+            {
+                "commit": commit,
+                "dirty": dirty,
+                "created": created.isoformat(),
+                "args": vars(args),
+                "summary": summary,
+            },
+            indent=2,
+        )
+    )
+    print(f"\nStored results in {path}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())["summary"]
+        compare(summary, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,26 @@
 import json
-from channels.generic.websocket import WebsocketConsumer
+from channels.generic.websocket import AsyncWebsocketConsumer
 
 
-class ChatConsumer(WebsocketConsumer):
-    def connect(self) -> None:
-        self.accept()
+class ChatConsumer(AsyncWebsocketConsumer):
+    async def connect(self) -> None:
+        self.room_name = self.scope["url_route"]["kwargs"]["room_name"]
+        self.room_group_name = f"chat_{self.room_name}"
+        await self.channel_layer.group_add(
+            self.room_group_name, self.channel_name
+        )
+        await self.accept()
 
-    def disconnect(self, close_code: int) -> None:
-        pass
+    async def disconnect(self, close_code: int) -> None:
+        await self.channel_layer.group_discard(
+            self.room_group_name, self.channel_name
+        )
 
-    def receive(self, text_data: str) -> None:
+    async def receive(self, text_data: str) -> None:
         message = json.loads(text_data)["message"]
-        self.send(text_data=json.dumps({"message": message}))
+        await self.channel_layer.group_send(
+            self.room_group_name, {"type": "chat.message", "message": message}
+        )
+
+    async def chat_message(self, event: dict) -> None:
+        await self.send(text_data=json.dumps({"message": event["message"]}))
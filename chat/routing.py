@@ -1,6 +1,11 @@
 from django.urls import re_path
 from chat.consumers import ChatConsumer
 
+# Room names are restricted to characters and lengths valid in channel layer
+# group names, which are ASCII and shorter than 100 characters with prefix
 websocket_urlpatterns = [
-    re_path(r"ws/chat/(?P<room_name>\w+)/$", ChatConsumer.as_asgi()),
+    re_path(
+        r"ws/chat/(?P<room_name>[A-Za-z0-9_-]{1,90})/$",
+        ChatConsumer.as_asgi(),
+    ),
 ]
@@ -1,3 +1,56 @@
+from channels.layers import channel_layers
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
 from django.test import TestCase
+from chat.routing import websocket_urlpatterns
 
-# Create your tests here.
+APPLICATION = URLRouter(websocket_urlpatterns)
+
+
+class ChatConsumerTests(TestCase):
+    def setUp(self):
+        channel_layers.backends.clear()
+
+    async def connect(self, room_name: str) -> WebsocketCommunicator:
+        communicator = WebsocketCommunicator(
+            APPLICATION, f"/ws/chat/{room_name}/"
+        )
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        return communicator
+
+    async def test_receive_broadcasts_to_room(self):
+        sender = await self.connect("room")
+        receiver = await self.connect("room")
+        stranger = await self.connect("other")
+
+        await sender.send_json_to({"message": "hello"})
+
+        self.assertEqual(await sender.receive_json_from(), {"message": "hello"})
+        self.assertEqual(
+            await receiver.receive_json_from(), {"message": "hello"}
+        )
+        self.assertTrue(await stranger.receive_nothing())
+
+        for communicator in [sender, receiver, stranger]:
+            await communicator.disconnect()
+
+    async def test_disconnect_leaves_room(self):
+        sender = await self.connect("room")
+        receiver = await self.connect("room")
+        await receiver.disconnect()
+
+        await sender.send_json_to({"message": "hello"})
+
+        self.assertEqual(await sender.receive_json_from(), {"message": "hello"})
+        await sender.disconnect()
+
+    async def test_connect_rejects_invalid_room_name(self):
+        for room_name in ["r\u00f6om", "room.name", "r" * 91]:
+            communicator = WebsocketCommunicator(
+                APPLICATION, f"/ws/chat/{room_name}/"
+            )
+            with self.assertRaises(ValueError):
+                await communicator.connect()
+        communicator = await self.connect("r" * 90)
+        await communicator.disconnect()
@@ -0,0 +1,103 @@
+from typing import Type
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponseBase
+from django.views import View
+from rest_framework.request import Request
+from rest_framework.response import Response
+from commerce.views import (
+    CategoryViewSet,
+    ProductViewSet,
+    ReviewViewSet,
+    TagViewSet,
+)
+from common.mixins import ConditionalMixin, ResponseCacheMixin
+
+
+class AsyncReadOnlyView(View):
+    """Read-only view of a viewset served natively by ASGI.
+
+    Lists or retrieves objects with the authentication, permissions, filter \
+        backends, pagination, response cache and ETags of `viewset_class`, \
+        so responses are the same as of the sync viewset.
+    Only steps querying the database, i.e. authentication, fetching the \
+        page or the object and reading the response cache, run in a thread \
+        by `sync_to_async` like the Django async ORM, while serializing \
+        planned objects by `ConditionalMixin` runs on the event loop.
+
+    Attributes
+    ----------
+    - `viewset_class` viewset of `common.mixins.ConditionalMixin`, and \
+        optionally `common.mixins.ResponseCacheMixin`
+    """
+
+    http_method_names = ["get", "head", "options"]
+    viewset_class: Type[ConditionalMixin] = None
+
+    async def get(
+        self, request: HttpRequest, pk: int = None
+    ) -> HttpResponseBase:
+        action = "list" if pk is None else "retrieve"
+        kwargs = {} if pk is None else {"pk": pk}
+        viewset = self.viewset_class(
+            action_map={"get": action, "head": action}, args=(), kwargs=kwargs
+        )
+        request = viewset.initialize_request(request, **kwargs)
+        viewset.request = request
+        viewset.headers = viewset.default_response_headers
+        try:
+            await sync_to_async(viewset.initial)(request, **kwargs)
+            response = await self.get_cached_response(viewset, request)
+        except Exception as exc:
+            response = viewset.handle_exception(exc)
+        return viewset.finalize_response(request, response)
+
+    async def get_cached_response(
+        self, viewset: ConditionalMixin, request: Request
+    ) -> Response:
+        """Gets response from cache of `ResponseCacheMixin` or caching it."""
+        if not isinstance(viewset, ResponseCacheMixin):
+            return await self.get_response(viewset, request)
+        key = await sync_to_async(viewset.get_cache_key)(request)
+        if key is None:
+            return await self.get_response(viewset, request)
+        response = await sync_to_async(viewset.get_cache_hit)(request, key)
+        if response is None:
+            response = await self.get_response(viewset, request)
+            response = await sync_to_async(viewset.set_cache_miss)(
+                key, response
+            )
+        return response
+
+    async def get_response(
+        self, viewset: ConditionalMixin, request: Request
+    ) -> Response:
+        """Lists page of objects or retrieves object unless not modified."""
+        if viewset.action == "list":
+            objects, paginated = await sync_to_async(viewset.get_list_objects)()
+            return viewset.list_objects(request, objects, paginated)
+        instance = await sync_to_async(viewset.get_object)()
+        return viewset.retrieve_object(request, instance)
+
+
+class CategoryAsyncView(AsyncReadOnlyView):
+    """Category async read-only view."""
+
+    viewset_class = CategoryViewSet
+
+
+class ProductAsyncView(AsyncReadOnlyView):
+    """Product async read-only view."""
+
+    viewset_class = ProductViewSet
+
+
+class ReviewAsyncView(AsyncReadOnlyView):
+    """Review async read-only view."""
+
+    viewset_class = ReviewViewSet
+
+
+class TagAsyncView(AsyncReadOnlyView):
+    """Tag async read-only view."""
+
+    viewset_class = TagViewSet
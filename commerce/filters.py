@@ -0,0 +1,110 @@
+from typing import Dict, Tuple
+from django.db.models import QuerySet
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import (
+    CharField,
+    DateField,
+    DateTimeField,
+    Field,
+    IntegerField,
+)
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.request import Request
+from rest_framework.views import View
+from commerce.search import get_search_backend
+
+
+class QueryParamsFilter(BaseFilterBackend):
+    """Filter backend by query params validated by fields.
+
+    Attributes
+    ----------
+    - `params` lookup and field validating value of each query param
+    """
+
+    params: Dict[str, Tuple[str, Field]] = {}
+
+    def filter_queryset(
+        self, request: Request, queryset: QuerySet, view: View
+    ) -> QuerySet:
+        lookups, errors = {}, {}
+        for param, (lookup, field) in self.params.items():
+            if param not in request.query_params:
+                continue
+            try:
+                lookups[lookup] = field.run_validation(
+                    request.query_params[param]
+                )
+            except ValidationError as error:
+                errors[param] = error.detail
+        if errors:
+            raise ValidationError(errors)
+        return queryset.filter(**lookups)
+
+
+class ProductFilter(QueryParamsFilter):
+    """Product filter backend by query params.
+
+    Query Params
+    ------------
+    - `category` Category id
+    - `tag` Tag id
+    - `vendor` User id
+    - `price_min`, `price_max` inclusive price range
+    - `created_after`, `created_before` inclusive created range
+
+    Lookups are backed by indexes on `Product`, e.g. [`category`, `price`] \
+        and [`vendor`, `created`].
+    """
+
+    params = {
+        "category": ("category_id", IntegerField(min_value=1)),
+        "tag": ("tags__id", IntegerField(min_value=1)),
+        "vendor": ("vendor_id", IntegerField(min_value=1)),
+        "price_min": ("price__gte", IntegerField(min_value=0)),
+        "price_max": ("price__lte", IntegerField(min_value=0)),
+        "created_after": ("created__gte", DateTimeField()),
+        "created_before": ("created__lte", DateTimeField()),
+    }
+
+
+class ProductSalesFilter(QueryParamsFilter):
+    """Daily sales rollup of Product filter backend by query params.
+
+    Query Params
+    ------------
+    - `product` Product id
+    - `date_from`, `date_to` inclusive date range, e.g. `2026-10-01`
+
+    Lookups are backed by indexes on `ProductSales`, [`vendor`, `date`] and \
+        [`product`, `date`].
+    """
+
+    params = {
+        "product": ("product_id", IntegerField(min_value=1)),
+        "date_from": ("date__gte", DateField()),
+        "date_to": ("date__lte", DateField()),
+    }
+
+
+class ProductSearchFilter(BaseFilterBackend):
+    """Product full-text search filter backend by `q` query param.
+
+    Query Params
+    ------------
+    - `q` required search terms, all of which must match `title` or \
+        `description`
+
+    Products are filtered and ranked by `commerce.search.get_search_backend`.
+    """
+
+    field = CharField(max_length=200)
+
+    def filter_queryset(
+        self, request: Request, queryset: QuerySet, view: View
+    ) -> QuerySet:
+        try:
+            query = self.field.run_validation(request.query_params.get("q", ""))
+        except ValidationError as error:
+            raise ValidationError({"q": error.detail})
+        return get_search_backend().search(queryset, query)
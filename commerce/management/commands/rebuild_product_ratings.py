@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+from commerce.models import Product
+from commerce.ratings import rebuild_product_ratings
+
+
+class Command(BaseCommand):
+    help = "Rebuilds Product rating aggregates from Reviews in bulk."
+
+    def handle(self, *args, **options):
+        count = rebuild_product_ratings(Product.objects.all())
+        self.stdout.write(f"Rebuilt ratings of {count} products.")
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from commerce.sales import rebuild_product_sales
+
+
+class Command(BaseCommand):
+    help = "Rebuilds daily ProductSales rollups from Order2Products in bulk."
+
+    def handle(self, *args, **options):
+        count = rebuild_product_sales()
+        self.stdout.write(f"Rebuilt {count} daily product sales.")
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from commerce.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuilds Product search index, e.g. after bulk writes."
+
+    def handle(self, *args, **options):
+        get_search_backend().rebuild()
+        self.stdout.write("Rebuilt product search index.")
@@ -0,0 +1,68 @@
+# Generated by Django 4.2.30 on 2026-10-18 09:10
+
+from django.db import migrations, models
+from django.db.models import (
+    Avg,
+    Count,
+    FloatField,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce, Now
+
+
+def rebuild_ratings(apps, schema_editor):
+    """Rebuilds ratings of existing Products from their Reviews.
+
+    Historical models are updated in a single UPDATE inlined here, so later \
+        changes of `commerce.ratings` or models never break this migration.
+    """
+    Product = apps.get_model("commerce", "Product")
+    Review = apps.get_model("commerce", "Review")
+    reviews = (
+        Review.objects.filter(product=OuterRef("id"))
+        .order_by()
+        .values("product")
+    )
+
+    def aggregate(function) -> Coalesce:
+        return Coalesce(
+            Subquery(reviews.annotate(value=function).values("value")),
+            Value(0),
+            output_field=FloatField(),
+        )
+
+    Product.objects.update(
+        rating_sum=aggregate(Sum("rating")),
+        rating_count=aggregate(Count("id")),
+        rating_avg=aggregate(Avg("rating")),
+        updated=Now(),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("commerce", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="rating_avg",
+            field=models.FloatField(db_index=True, default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="rating_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="rating_sum",
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.RunPython(rebuild_ratings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-18 09:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("commerce", "0002_product_rating"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["category", "price"],
+                name="commerce_pr_categor_46fcbf_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["category", "created"],
+                name="commerce_pr_categor_7e12a5_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["vendor", "created"],
+                name="commerce_pr_vendor__15118e_idx",
+            ),
+        ),
+    ]
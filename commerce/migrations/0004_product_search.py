@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-18 10:02
+
+from django.db import migrations
+
+
+def create_product_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE commerce_product_fts "
+        "USING fts5(title, description)"
+    )
+    schema_editor.execute(
+        "INSERT INTO commerce_product_fts (rowid, title, description) "
+        "SELECT id, title, description FROM commerce_product"
+    )
+
+
+def drop_product_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute("DROP TABLE commerce_product_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("commerce", "0003_product_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_product_fts, drop_product_fts),
+    ]
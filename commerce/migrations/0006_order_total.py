@@ -0,0 +1,53 @@
+# Generated by Django 4.2.30 on 2026-10-18 10:31
+
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def snapshot_order_prices(apps, schema_editor):
+    """Snapshots current Product prices of existing Order2Products."""
+    Order = apps.get_model("commerce", "Order")
+    Order2Product = apps.get_model("commerce", "Order2Product")
+    Product = apps.get_model("commerce", "Product")
+
+    Order2Product.objects.update(
+        unit_price=Subquery(
+            Product.objects.filter(id=OuterRef("product_id")).values("price")
+        )
+    )
+    Order.objects.update(
+        total=Coalesce(
+            Subquery(
+                Order2Product.objects.filter(order_id=OuterRef("id"))
+                .order_by()
+                .values("order_id")
+                .annotate(total=Sum(F("quantity") * F("unit_price")))
+                .values("total")
+            ),
+            Value(0),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("commerce", "0005_product_stock"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="total",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="order2product",
+            name="unit_price",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(
+            snapshot_order_prices, migrations.RunPython.noop
+        ),
+    ]
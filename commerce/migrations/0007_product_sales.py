@@ -0,0 +1,66 @@
+# Generated by Django 4.2.30 on 2026-10-18 10:54
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("commerce", "0006_order_total"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductSales",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated", models.DateTimeField(auto_now=True, db_index=True)),
+                ("date", models.DateField()),
+                ("units", models.PositiveIntegerField(default=0)),
+                ("revenue", models.PositiveBigIntegerField(default=0)),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sales",
+                        to="commerce.product",
+                    ),
+                ),
+                (
+                    "vendor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="product_sales",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-date", "product"],
+                "get_latest_by": "date",
+                "indexes": [
+                    models.Index(
+                        fields=["vendor", "date"], name="commerce_pr_vendor__e3e341_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="productsales",
+            constraint=models.UniqueConstraint(
+                fields=("product", "date"), name="productsales_unique_product_date"
+            ),
+        ),
+    ]
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from common.models import AbstractModel
 
 
@@ -72,6 +72,8 @@ class Order(AbstractModel):
     Attributes
     ----------
     - `customer` ForeignKey to `common.User`
+    - `total` PositiveBigIntegerField default `0` editable `False`, sum of \
+        `quantity * unit_price` of Order2Products computed at checkout
 
     Meta
     ----
@@ -82,6 +84,7 @@ class Order(AbstractModel):
     customer = models.ForeignKey(
         "common.User", on_delete=models.CASCADE, related_name="orders"
     )
+    total = models.PositiveBigIntegerField(default=0, editable=False)
 
     def __str__(self):
         return ", ".join([str(self.customer), str(self.created)])
@@ -99,6 +102,8 @@ class Order2Product(AbstractModel):
     - `order` ForeignKey to `Order`
     - `product` ForeignKey to `Product`
     - `quantity` PositiveSmallIntegerField default `1`
+    - `unit_price` PositiveIntegerField default `0` editable `False`, \
+        `Product.price` at checkout
 
     Meta
     ----
@@ -116,6 +121,7 @@ class Order2Product(AbstractModel):
         "Product", on_delete=models.CASCADE, related_name="order2products"
     )
     quantity = models.PositiveSmallIntegerField(default=1)
+    unit_price = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return ", ".join([str(self.order), str(self.product)])
@@ -143,11 +149,19 @@ class Product(AbstractModel):
     - `title` CharField max_length `100`
     - `price` PositiveIntegerField db_index `True`
     - `description` TextField default `""` blank `True`
+    - `rating_avg` FloatField default `0` db_index `True` editable `False`
+    - `rating_count` PositiveIntegerField default `0` editable `False`
+    - `rating_sum` FloatField default `0` editable `False`
+    - `stock` PositiveIntegerField null `True` blank `True`, available \
+        quantity decremented at checkout by `commerce.stock`, `None` if not \
+        tracked
 
     Meta
     ----
     - get_latest_by `created`
     - ordering [`-created`]
+    - indexes [`category`, `price`], [`category`, `created`], \
+        [`vendor`, `created`]
     """
 
     vendor = models.ForeignKey(
@@ -160,13 +174,101 @@ class Product(AbstractModel):
     title = models.CharField(max_length=100)
     price = models.PositiveIntegerField(db_index=True)
     description = models.TextField(default="", blank=True)
+    rating_avg = models.FloatField(default=0, db_index=True, editable=False)
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_sum = models.FloatField(default=0, editable=False)
+    stock = models.PositiveIntegerField(null=True, blank=True)
 
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Loads Product remembering loaded stock to save only changes."""
+        product = super().from_db(db, field_names, values)
+        product._loaded_stock = product.__dict__.get("stock")
+        return product
+
+    def save(self, *args, **kwargs):
+        """Saves Product leaving ratings to be updated only by Reviews.
+
+        Ratings loaded before a concurrent Review update are never written \
+            back, and neither is stock loaded before a concurrent checkout \
+            unless it was changed.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and not field.name.startswith("rating_")
+                and not (
+                    field.name == "stock"
+                    and self.__dict__.get("stock")
+                    == getattr(self, "_loaded_stock", None)
+                )
+            ]
+        super().save(*args, **kwargs)
+        self._loaded_stock = self.__dict__.get("stock")
+
     class Meta:
         get_latest_by = "created"
         ordering = ["-created"]
+        indexes = [
+            models.Index(fields=["category", "price"]),
+            models.Index(fields=["category", "created"]),
+            models.Index(fields=["vendor", "created"]),
+        ]
+
+
+class ProductSales(AbstractModel):
+    """Daily sales rollup of Product model.
+
+    Maintained incrementally at checkout by `commerce.sales.record_sales` \
+        and on Order2Product deletion by `commerce.sales.remove_sales`, and \
+        rebuilt from Order2Products by `rebuild_product_sales` command.
+
+    Attributes
+    ----------
+    - `vendor` ForeignKey to `common.User`, vendor of `product`
+    - `product` ForeignKey to `Product`
+    - `date` DateField, local date of Order `created`
+    - `units` PositiveIntegerField default `0`, sum of `quantity`
+    - `revenue` PositiveBigIntegerField default `0`, sum of \
+        `quantity * unit_price`
+
+    Meta
+    ----
+    - get_latest_by `date`
+    - ordering [`-date`, `product`]
+    - indexes [`vendor`, `date`]
+    - constraints `productsales_unique_product_date` UniqueConstraint \
+        [`product`, `date`]
+    """
+
+    vendor = models.ForeignKey(
+        "common.User", on_delete=models.CASCADE, related_name="product_sales"
+    )
+    product = models.ForeignKey(
+        "Product", on_delete=models.CASCADE, related_name="sales"
+    )
+    date = models.DateField()
+    units = models.PositiveIntegerField(default=0)
+    revenue = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return ", ".join([str(self.product), str(self.date)])
+
+    class Meta:
+        get_latest_by = "date"
+        ordering = ["-date", "product"]
+        indexes = [models.Index(fields=["vendor", "date"])]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product", "date"],
+                name="productsales_unique_product_date",
+            )
+        ]
 
 
 class Review(AbstractModel):
@@ -204,6 +306,18 @@ class Review(AbstractModel):
             [str(self.reviewer), str(self.product), str(self.rating)]
         )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Loads Review remembering loaded values to update ratings."""
+        review = super().from_db(db, field_names, values)
+        review._loaded_values = dict(zip(field_names, values))
+        return review
+
+    def save(self, *args, **kwargs):
+        """Saves Review updating Product ratings in an atomic transaction."""
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     class Meta:
         get_latest_by = "created"
         ordering = ["-created"]
@@ -1,8 +1,8 @@
-from typing import Union
-from rest_framework.permissions import BasePermission, IsAdminUser, SAFE_METHODS
+from rest_framework.permissions import IsAdminUser, SAFE_METHODS
 from rest_framework.request import Request
 from rest_framework.views import View
-from commerce.models import Cart, Order, Order2Product, Product, Review
+from commerce.models import Order2Product
+from common.permissions import IsOwner
 
 
 class IsAdminUserOrReadOnly(IsAdminUser):
@@ -13,27 +13,24 @@ class IsAdminUserOrReadOnly(IsAdminUser):
         )
 
 
-class IsCustomer(BasePermission):
-    def has_object_permission(
-        self,
-        request: Request,
-        view: View,
-        object: Union[Cart, Order, Order2Product],
-    ) -> bool:
-        if isinstance(object, Order2Product):
-            return object.order.customer == request.user
-        return object.customer == request.user
+class IsCustomer(IsOwner):
+    """Permission of Cart, Order and Order2Product of the customer."""
 
+    def get_owner_field(self, model: type) -> str:
+        if issubclass(model, Order2Product):
+            return "order__customer_id"
+        return "customer_id"
 
-class IsReviewerOrReadOnly(BasePermission):
-    def has_object_permission(
-        self, request: Request, view: View, object: Review
-    ) -> bool:
-        return object.reviewer == request.user or request.method in SAFE_METHODS
 
+class IsReviewerOrReadOnly(IsOwner):
+    owner_field = "reviewer_id"
+    others_read_only = True
 
-class IsVendorOrReadOnly(BasePermission):
-    def has_object_permission(
-        self, request: Request, view: View, object: Product
-    ) -> bool:
-        return object.vendor == request.user or request.method in SAFE_METHODS
+
+class IsVendor(IsOwner):
+    owner_field = "vendor_id"
+
+
+class IsVendorOrReadOnly(IsOwner):
+    owner_field = "vendor_id"
+    others_read_only = True
@@ -0,0 +1,57 @@
+from django.db.models import (
+    Avg,
+    Count,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce, Now, NullIf
+from commerce.models import Product, Review
+
+
+def update_product_rating(product_id: int, rating: float, count: int) -> None:
+    """Adds rating and count to Product ratings in a single UPDATE."""
+    rating_sum = F("rating_sum") + rating
+    rating_count = F("rating_count") + count
+    Product.objects.filter(id=product_id).update(
+        rating_sum=rating_sum,
+        rating_count=rating_count,
+        rating_avg=Coalesce(
+            ExpressionWrapper(
+                rating_sum / NullIf(rating_count, 0), output_field=FloatField()
+            ),
+            Value(0.0),
+        ),
+        updated=Now(),
+    )
+
+
+def rebuild_product_ratings(products: QuerySet) -> int:
+    """Rebuilds ratings of products from Reviews in a single UPDATE.
+
+    Returns the number of rebuilt Products.
+    """
+    reviews = (
+        Review.objects.filter(product=OuterRef("id"))
+        .order_by()
+        .values("product")
+    )
+
+    def aggregate(function) -> Coalesce:
+        return Coalesce(
+            Subquery(reviews.annotate(value=function).values("value")),
+            Value(0),
+            output_field=FloatField(),
+        )
+
+    return products.order_by().update(
+        rating_sum=aggregate(Sum("rating")),
+        rating_count=aggregate(Count("id")),
+        rating_avg=aggregate(Avg("rating")),
+        updated=Now(),
+    )
@@ -0,0 +1,120 @@
+from typing import List
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q, QuerySet
+from django.utils.module_loading import import_string
+from commerce.models import Product
+
+FTS_TABLE = "commerce_product_fts"
+
+
+class SearchBackend:
+    """Product full-text search backend.
+
+    Methods
+    -------
+    - `search` filters and ranks queryset of Products by query
+    - `index` adds or updates Products in search index
+    - `remove` removes Product from search index
+    - `rebuild` rebuilds search index from every Product
+    """
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        raise NotImplementedError
+
+    def index(self, products: List[Product]) -> None:
+        pass
+
+    def remove(self, product_id: int) -> None:
+        pass
+
+    def rebuild(self) -> None:
+        pass
+
+
+class ContainsSearchBackend(SearchBackend):
+    """Search backend scanning `title` and `description` with `icontains`.
+
+    Needs no index, so it works with every database, e.g. for development.
+    """
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        for term in query.split():
+            queryset = queryset.filter(
+                Q(title__icontains=term) | Q(description__icontains=term)
+            )
+        return queryset
+
+
+class SQLiteFTS5SearchBackend(SearchBackend):
+    """Search backend by SQLite FTS5 inverted index of Products.
+
+    `commerce_product_fts` virtual table holds `title` and `description` of \
+        every Product by rowid, created by migration and kept in sync by \
+        Product signals.
+    Results are ranked by BM25 and every query term must match.
+    """
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        return queryset.extra(
+            tables=[FTS_TABLE],
+            where=[
+                f"{FTS_TABLE}.rowid = {Product._meta.db_table}.id",
+                f"{FTS_TABLE} MATCH %s",
+            ],
+            params=[self.get_match(query)],
+            select={"rank": f"{FTS_TABLE}.rank"},
+            order_by=["rank", "-id"],
+        )
+
+    def get_match(self, query: str) -> str:
+        """Gets FTS5 match expression of query terms as quoted strings.
+
+        Quoting escapes FTS5 query syntax, so any user input is valid.
+        """
+        return " ".join(
+            '"{}"'.format(term.replace('"', '""')) for term in query.split()
+        )
+
+    def index(self, products: List[Product]) -> None:
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid = %s",
+                [[product.id] for product in products],
+            )
+            cursor.executemany(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, description) "
+                "VALUES (%s, %s, %s)",
+                [
+                    [product.id, product.title, product.description]
+                    for product in products
+                ],
+            )
+
+    def remove(self, product_id: int) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [product_id]
+            )
+
+    def rebuild(self) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, description) "
+                f"SELECT id, title, description FROM {Product._meta.db_table}"
+            )
+
+
+def get_search_backend() -> SearchBackend:
+    """Gets search backend of `COMMERCE_SEARCH_BACKEND` dotted path.
+
+    Defaults to `SQLiteFTS5SearchBackend` on SQLite, and to \
+        `ContainsSearchBackend` on other databases.
+    """
+    path = getattr(settings, "COMMERCE_SEARCH_BACKEND", None)
+    if path:
+        return import_string(path)()
+    if connection.vendor == "sqlite":
+        return SQLiteFTS5SearchBackend()
+    return ContainsSearchBackend()
@@ -1,4 +1,9 @@
+from functools import partial
+from typing import List
 from django.db import transaction
+from django.db.models import F
+from django.utils.timezone import localdate
+from rest_framework.exceptions import ValidationError
 from rest_framework.serializers import HyperlinkedModelSerializer, IntegerField
 from commerce.models import (
     Cart,
@@ -6,29 +11,59 @@ from commerce.models import (
     Order,
     Order2Product,
     Product,
+    ProductSales,
     Review,
     Tag,
 )
+from commerce.sales import record_sales
+from commerce.search import get_search_backend
+from commerce.stock import OutOfStock, get_out_of_stock, reserve_stock
+from common.cache import invalidate_responses
 from common.models import User
+from common.serializers import (
+    BulkHyperlinkedRelatedField,
+    BulkListSerializer,
+    SparseFieldsetMixin,
+)
+
+
+class CountField(IntegerField):
+    """Read-only count of related objects.
+
+    Reads the count annotated on the instance by the viewset queryset, \
+        counting the related objects only when it is not annotated, e.g. \
+        right after creation.
+    """
+
+    def __init__(self, relation: str, **kwargs):
+        self.relation = relation
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
 
+    def get_attribute(self, instance) -> int:
+        try:
+            return getattr(instance, self.source)
+        except AttributeError:
+            return getattr(instance, self.relation).count()
 
-class UserSerializer(HyperlinkedModelSerializer):
+
+class UserSerializer(SparseFieldsetMixin, HyperlinkedModelSerializer):
     """User serializer.
 
     Fields
     ------
     - `carts` read_only `True`
-    - `orders_count` IntegerField source `orders.count` read_only `True`
+    - `orders_count` CountField relation `orders` read_only `True`
     - `orders` read_only `True`
-    - `products_count` IntegerField source `products.count` read_only `True`
+    - `products_count` CountField relation `products` read_only `True`
     - `products` read_only `True`
-    - `reviews_count` IntegerField source `reviews.count` read_only `True`
+    - `reviews_count` CountField relation `reviews` read_only `True`
     - `reviews` read_only `True`
     """
 
-    orders_count = IntegerField(source="orders.count", read_only=True)
-    products_count = IntegerField(source="products.count", read_only=True)
-    reviews_count = IntegerField(source="reviews.count", read_only=True)
+    orders_count = CountField("orders")
+    products_count = CountField("products")
+    reviews_count = CountField("reviews")
 
     class Meta:
         model = User
@@ -59,7 +94,7 @@ class UserSerializer(HyperlinkedModelSerializer):
         ref_name = "CommerceUser"  # drf-yasg
 
 
-class CartAdminSerializer(HyperlinkedModelSerializer):
+class CartAdminSerializer(SparseFieldsetMixin, HyperlinkedModelSerializer):
     """Cart serializer for admin.
 
     Fields
@@ -69,6 +104,8 @@ class CartAdminSerializer(HyperlinkedModelSerializer):
     - `quantity`
     """
 
+    serializer_related_field = BulkHyperlinkedRelatedField
+
     class Meta:
         model = Cart
         fields = [
@@ -81,6 +118,7 @@ class CartAdminSerializer(HyperlinkedModelSerializer):
             "quantity",
         ]
         read_only_fields = ["created", "updated"]
+        list_serializer_class = BulkListSerializer
 
 
 class CartSerializer(CartAdminSerializer):
@@ -105,6 +143,7 @@ class CartSerializer(CartAdminSerializer):
             "quantity",
         ]
         read_only_fields = ["created", "updated", "customer"]
+        list_serializer_class = BulkListSerializer
 
     def create(self, validated_data: dict) -> Cart:
         """Creates Cart with request user as customer."""
@@ -114,17 +153,17 @@ class CartSerializer(CartAdminSerializer):
         return cart
 
 
-class CategorySerializer(HyperlinkedModelSerializer):
+class CategorySerializer(SparseFieldsetMixin, HyperlinkedModelSerializer):
     """Category serializer.
 
     Fields
     ------
     - `title`
-    - `products_count` IntegerField source `products.count` read_only `True`
+    - `products_count` CountField relation `products` read_only `True`
     - `products` read_only `True`
     """
 
-    products_count = IntegerField(source="products.count", read_only=True)
+    products_count = CountField("products")
 
     class Meta:
         model = Category
@@ -140,12 +179,13 @@ class CategorySerializer(HyperlinkedModelSerializer):
         read_only_fields = ["created", "updated", "products_count", "products"]
 
 
-class OrderAdminSerializer(HyperlinkedModelSerializer):
+class OrderAdminSerializer(SparseFieldsetMixin, HyperlinkedModelSerializer):
     """Order serializer for admin.
 
     Fields
     ------
     - `customer`
+    - `total` read_only `True`
     - `order2products` read_only `True`
     """
 
@@ -157,24 +197,82 @@ class OrderAdminSerializer(HyperlinkedModelSerializer):
             "created",
             "updated",
             "customer",
+            "total",
             "order2products",
         ]
-        read_only_fields = ["created", "updated", "order2products"]
+        read_only_fields = ["created", "updated", "total", "order2products"]
 
     def create(self, validated_data: dict) -> Order:
         """Creates Order creating Order2Products and deleting Cart.
 
         Creates Order from customer creating Order2Products from Cart items of \
             customer and deleting Cart, in an atomic transaction.
+        Cart items are locked while checking out, so concurrent checkouts of \
+            the same customer never order the same items twice.
+        Order2Products snapshot `Product.price` as `unit_price` and Order \
+            stores their `total`, so order history never joins Products.
+        Daily ProductSales rollups of vendors are incremented by \
+            `commerce.sales.record_sales`.
+        Stock of every Cart item is reserved by `commerce.stock.reserve_stock` \
+            in a single conditional UPDATE, and nothing is ordered if any is \
+            out of stock.
+        Order is inserted first, so that SQLite takes its write lock before \
+            any read and waits on concurrent checkouts rather than failing.
+        Only cached responses read from Order2Products, or from Products if \
+            any of their stock is tracked, are invalidated on commit.
         """
-        with transaction.atomic():
-            order = super().create(validated_data)
-            customer: User = validated_data["customer"]
-            for cart in customer.carts.all():
-                Order2Product.objects.create(
-                    order=order, product=cart.product, quantity=cart.quantity
+        customer: User = validated_data["customer"]
+        try:
+            with transaction.atomic():
+                order = super().create(validated_data)
+                carts = list(
+                    Cart.objects.select_for_update()
+                    .filter(customer=customer)
+                    .annotate(
+                        unit_price=F("product__price"),
+                        vendor_id=F("product__vendor_id"),
+                        stock=F("product__stock"),
+                    )
+                    .only("id", "product_id", "quantity")
+                )
+                reserve_stock(
+                    {cart.product_id: cart.quantity for cart in carts}
+                )
+                order2products = Order2Product.objects.bulk_create(
+                    [
+                        Order2Product(
+                            order=order,
+                            product_id=cart.product_id,
+                            quantity=cart.quantity,
+                            unit_price=cart.unit_price,
+                        )
+                        for cart in carts
+                    ]
+                )
+                record_sales(
+                    localdate(order.created),
+                    order2products,
+                    {cart.product_id: cart.vendor_id for cart in carts},
                 )
-                cart.delete()
+                order.total = sum(
+                    cart.quantity * cart.unit_price for cart in carts
+                )
+                if order.total:
+                    order.save(update_fields=["total"])
+                Cart.objects.filter(id__in=[cart.id for cart in carts]).delete()
+                changed = [Order2Product]
+                if any(cart.stock is not None for cart in carts):
+                    changed.append(Product)
+                transaction.on_commit(partial(invalidate_responses, *changed))
+        except OutOfStock as error:
+            raise ValidationError(
+                {
+                    "stock": [
+                        f"Product {product_id} is out of stock."
+                        for product_id in get_out_of_stock(error.quantities)
+                    ]
+                }
+            )
         return order
 
 
@@ -184,6 +282,7 @@ class OrderSerializer(OrderAdminSerializer):
     Fields
     ------
     - `customer` read_only `True`
+    - `total` read_only `True`
     - `order2products` read_only `True`
     """
 
@@ -195,9 +294,16 @@ class OrderSerializer(OrderAdminSerializer):
             "created",
             "updated",
             "customer",
+            "total",
+            "order2products",
+        ]
+        read_only_fields = [
+            "created",
+            "updated",
+            "customer",
+            "total",
             "order2products",
         ]
-        read_only_fields = ["created", "updated", "customer", "order2products"]
 
     def create(self, validated_data: dict) -> Order:
         """Creates Order creating Order2Products and deleting Cart.
@@ -210,7 +316,7 @@ class OrderSerializer(OrderAdminSerializer):
         return super().create(validated_data)
 
 
-class Order2ProductSerializer(HyperlinkedModelSerializer):
+class Order2ProductSerializer(SparseFieldsetMixin, HyperlinkedModelSerializer):
     """Order to Product quantity relationships serializer.
 
     Fields
@@ -218,6 +324,7 @@ class Order2ProductSerializer(HyperlinkedModelSerializer):
     - `order`
     - `product`
     - `quantity`
+    - `unit_price` read_only `True`
     """
 
     class Meta:
@@ -230,11 +337,38 @@ class Order2ProductSerializer(HyperlinkedModelSerializer):
             "order",
             "product",
             "quantity",
+            "unit_price",
         ]
-        read_only_fields = ["created", "updated"]
+        read_only_fields = ["created", "updated", "unit_price"]
 
 
-class ProductAdminSerializer(HyperlinkedModelSerializer):
+class ProductListSerializer(BulkListSerializer):
+    """Product list serializer writing Products in bulk.
+
+    Indexes written Products for search and invalidates cached responses, \
+        which Product signals do for single writes.
+    """
+
+    def create(self, validated_data: List[dict]) -> List[Product]:
+        products = super().create(validated_data)
+        self.on_bulk_write(products)
+        return products
+
+    def bulk_update(
+        self, instances: List[Product], validated_data: List[dict]
+    ) -> List[Product]:
+        products = super().bulk_update(instances, validated_data)
+        self.on_bulk_write(products)
+        return products
+
+    def on_bulk_write(self, products: List[Product]) -> None:
+        get_search_backend().index(products)
+        transaction.on_commit(
+            partial(invalidate_responses, Product, Product.tags.through)
+        )
+
+
+class ProductAdminSerializer(SparseFieldsetMixin, HyperlinkedModelSerializer):
     """Product serializer for admin.
 
     Fields
@@ -245,10 +379,15 @@ class ProductAdminSerializer(HyperlinkedModelSerializer):
     - `title`
     - `price`
     - `description`
+    - `stock`
+    - `rating_avg` read_only `True`
+    - `rating_count` read_only `True`
     - `order2products` read_only `True`
     - `reviews` read_only `True`
     """
 
+    serializer_related_field = BulkHyperlinkedRelatedField
+
     class Meta:
         model = Product
         fields = [
@@ -262,10 +401,21 @@ class ProductAdminSerializer(HyperlinkedModelSerializer):
             "title",
             "price",
             "description",
+            "stock",
+            "rating_avg",
+            "rating_count",
+            "order2products",
+            "reviews",
+        ]
+        read_only_fields = [
+            "created",
+            "updated",
+            "rating_avg",
+            "rating_count",
             "order2products",
             "reviews",
         ]
-        read_only_fields = ["created", "updated", "order2products", "reviews"]
+        list_serializer_class = ProductListSerializer
 
 
 class ProductSerializer(ProductAdminSerializer):
@@ -279,6 +429,9 @@ class ProductSerializer(ProductAdminSerializer):
     - `title`
     - `price`
     - `description`
+    - `stock`
+    - `rating_avg` read_only `True`
+    - `rating_count` read_only `True`
     - `order2products` read_only `True`
     - `reviews` read_only `True`
     """
@@ -296,6 +449,9 @@ class ProductSerializer(ProductAdminSerializer):
             "title",
             "price",
             "description",
+            "stock",
+            "rating_avg",
+            "rating_count",
             "order2products",
             "reviews",
         ]
@@ -303,9 +459,12 @@ class ProductSerializer(ProductAdminSerializer):
             "created",
             "updated",
             "vendor",
+            "rating_avg",
+            "rating_count",
             "order2products",
             "reviews",
         ]
+        list_serializer_class = ProductListSerializer
 
     def create(self, validated_data: dict) -> Product:
         """Creates Product with request user as vendor."""
@@ -315,7 +474,24 @@ class ProductSerializer(ProductAdminSerializer):
         return product
 
 
-class ReviewAdminSerializer(HyperlinkedModelSerializer):
+class ProductSalesSerializer(SparseFieldsetMixin, HyperlinkedModelSerializer):
+    """Daily sales rollup of Product serializer.
+
+    Fields
+    ------
+    - `product` read_only `True`
+    - `date` read_only `True`
+    - `units` read_only `True`
+    - `revenue` read_only `True`
+    """
+
+    class Meta:
+        model = ProductSales
+        fields = ["id", "updated", "product", "date", "units", "revenue"]
+        read_only_fields = fields
+
+
+class ReviewAdminSerializer(SparseFieldsetMixin, HyperlinkedModelSerializer):
     """Review serializer for admin.
 
     Fields
@@ -374,17 +550,17 @@ class ReviewSerializer(ReviewAdminSerializer):
         return review
 
 
-class TagSerializer(HyperlinkedModelSerializer):
+class TagSerializer(SparseFieldsetMixin, HyperlinkedModelSerializer):
     """Tag serializer.
 
     Fields
     ------
     - `title`
-    - `products_count` IntegerField source `products.count` read_only `True`
+    - `products_count` CountField relation `products` read_only `True`
     - `products` read_only `True`
     """
 
-    products_count = IntegerField(source="products.count", read_only=True)
+    products_count = CountField("products")
 
     class Meta:
         model = Tag
@@ -0,0 +1,102 @@
+from functools import partial
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils.timezone import localdate
+from commerce.models import (
+    Category,
+    Order,
+    Order2Product,
+    Product,
+    Review,
+    Tag,
+)
+from commerce.ratings import rebuild_product_ratings, update_product_rating
+from commerce.sales import remove_sales
+from commerce.search import get_search_backend
+from common.cache import invalidate_responses
+
+
+@receiver(post_save, sender=Review, dispatch_uid="update_rating_post_save")
+def update_rating_post_save(
+    sender, instance: Review, created: bool, **kwargs
+) -> None:
+    """Updates Product ratings by created or updated Review."""
+    loaded_values = getattr(instance, "_loaded_values", {})
+    if created:
+        update_product_rating(instance.product_id, instance.rating, 1)
+    elif {"product_id", "rating"} <= loaded_values.keys():
+        update_product_rating(
+            loaded_values["product_id"], -loaded_values["rating"], -1
+        )
+        update_product_rating(instance.product_id, instance.rating, 1)
+    else:
+        rebuild_product_ratings(Product.objects.filter(id=instance.product_id))
+    instance._loaded_values = {
+        "product_id": instance.product_id,
+        "rating": instance.rating,
+    }
+
+
+@receiver(post_save, sender=Product, dispatch_uid="index_product_post_save")
+def index_product_post_save(sender, instance: Product, **kwargs) -> None:
+    """Indexes created or updated Product for search."""
+    get_search_backend().index([instance])
+
+
+@receiver(post_delete, sender=Product, dispatch_uid="index_product_post_delete")
+def index_product_post_delete(sender, instance: Product, **kwargs) -> None:
+    """Removes deleted Product from search index."""
+    get_search_backend().remove(instance.id)
+
+
+@receiver(post_delete, sender=Review, dispatch_uid="update_rating_post_delete")
+def update_rating_post_delete(sender, instance: Review, **kwargs) -> None:
+    """Updates Product ratings by deleted Review."""
+    update_product_rating(instance.product_id, -instance.rating, -1)
+
+
+@receiver(
+    post_delete, sender=Order2Product, dispatch_uid="remove_sales_post_delete"
+)
+def remove_sales_post_delete(sender, instance: Order2Product, **kwargs) -> None:
+    """Subtracts deleted Order2Product from ProductSales rollups.
+
+    Order2Products are deleted before their Order when it cascades, so the \
+        date of the rollup is still read from Order `created`.
+    """
+    created = (
+        Order.objects.filter(id=instance.order_id)
+        .values_list("created", flat=True)
+        .first()
+    )
+    if created is not None:
+        remove_sales(localdate(created), [instance])
+
+
+def invalidate_responses_on_commit(sender, **kwargs) -> None:
+    """Invalidates cached responses read from sender once writes commit.
+
+    Invalidating inside the transaction would let concurrent readers cache \
+        responses of data not committed yet, which would never be invalidated.
+    """
+    transaction.on_commit(partial(invalidate_responses, sender))
+
+
+for sender in [Category, Order2Product, Product, Review, Tag]:
+    post_save.connect(
+        invalidate_responses_on_commit,
+        sender=sender,
+        dispatch_uid=f"invalidate_responses_post_save_{sender.__name__}",
+    )
+    post_delete.connect(
+        invalidate_responses_on_commit,
+        sender=sender,
+        dispatch_uid=f"invalidate_responses_post_delete_{sender.__name__}",
+    )
+
+m2m_changed.connect(
+    invalidate_responses_on_commit,
+    sender=Product.tags.through,
+    dispatch_uid="invalidate_responses_m2m_changed_Product_tags",
+)
@@ -0,0 +1,69 @@
+from typing import Dict, List
+from django.db.models import (
+    Case,
+    F,
+    PositiveIntegerField,
+    Q,
+    QuerySet,
+    Value,
+    When,
+)
+from django.db.models.functions import Now
+from commerce.models import Product
+
+
+def get_quantities(quantities: Dict[int, int]) -> Case:
+    """Gets quantity of each Product by id as a CASE expression."""
+    return Case(
+        *[
+            When(id=product_id, then=Value(quantity))
+            for product_id, quantity in quantities.items()
+        ],
+        output_field=PositiveIntegerField(),
+    )
+
+
+class OutOfStock(Exception):
+    """Raised when Products of quantities by id are not all in stock."""
+
+    def __init__(self, quantities: Dict[int, int]):
+        super().__init__(quantities)
+        self.quantities = quantities
+
+
+def get_available(quantities: Dict[int, int]) -> QuerySet:
+    """Gets Products of quantities by id which have the quantity in stock.
+
+    Products of untracked stock are always available.
+    """
+    return Product.objects.filter(
+        Q(stock__isnull=True) | Q(stock__gte=get_quantities(quantities)),
+        id__in=list(quantities),
+    ).order_by()
+
+
+def reserve_stock(quantities: Dict[int, int]) -> None:
+    """Reserves quantities of Products by id in a single conditional UPDATE.
+
+    Stock is decremented only where `stock >= quantity`, without reading it \
+        first, so concurrent checkouts never oversell.
+    Raises `OutOfStock` if any Product is out of stock, after which the \
+        enclosing transaction must be rolled back, since the others are \
+        decremented.
+    """
+    if not quantities:
+        return
+    reserved = get_available(quantities).update(
+        stock=F("stock") - get_quantities(quantities),
+        updated=Case(
+            When(stock__isnull=True, then=F("updated")), default=Now()
+        ),
+    )
+    if reserved < len(quantities):
+        raise OutOfStock(quantities)
+
+
+def get_out_of_stock(quantities: Dict[int, int]) -> List[int]:
+    """Gets ids of Products of quantities by id which are out of stock."""
+    available = get_available(quantities).values_list("id", flat=True)
+    return sorted(set(quantities) - set(available))
@@ -2,6 +2,9 @@ from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
+    HTTP_403_FORBIDDEN,
+    HTTP_404_NOT_FOUND,
 )
 from rest_framework.test import APITestCase
 from commerce.models import Cart, Category, Product
@@ -50,6 +53,33 @@ class CartTests(APITestCase):
         self.assertEqual(response.status_code, HTTP_200_OK)
         self.assertEqual(response.data["quantity"], 1)
 
+    def test_retrieve_cart_of_others(self):
+        other = User.objects.create(username="other")
+        cart = Cart.objects.create(
+            customer=other, product=Product.objects.last()
+        )
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                f"/commerce/carts/{cart.id}/", data=None, format="json"
+            )
+
+        self.assertEqual(response.status_code, HTTP_404_NOT_FOUND)
+
+    def test_list_cart_as_admin(self):
+        admin = User.objects.create(username="admin", is_staff=True)
+        _ = Cart.objects.create(customer=admin, product=Product.objects.last())
+        self.client.force_authenticate(user=admin)
+
+        response = self.client.get("/commerce/carts/", data=None, format="json")
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+
+        response = self.client.get(
+            "/commerce/carts/1/", data=None, format="json"
+        )
+        self.assertEqual(response.status_code, HTTP_404_NOT_FOUND)
+
     def test_update_cart(self):
         response = self.client.put(
             "/commerce/carts/1/",
@@ -71,3 +101,53 @@ class CartTests(APITestCase):
 
         self.assertEqual(response.status_code, HTTP_204_NO_CONTENT)
         self.assertEqual(Cart.objects.all().count(), 0)
+
+    def test_bulk_cart_anonymous(self):
+        self.client.force_authenticate(user=None)
+
+        response = self.client.post(
+            "/commerce/carts/bulk/",
+            data=[{"product": "/commerce/products/2/", "quantity": 3}],
+            format="json",
+        )
+        self.assertEqual(response.status_code, HTTP_403_FORBIDDEN)
+        self.assertEqual(Cart.objects.all().count(), 1)
+
+    def test_bulk_cart(self):
+        response = self.client.post(
+            "/commerce/carts/bulk/",
+            data=[{"product": "/commerce/products/2/", "quantity": 3}],
+            format="json",
+        )
+        self.assertEqual(response.status_code, HTTP_201_CREATED)
+        self.assertEqual(response.data[0]["quantity"], 3)
+        self.assertEqual(
+            response.data[0]["customer"], "http://testserver/common/users/1/"
+        )
+
+        response = self.client.post(
+            "/commerce/carts/bulk/",
+            data=[{"product": "/commerce/products/1/"}],
+            format="json",
+        )
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+        self.assertEqual(Cart.objects.all().count(), 2)
+
+        response = self.client.patch(
+            "/commerce/carts/bulk/",
+            data=[{"id": 1, "quantity": 5}, {"id": 2, "quantity": 6}],
+            format="json",
+        )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(
+            list(
+                Cart.objects.order_by("id").values_list("quantity", flat=True)
+            ),
+            [5, 6],
+        )
+
+        response = self.client.delete(
+            "/commerce/carts/bulk/", data={"ids": [1, 2]}, format="json"
+        )
+        self.assertEqual(response.status_code, HTTP_204_NO_CONTENT)
+        self.assertEqual(Cart.objects.all().count(), 0)
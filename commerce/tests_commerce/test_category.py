@@ -2,14 +2,17 @@ from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_304_NOT_MODIFIED,
 )
 from rest_framework.test import APITestCase
-from commerce.models import Category
+from commerce.models import Category, Product
+from common.cache import get_response_cache
 from common.models import User
 
 
 class CategoryTests(APITestCase):
     def setUp(self):
+        get_response_cache().clear()
         user = User.objects.create(is_staff=True)
         self.client.force_authenticate(user=user)
 
@@ -23,6 +26,63 @@ class CategoryTests(APITestCase):
         self.assertEqual(response.status_code, HTTP_200_OK)
         self.assertEqual(response.data["count"], 1)
 
+    def test_list_category_cache(self):
+        response = self.client.get(
+            "/commerce/categories/", data=None, format="json"
+        )
+        self.assertEqual(response["X-Cache"], "MISS")
+
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                "/commerce/categories/", data=None, format="json"
+            )
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(response.data["count"], 1)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                "/commerce/categories/",
+                data=None,
+                format="json",
+                HTTP_IF_NONE_MATCH=response["ETag"],
+            )
+        self.assertEqual(response.status_code, HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["X-Cache"], "HIT")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            _ = Category.objects.create(title="category_created")
+            response = self.client.get(
+                "/commerce/categories/", data=None, format="json"
+            )
+            self.assertEqual(response["X-Cache"], "HIT")
+
+        response = self.client.get(
+            "/commerce/categories/", data=None, format="json"
+        )
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["count"], 2)
+
+    def test_list_category_not_modified(self):
+        paths = ["/commerce/categories/", "/commerce/categories/1/"]
+        etags = {
+            path: self.client.get(path, data=None, format="json")["ETag"]
+            for path in paths
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            _ = Product.objects.create(
+                vendor=User.objects.get(),
+                category=Category.objects.get(),
+                title="product",
+                price=1,
+            )
+        for path in paths:
+            response = self.client.get(
+                path, data=None, format="json", HTTP_IF_NONE_MATCH=etags[path]
+            )
+            self.assertEqual(response.status_code, HTTP_200_OK, path)
+            self.assertNotEqual(response["ETag"], etags[path])
+
     def test_create_category(self):
         response = self.client.post(
             "/commerce/categories/",
@@ -31,6 +91,7 @@ class CategoryTests(APITestCase):
         )
 
         self.assertEqual(response.status_code, HTTP_201_CREATED)
+        self.assertEqual(response.data["products_count"], 0)
         self.assertEqual(Category.objects.all().count(), 2)
 
     def test_retrieve_category(self):
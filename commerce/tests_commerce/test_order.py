@@ -1,11 +1,20 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Tuple
+from django.db import connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
 )
-from rest_framework.test import APITestCase
+from rest_framework.test import APIClient, APITestCase
 from commerce.models import Cart, Category, Order, Order2Product, Product
+from common.cache import get_response_cache
 from common.models import User
+from common.tests_common.utils import FileDatabaseMixin
 
 
 class OrderTests(APITestCase):
@@ -50,6 +59,133 @@ class OrderTests(APITestCase):
         self.assertEqual(Order.objects.all().count(), 2)
         self.assertEqual(Order2Product.objects.all().count(), 4)
         self.assertEqual(Cart.objects.all().count(), 0)
+        self.assertEqual(response.data["total"], 2 * 1 + 3 * 2)
+
+    def test_create_order_price_snapshot(self):
+        response = self.client.post(
+            "/commerce/orders/", data=None, format="json"
+        )
+        Product.objects.update(price=100)
+
+        order = Order.objects.get(id=response.data["id"])
+        self.assertEqual(order.total, 8)
+        self.assertEqual(
+            sorted(order.order2products.values_list("unit_price", flat=True)),
+            [1, 2],
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                "/commerce/orders/", data=None, format="json"
+            )
+        self.assertEqual(response.data["results"][0]["total"], 8)
+        self.assertFalse(
+            any(
+                "commerce_product" in query["sql"]
+                for query in context.captured_queries
+            )
+        )
+
+    def test_create_order_stock(self):
+        Product.objects.filter(title="product1").update(stock=2)
+        Product.objects.filter(title="product2").update(stock=10)
+
+        response = self.client.post(
+            "/commerce/orders/", data=None, format="json"
+        )
+
+        self.assertEqual(response.status_code, HTTP_201_CREATED)
+        self.assertEqual(
+            list(
+                Product.objects.order_by("id").values_list("stock", flat=True)
+            ),
+            [0, 7],
+        )
+
+    def test_create_order_out_of_stock(self):
+        Product.objects.filter(title="product1").update(stock=1)
+        Product.objects.filter(title="product2").update(stock=10)
+
+        response = self.client.post(
+            "/commerce/orders/", data=None, format="json"
+        )
+
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["stock"], ["Product 1 is out of stock."])
+        self.assertEqual(
+            list(
+                Product.objects.order_by("id").values_list("stock", flat=True)
+            ),
+            [1, 10],
+        )
+        self.assertEqual(Order.objects.all().count(), 1)
+        self.assertEqual(Cart.objects.all().count(), 2)
+
+    def test_create_order_cache(self):
+        get_response_cache().clear()
+        paths = ["/commerce/categories/", "/commerce/tags/"]
+        for path in paths:
+            response = self.client.get(path, data=None, format="json")
+            self.assertEqual(response["X-Cache"], "MISS")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/commerce/orders/", data=None, format="json"
+            )
+        self.assertEqual(response.status_code, HTTP_201_CREATED)
+
+        for path in paths:
+            response = self.client.get(path, data=None, format="json")
+            self.assertEqual(response["X-Cache"], "HIT", path)
+
+        user2 = User.objects.get(username="user2")
+        product = Product.objects.get(title="product1")
+        _ = Cart.objects.create(customer=user2, product=product, quantity=1)
+        Product.objects.filter(id=product.id).update(stock=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/commerce/orders/", data=None, format="json"
+            )
+        self.assertEqual(response.status_code, HTTP_201_CREATED)
+
+        for path in paths:
+            response = self.client.get(path, data=None, format="json")
+            self.assertEqual(response["X-Cache"], "MISS", path)
+
+    def test_create_order_query_count(self):
+        user1 = User.objects.get(username="user1")
+        for product in Product.objects.all():
+            _ = Cart.objects.create(customer=user1, product=product)
+        self.client.force_authenticate(user=user1)
+        with CaptureQueriesContext(connection) as small:
+            response = self.client.post(
+                "/commerce/orders/", data=None, format="json"
+            )
+        self.assertEqual(response.status_code, HTTP_201_CREATED)
+
+        user2 = User.objects.get(username="user2")
+        category = Category.objects.get()
+        for index in range(3, 11):
+            product = Product.objects.create(
+                vendor=user2,
+                category=category,
+                title=f"product{index}",
+                price=1,
+            )
+            _ = Cart.objects.create(customer=user2, product=product)
+        self.client.force_authenticate(user=user2)
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.post(
+                "/commerce/orders/", data=None, format="json"
+            )
+
+        self.assertEqual(response.status_code, HTTP_201_CREATED)
+        self.assertEqual(Order2Product.objects.all().count(), 14)
+        self.assertEqual(Cart.objects.all().count(), 0)
+        self.assertEqual(
+            len(large.captured_queries), len(small.captured_queries)
+        )
+        self.assertLess(len(large.captured_queries), 12)
 
     def test_retrieve_order(self):
         response = self.client.get(
@@ -68,3 +204,52 @@ class OrderTests(APITestCase):
 
         self.assertEqual(response.status_code, HTTP_204_NO_CONTENT)
         self.assertEqual(Order.objects.all().count(), 0)
+
+
+class OrderConcurrencyTests(FileDatabaseMixin, TransactionTestCase):
+    """Concurrent checkouts of a hot Product on a SQLite file database."""
+
+    customers, stock = 16, 5
+
+    def setUp(self):
+        vendor = User.objects.create(username="vendor")
+        self.product = Product.objects.create(
+            vendor=vendor,
+            category=Category.objects.create(title="category"),
+            title="product",
+            price=1,
+            stock=self.stock,
+        )
+        self.users = [
+            User.objects.create(username=f"customer{index}")
+            for index in range(self.customers)
+        ]
+        for user in self.users:
+            _ = Cart.objects.create(customer=user, product=self.product)
+
+    def check_out(self, user: User) -> Tuple[int, float]:
+        client = APIClient()
+        client.force_authenticate(user=user)
+        start = perf_counter()
+        try:
+            response = client.post("/commerce/orders/", data=None)
+            return response.status_code, perf_counter() - start
+        finally:
+            connection.close()
+
+    def test_create_order_concurrently(self):
+        with ThreadPoolExecutor(max_workers=self.customers) as executor:
+            results = list(executor.map(self.check_out, self.users))
+
+        statuses = [status for status, _ in results]
+        self.assertEqual(statuses.count(HTTP_201_CREATED), self.stock)
+        self.assertEqual(
+            statuses.count(HTTP_400_BAD_REQUEST), self.customers - self.stock
+        )
+        self.assertLess(max(seconds for _, seconds in results), 5)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.stock, 0)
+        self.assertEqual(Order2Product.objects.all().count(), self.stock)
+        self.assertEqual(
+            Cart.objects.all().count(), self.customers - self.stock
+        )
@@ -1,7 +1,21 @@
-from rest_framework.status import HTTP_200_OK
+import json
+from typing import Tuple
+from unittest.mock import patch
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.http import HttpResponseBase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_400_BAD_REQUEST,
+    HTTP_403_FORBIDDEN,
+    HTTP_404_NOT_FOUND,
+)
 from rest_framework.test import APITestCase
 from commerce.models import Category, Order, Order2Product, Product
+from commerce.views import Order2ProductAdminViewSet
 from common.models import User
+from common.tests_common.utils import get_unbounded_queries
 
 
 class Order2ProductTests(APITestCase):
@@ -24,7 +38,33 @@ class Order2ProductTests(APITestCase):
         )
 
         self.assertEqual(response.status_code, HTTP_200_OK)
-        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_list_order2product_admin_cursor(self):
+        user = User.objects.get()
+        user.is_staff = True
+        user.save()
+        self.client.force_authenticate(user=user)
+        product = Product.objects.get()
+        Order2Product.objects.bulk_create(
+            Order2Product(
+                order=Order.objects.create(customer=user), product=product
+            )
+            for _ in range(24)
+        )
+
+        url, ids = "/commerce/order2products-admin/", []
+        while url:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url, data=None, format="json")
+            self.assertEqual(response.status_code, HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            self.assertEqual(
+                get_unbounded_queries(context.captured_queries), []
+            )
+            ids.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(sorted(ids), list(range(1, 26)))
 
     def test_retrieve_order2product(self):
         response = self.client.get(
@@ -33,3 +73,99 @@ class Order2ProductTests(APITestCase):
 
         self.assertEqual(response.status_code, HTTP_200_OK)
         self.assertEqual(response.data["quantity"], 1)
+
+    def test_retrieve_order2product_of_others(self):
+        other = User.objects.create(username="other")
+        order2product = Order2Product.objects.create(
+            order=Order.objects.create(customer=other),
+            product=Product.objects.get(),
+        )
+
+        response = self.client.get(
+            f"/commerce/order2products/{order2product.id}/",
+            data=None,
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, HTTP_404_NOT_FOUND)
+
+    def test_export_order2product(self):
+        response = self.client.get(
+            "/commerce/order2products-admin/export/jsonl/", data=None
+        )
+        self.assertEqual(response.status_code, HTTP_403_FORBIDDEN)
+
+        admin = User.objects.create(username="admin", is_staff=True)
+        self.client.force_authenticate(user=admin)
+        order = Order.objects.get()
+        for index in range(2, 6):
+            product = Product.objects.create(
+                vendor=admin,
+                category=Category.objects.get(),
+                title=f"product{index}",
+                price=index,
+            )
+            _ = Order2Product.objects.create(
+                order=order, product=product, quantity=index
+            )
+
+        response = self.client.get(
+            "/commerce/order2products-admin/export/jsonl/", data=None
+        )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(
+            sorted(row["quantity"] for row in rows), [1, 2, 3, 4, 5]
+        )
+
+        response = self.client.get(
+            "/commerce/order2products-admin/export/csv/",
+            data={"fields": "id,quantity"},
+        )
+        self.assertEqual(response["Content-Type"], "text/csv")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], "id,quantity")
+        self.assertEqual(len(lines), 6)
+
+        response = self.client.get(
+            "/commerce/order2products-admin/export/csv/",
+            data={"fields": "id,nope"},
+        )
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+
+    def test_export_order2product_asgi(self):
+        admin = User.objects.create(username="admin", is_staff=True)
+        self.async_client.force_login(admin)
+        for index in range(2, 4):
+            product = Product.objects.create(
+                vendor=admin,
+                category=Category.objects.get(),
+                title=f"product{index}",
+                price=index,
+            )
+            _ = Order2Product.objects.create(
+                order=Order.objects.get(), product=product, quantity=index
+            )
+
+        async def export() -> Tuple[HttpResponseBase, bytes]:
+            response = await self.async_client.get(
+                "/commerce/order2products-admin/export/jsonl/"
+            )
+            content = [chunk async for chunk in response.streaming_content]
+            return response, b"".join(content)
+
+        with patch.object(Order2ProductAdminViewSet, "export_chunk_size", 1):
+            response, content = async_to_sync(export)()
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertTrue(response.is_async)
+        self.assertEqual(
+            sorted(
+                json.loads(line)["quantity"] for line in content.splitlines()
+            ),
+            [1, 2, 3],
+        )
@@ -1,11 +1,31 @@
+from typing import Dict
+from unittest.mock import patch
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_403_FORBIDDEN,
 )
 from rest_framework.test import APITestCase
-from commerce.models import Category, Product, Tag
+from commerce.models import (
+    Category,
+    Order,
+    Order2Product,
+    Product,
+    Review,
+    Tag,
+)
+from common.cache import get_response_cache
 from common.models import User
+from common.tests_common.utils import get_unbounded_queries
 
 
 class ProductTests(APITestCase):
@@ -25,7 +45,181 @@ class ProductTests(APITestCase):
         )
 
         self.assertEqual(response.status_code, HTTP_200_OK)
-        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_list_product_query_count(self):
+        def count_queries() -> int:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(
+                    "/commerce/products/", data=None, format="json"
+                )
+            self.assertEqual(response.status_code, HTTP_200_OK)
+            return len(context.captured_queries)
+
+        user = User.objects.get()
+        category = Category.objects.get()
+        tag = Tag.objects.get()
+        Product.objects.get().tags.add(tag)
+        queries_count = count_queries()
+
+        for index in range(2, 11):
+            product = Product.objects.create(
+                vendor=user, category=category, title=f"product{index}", price=1
+            )
+            product.tags.add(tag)
+            _ = Review.objects.create(reviewer=user, product=product, rating=1)
+
+        self.assertEqual(count_queries(), queries_count)
+
+    def test_list_product_cursor(self):
+        user = User.objects.get()
+        category = Category.objects.get()
+        Product.objects.bulk_create(
+            Product(vendor=user, category=category, title="product", price=1)
+            for _ in range(24)
+        )
+
+        for url in [
+            "/commerce/products/",
+            "/commerce/products/?ordering=price",
+        ]:
+            ids = []
+            while url:
+                with CaptureQueriesContext(connection) as context:
+                    response = self.client.get(url, data=None, format="json")
+                self.assertEqual(response.status_code, HTTP_200_OK)
+                self.assertNotIn("count", response.data)
+                self.assertEqual(
+                    get_unbounded_queries(context.captured_queries), []
+                )
+                ids.extend(
+                    product["id"] for product in response.data["results"]
+                )
+                url = response.data["next"]
+
+            self.assertEqual(len(ids), 25)
+            self.assertEqual(len(set(ids)), 25)
+            self.assertTrue(
+                any(
+                    '"commerce_product"."id" DESC LIMIT' in query["sql"]
+                    for query in context.captured_queries
+                )
+            )
+
+    async def test_list_product_async(self):
+        get_response_cache().clear()
+        response = await self.async_client.get("/commerce/async/products/")
+        sync_response = await self.async_client.get("/commerce/products/1/")
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 1)
+        self.assertIsNone(response.json()["next"])
+        self.assertNotIn("count", response.json())
+        self.assertEqual(response["X-Cache"], "MISS")
+
+        response = await self.async_client.get("/commerce/async/products/1/")
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(response.json(), sync_response.json())
+
+        response = await self.async_client.get(
+            "/commerce/async/products/1/",
+            headers={"If-None-Match": response["ETag"]},
+        )
+        self.assertEqual(response.status_code, HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_list_product_async_contract(self):
+        user = User.objects.get()
+        category = Category.objects.create(title="category2")
+        for index, price in enumerate([5, 3, 4], 2):
+            _ = Product.objects.create(
+                vendor=user,
+                category=category,
+                title=f"product{index}",
+                price=price,
+            )
+        self.client.force_authenticate(user=None)
+
+        for query in [
+            f"?category={category.id}&ordering=price",
+            "?price_min=4&ordering=-price",
+            "?price_min=abc",
+            "?cursor=abc",
+        ]:
+            with self.subTest(query=query):
+                get_response_cache().clear()
+                sync_response = self.client.get(f"/commerce/products/{query}")
+                get_response_cache().clear()
+                response = async_to_sync(self.async_client.get)(
+                    f"/commerce/async/products/{query}"
+                )
+
+                self.assertEqual(
+                    response.status_code, sync_response.status_code
+                )
+                self.assertEqual(response["Content-Type"], "application/json")
+                data, sync_data = response.json(), sync_response.json()
+                if response.status_code == HTTP_200_OK:
+                    data, sync_data = data["results"], sync_data["results"]
+                self.assertEqual(data, sync_data)
+
+    def test_list_product_filter(self):
+        user = User.objects.get()
+        category = Category.objects.create(title="category2")
+        tag = Tag.objects.get()
+        for price in [2, 3, 4]:
+            product = Product.objects.create(
+                vendor=user, category=category, title="product", price=price
+            )
+            product.tags.add(tag)
+
+        response = self.client.get(
+            "/commerce/products/",
+            data={
+                "category": category.id,
+                "tag": tag.id,
+                "vendor": user.id,
+                "price_min": 3,
+                "ordering": "price",
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(
+            [product["price"] for product in response.data["results"]], [3, 4]
+        )
+
+        response = self.client.get(
+            "/commerce/products/",
+            data={"price_min": "cheap", "created_after": "yesterday"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            set(response.data.keys()), {"price_min", "created_after"}
+        )
+
+    def test_list_product_filter_index(self):
+        indexes = {
+            tuple(index.fields): index.name for index in Product._meta.indexes
+        }
+        category = Category.objects.get()
+        user = User.objects.get()
+
+        plan = Product.objects.filter(
+            category=category, price__gte=1, price__lte=2
+        ).explain()
+        self.assertIn(indexes[("category", "price")], plan)
+
+        plan = (
+            Product.objects.filter(vendor=user, created__gte=now())
+            .order_by("-created")
+            .explain()
+        )
+        self.assertIn(indexes[("vendor", "created")], plan)
 
     def test_create_product(self):
         response = self.client.post(
@@ -51,6 +245,94 @@ class ProductTests(APITestCase):
         self.assertEqual(response.status_code, HTTP_200_OK)
         self.assertEqual(response.data["price"], 1)
 
+    def test_product_cache_miss_query_count(self):
+        def count_queries() -> Dict[str, int]:
+            get_response_cache().clear()
+            counts = {}
+            for path in ["/commerce/products/", "/commerce/products/1/"]:
+                with CaptureQueriesContext(connection) as context:
+                    response = self.client.get(path, data=None, format="json")
+                self.assertEqual(response.status_code, HTTP_200_OK)
+                self.assertEqual(response["X-Cache"], "MISS")
+                counts[path] = len(context.captured_queries)
+            return counts
+
+        self.client.force_authenticate(user=None)
+        queries_counts = count_queries()
+
+        user = User.objects.get()
+        category = Category.objects.get()
+        for index in range(2, 22):
+            customer = User.objects.create(username=f"customer{index}")
+            order = Order.objects.create(customer=customer)
+            product = Product.objects.create(
+                vendor=user, category=category, title=f"product{index}", price=1
+            )
+            for ordered in [Product.objects.get(id=1), product]:
+                _ = Order2Product.objects.create(order=order, product=ordered)
+                _ = Review.objects.create(
+                    reviewer=customer, product=ordered, rating=1
+                )
+        self.assertEqual(count_queries(), queries_counts)
+
+    def test_retrieve_product_not_modified(self):
+        response = self.client.get(
+            "/commerce/products/1/", data=None, format="json"
+        )
+        etag = response["ETag"]
+
+        response = self.client.get(
+            "/commerce/products/1/",
+            data=None,
+            format="json",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(
+            "/commerce/products/",
+            data=None,
+            format="json",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+
+        Product.objects.filter(id=1).update(price=2, updated=now())
+        response = self.client.get(
+            "/commerce/products/1/",
+            data=None,
+            format="json",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_retrieve_product_not_modified_related(self):
+        product = Product.objects.get()
+        user = User.objects.create(username="customer")
+        writes = [
+            lambda: product.tags.add(Tag.objects.get()),
+            lambda: Order2Product.objects.create(
+                order=Order.objects.create(customer=user), product=product
+            ),
+            lambda: Review.objects.create(
+                reviewer=user, product=product, rating=1
+            ),
+            lambda: product.tags.clear(),
+        ]
+        for write in writes:
+            etag = self.client.get(
+                "/commerce/products/1/", data=None, format="json"
+            )["ETag"]
+            write()
+            response = self.client.get(
+                "/commerce/products/1/",
+                data=None,
+                format="json",
+                HTTP_IF_NONE_MATCH=etag,
+            )
+            self.assertEqual(response.status_code, HTTP_200_OK)
+
     def test_update_product(self):
         response = self.client.put(
             "/commerce/products/1/",
@@ -77,3 +359,342 @@ class ProductTests(APITestCase):
 
         self.assertEqual(response.status_code, HTTP_204_NO_CONTENT)
         self.assertEqual(Product.objects.all().count(), 0)
+
+    def test_search_product(self):
+        user = User.objects.get()
+        category = Category.objects.get()
+        _ = Product.objects.create(
+            vendor=user,
+            category=category,
+            title="red chair",
+            price=1,
+            description="wooden chair, red chair",
+        )
+        _ = Product.objects.create(
+            vendor=user,
+            category=category,
+            title="blue chair",
+            price=1,
+            description="plastic",
+        )
+        table = Product.objects.create(
+            vendor=user, category=category, title="red table", price=1
+        )
+
+        response = self.client.get(
+            "/commerce/products-search/", data={"q": "chair"}, format="json"
+        )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(response.data["results"][0]["title"], "red chair")
+
+        response = self.client.get(
+            "/commerce/products-search/", data={"q": "red"}, format="json"
+        )
+        self.assertEqual(
+            {product["title"] for product in response.data["results"]},
+            {"red chair", "red table"},
+        )
+
+        table.title = "oak table"
+        table.save()
+        response = self.client.get(
+            "/commerce/products-search/", data={"q": "red"}, format="json"
+        )
+        self.assertEqual(response.data["count"], 1)
+
+        table.delete()
+        response = self.client.get(
+            "/commerce/products-search/", data={"q": "oak"}, format="json"
+        )
+        self.assertEqual(response.data["count"], 0)
+
+    def test_search_product_query(self):
+        response = self.client.get(
+            "/commerce/products-search/", data=None, format="json"
+        )
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+        self.assertIn("q", response.data)
+
+        response = self.client.get(
+            "/commerce/products-search/",
+            data={"q": 'product1" OR "*'},
+            format="json",
+        )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(response.data["count"], 0)
+
+    def test_bulk_create_product(self):
+        data = [
+            {
+                "category": "/commerce/categories/1/",
+                "tags": ["/commerce/tags/1/"],
+                "title": f"chair{index}",
+                "price": index,
+            }
+            for index in range(20)
+        ]
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                "/commerce/products/bulk/", data=data, format="json"
+            )
+        self.assertEqual(response.status_code, HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 20)
+        self.assertEqual(
+            response.data[0]["tags"], ["http://testserver/commerce/tags/1/"]
+        )
+        self.assertEqual(Product.objects.filter(vendor_id=1).count(), 21)
+        self.assertEqual(Product.tags.through.objects.count(), 20)
+        inserts = [
+            query
+            for query in context.captured_queries
+            if query["sql"].startswith("INSERT")
+        ]
+        self.assertLess(len(inserts), 10)
+
+        response = self.client.get(
+            "/commerce/products-search/", data={"q": "chair7"}, format="json"
+        )
+        self.assertEqual(response.data["count"], 1)
+
+    def test_bulk_create_product_query_count(self):
+        def count_queries(size: int) -> int:
+            data = [
+                {
+                    "category": "/commerce/categories/1/",
+                    "tags": ["/commerce/tags/1/", "/commerce/tags/2/"],
+                    "title": f"chair{index}",
+                    "price": index,
+                }
+                for index in range(size)
+            ]
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(
+                    "/commerce/products/bulk/", data=data, format="json"
+                )
+            self.assertEqual(response.status_code, HTTP_201_CREATED)
+            return len(context.captured_queries)
+
+        _ = Tag.objects.create(title="tag2")
+        self.assertEqual(count_queries(5), count_queries(50))
+
+    def test_bulk_create_product_without_returning(self):
+        with patch.object(
+            type(connection.features), "can_return_rows_from_bulk_insert", False
+        ):
+            response = self.client.post(
+                "/commerce/products/bulk/",
+                data=[
+                    {
+                        "category": "/commerce/categories/1/",
+                        "tags": ["/commerce/tags/1/"],
+                        "title": f"chair{index}",
+                        "price": index,
+                    }
+                    for index in range(3)
+                ],
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, HTTP_201_CREATED)
+        self.assertEqual([item["id"] for item in response.data], [2, 3, 4])
+        self.assertEqual(Product.tags.through.objects.count(), 3)
+
+    def test_bulk_product_anonymous(self):
+        self.client.force_authenticate(user=None)
+
+        response = self.client.post(
+            "/commerce/products/bulk/",
+            data=[
+                {
+                    "category": "/commerce/categories/1/",
+                    "title": "chair",
+                    "price": 1,
+                }
+            ],
+            format="json",
+        )
+        self.assertEqual(response.status_code, HTTP_403_FORBIDDEN)
+        self.assertEqual(Product.objects.count(), 1)
+
+    def test_bulk_create_product_errors(self):
+        response = self.client.post(
+            "/commerce/products/bulk/",
+            data=[
+                {
+                    "category": "/commerce/categories/1/",
+                    "title": "a",
+                    "price": 1,
+                },
+                {"category": "/commerce/categories/1/", "title": "b"},
+            ],
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn("price", response.data[1])
+        self.assertEqual(Product.objects.all().count(), 1)
+
+    def test_bulk_update_product(self):
+        product = Product.objects.create(
+            vendor=User.objects.get(),
+            category=Category.objects.get(),
+            title="product2",
+            price=2,
+        )
+
+        response = self.client.patch(
+            "/commerce/products/bulk/",
+            data=[
+                {"id": product.id, "price": 20, "tags": ["/commerce/tags/1/"]},
+                {"id": 1, "title": "renamed"},
+            ],
+            format="json",
+        )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(response.data[0]["price"], 20)
+        self.assertEqual(response.data[1]["title"], "renamed")
+        self.assertEqual(product.tags.count(), 1)
+
+        response = self.client.patch(
+            "/commerce/products/bulk/",
+            data=[{"id": 1, "price": "free"}, {"id": 99, "price": 1}],
+            format="json",
+        )
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+        self.assertIn("price", response.data[0])
+        self.assertIn("id", response.data[1])
+
+    def test_bulk_destroy_product(self):
+        other = User.objects.create(username="other")
+        product = Product.objects.create(
+            vendor=other, category=Category.objects.get(), title="p", price=1
+        )
+
+        response = self.client.delete(
+            "/commerce/products/bulk/",
+            data={"ids": [1, product.id]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["ids"], {1: ["Not found."]})
+        self.assertEqual(Product.objects.all().count(), 2)
+
+        response = self.client.delete(
+            "/commerce/products/bulk/", data={"ids": [1, 99]}, format="json"
+        )
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+        self.assertIn(1, response.data["ids"])
+
+        response = self.client.delete(
+            "/commerce/products/bulk/", data={"ids": [1]}, format="json"
+        )
+        self.assertEqual(response.status_code, HTTP_204_NO_CONTENT)
+        self.assertEqual(Product.objects.all().count(), 1)
+
+    def test_list_product_sparse_fieldset(self):
+        user = User.objects.get()
+        product = Product.objects.get()
+        for index in range(3):
+            reviewer = User.objects.create(username=f"reviewer{index}")
+            _ = Review.objects.create(
+                reviewer=reviewer, product=product, rating=1
+            )
+
+        with CaptureQueriesContext(connection) as full:
+            response = self.client.get(
+                "/commerce/products/", data=None, format="json"
+            )
+        self.assertEqual(len(response.data["results"][0]["reviews"]), 3)
+
+        with CaptureQueriesContext(connection) as sparse:
+            response = self.client.get(
+                "/commerce/products/",
+                data={"omit": "reviews,order2products,tags"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertNotIn("reviews", response.data["results"][0])
+        self.assertIn("title", response.data["results"][0])
+        self.assertEqual(len(sparse), len(full) - 3)
+
+        response = self.client.get(
+            "/commerce/products/1/", data={"fields": "id,title"}, format="json"
+        )
+        self.assertEqual(response.data, {"id": 1, "title": "product1"})
+
+        response = self.client.get(
+            "/commerce/products/", data={"cap": 2}, format="json"
+        )
+        self.assertEqual(len(response.data["results"][0]["reviews"]), 2)
+        self.assertEqual(response.data["results"][0]["rating_count"], 3)
+
+        response = self.client.get(
+            "/commerce/products/", data={"cap": -1}, format="json"
+        )
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+
+        for params in [{"fields": "id,nope"}, {"omit": "nope"}]:
+            for path in ["/commerce/products/", "/commerce/products/1/"]:
+                response = self.client.get(path, data=params, format="json")
+                self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+                self.assertEqual(
+                    response.data, {list(params)[0]: ["Unknown field: nope."]}
+                )
+
+        response = self.client.patch(
+            f"/commerce/products/{product.id}/?fields=id",
+            data={"price": 3},
+            format="json",
+        )
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(response.data["price"], 3)
+        self.assertEqual(user.products.get().price, 3)
+
+
+class ProductRatingMigrationTests(TransactionTestCase):
+    """Backfill of Product ratings by historical models of migrations."""
+
+    def test_migrate_product_rating(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate([("commerce", "0001_initial")])
+        apps = executor.loader.project_state(
+            [("commerce", "0001_initial")]
+        ).apps
+        User = apps.get_model("common", "User")
+        user = User.objects.create()
+        category = apps.get_model("commerce", "Category").objects.create(
+            title="category"
+        )
+        Product = apps.get_model("commerce", "Product")
+        product = Product.objects.create(
+            vendor=user, category=category, title="product", price=1
+        )
+        _ = Product.objects.create(
+            vendor=user, category=category, title="unrated", price=1
+        )
+        for index, rating in enumerate([1, 4]):
+            _ = apps.get_model("commerce", "Review").objects.create(
+                reviewer=User.objects.create(username=f"reviewer{index}"),
+                product=product,
+                rating=rating,
+            )
+
+        executor = MigrationExecutor(connection)
+        executor.migrate([("commerce", "0002_product_rating")])
+        apps = executor.loader.project_state(
+            [("commerce", "0002_product_rating")]
+        ).apps
+        self.assertEqual(
+            list(
+                apps.get_model("commerce", "Product")
+                .objects.order_by("id")
+                .values_list("rating_sum", "rating_count", "rating_avg")
+            ),
+            [(5, 2, 2.5), (0, 0, 0)],
+        )
+
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
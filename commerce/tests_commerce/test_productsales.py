@@ -0,0 +1,122 @@
+from io import StringIO
+from django.core.management import call_command
+from django.utils.timezone import localdate
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
+    HTTP_403_FORBIDDEN,
+)
+from rest_framework.test import APITestCase
+from commerce.models import Cart, Category, Order, Product, ProductSales
+from common.models import User
+
+
+class ProductSalesTests(APITestCase):
+    def setUp(self):
+        self.vendor = User.objects.create(username="vendor")
+        category = Category.objects.create(title="category")
+        product1 = Product.objects.create(
+            vendor=self.vendor, category=category, title="product1", price=3
+        )
+        product2 = Product.objects.create(
+            vendor=self.vendor, category=category, title="product2", price=5
+        )
+
+        for index, quantity in enumerate([1, 2]):
+            customer = User.objects.create(username=f"customer{index}")
+            _ = Cart.objects.create(
+                customer=customer, product=product1, quantity=quantity
+            )
+            _ = Cart.objects.create(customer=customer, product=product2)
+            self.client.force_authenticate(user=customer)
+            response = self.client.post(
+                "/commerce/orders/", data=None, format="json"
+            )
+            self.assertEqual(response.status_code, HTTP_201_CREATED)
+
+        self.client.force_authenticate(user=self.vendor)
+        self.today = localdate().isoformat()
+
+    def get_sales(self) -> list:
+        return list(
+            ProductSales.objects.order_by("product_id").values_list(
+                "product_id", "date", "units", "revenue"
+            )
+        )
+
+    def test_record_product_sales(self):
+        self.assertEqual(
+            self.get_sales(),
+            [(1, localdate(), 3, 9), (2, localdate(), 2, 10)],
+        )
+
+    def test_list_product_sales(self):
+        response = self.client.get(
+            "/commerce/sales/",
+            data={"date_from": self.today, "date_to": self.today},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(
+            sorted(row["revenue"] for row in response.data["results"]), [9, 10]
+        )
+
+        response = self.client.get(
+            "/commerce/sales/",
+            data={"date_from": "2000-01-01", "date_to": "2000-01-31"},
+            format="json",
+        )
+        self.assertEqual(response.data["count"], 0)
+
+        response = self.client.get(
+            "/commerce/sales/", data={"date_from": "today"}, format="json"
+        )
+        self.assertEqual(response.status_code, HTTP_400_BAD_REQUEST)
+        self.assertIn("date_from", response.data)
+
+    def test_list_product_sales_of_others(self):
+        self.client.force_authenticate(
+            user=User.objects.get(username="customer0")
+        )
+        response = self.client.get("/commerce/sales/", data=None, format="json")
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(response.data["count"], 0)
+
+        self.client.force_authenticate(user=None)
+        response = self.client.get("/commerce/sales/", data=None, format="json")
+        self.assertEqual(response.status_code, HTTP_403_FORBIDDEN)
+
+    def test_rebuild_product_sales(self):
+        sales = self.get_sales()
+        ProductSales.objects.update(units=0, revenue=0)
+
+        out = StringIO()
+        call_command("rebuild_product_sales", stdout=out)
+
+        self.assertIn("Rebuilt 2 daily product sales.", out.getvalue())
+        self.assertEqual(self.get_sales(), sales)
+
+    def test_remove_product_sales(self):
+        customer = User.objects.get(username="customer1")
+        order = Order.objects.get(customer=customer)
+        self.client.force_authenticate(user=customer)
+        response = self.client.delete(
+            f"/commerce/orders/{order.id}/", data=None, format="json"
+        )
+        self.assertEqual(response.status_code, HTTP_204_NO_CONTENT)
+
+        sales = self.get_sales()
+        self.assertEqual(
+            sales, [(1, localdate(), 1, 3), (2, localdate(), 1, 5)]
+        )
+        call_command("rebuild_product_sales", stdout=StringIO())
+        self.assertEqual(self.get_sales(), sales)
+
+        _ = Order.objects.all().delete()
+        self.assertEqual(self.get_sales(), [])
+        call_command("rebuild_product_sales", stdout=StringIO())
+        self.assertEqual(self.get_sales(), [])
@@ -1,7 +1,10 @@
+from io import StringIO
+from django.core.management import call_command
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_404_NOT_FOUND,
 )
 from rest_framework.test import APITestCase
 from commerce.models import Category, Product, Review
@@ -66,6 +69,20 @@ class ReviewTests(APITestCase):
         self.assertEqual(response.status_code, HTTP_200_OK)
         self.assertEqual(response.data["rating"], 0.5)
 
+    def test_update_review_of_others(self):
+        other = User.objects.create(username="other")
+        review = Review.objects.create(
+            reviewer=other, product=Product.objects.last(), rating=1.0
+        )
+        path = f"/commerce/reviews/{review.id}/"
+
+        response = self.client.get(path, data=None, format="json")
+        self.assertEqual(response.status_code, HTTP_200_OK)
+
+        response = self.client.patch(path, data={"rating": 5.0}, format="json")
+        self.assertEqual(response.status_code, HTTP_404_NOT_FOUND)
+        self.assertEqual(Review.objects.get(id=review.id).rating, 1.0)
+
     def test_destroy_review(self):
         response = self.client.delete(
             "/commerce/reviews/1/", data=None, format="json"
@@ -73,3 +90,44 @@ class ReviewTests(APITestCase):
 
         self.assertEqual(response.status_code, HTTP_204_NO_CONTENT)
         self.assertEqual(Review.objects.all().count(), 0)
+
+    def test_product_rating(self):
+        product = Product.objects.get(title="product1")
+        self.assertEqual(product.rating_avg, 5.0)
+        self.assertEqual(product.rating_count, 1)
+
+        user = User.objects.create(username="user2")
+        _ = Review.objects.create(reviewer=user, product=product, rating=2.0)
+        product.refresh_from_db()
+        self.assertEqual(product.rating_avg, 3.5)
+        self.assertEqual(product.rating_count, 2)
+
+        review = Review.objects.get(reviewer=user)
+        review.rating = 4.0
+        review.save()
+        product.refresh_from_db()
+        self.assertEqual(product.rating_avg, 4.5)
+        self.assertEqual(product.rating_count, 2)
+
+        review.product = Product.objects.get(title="product2")
+        review.save()
+        product.refresh_from_db()
+        self.assertEqual(product.rating_avg, 5.0)
+        self.assertEqual(product.rating_count, 1)
+
+        Review.objects.all().delete()
+        product.refresh_from_db()
+        self.assertEqual(product.rating_avg, 0.0)
+        self.assertEqual(product.rating_count, 0)
+
+    def test_rebuild_product_ratings(self):
+        Product.objects.update(rating_avg=0, rating_count=0, rating_sum=0)
+
+        call_command("rebuild_product_ratings", stdout=StringIO())
+
+        product = Product.objects.get(title="product1")
+        self.assertEqual(product.rating_avg, 5.0)
+        self.assertEqual(product.rating_count, 1)
+        product = Product.objects.get(title="product2")
+        self.assertEqual(product.rating_avg, 0.0)
+        self.assertEqual(product.rating_count, 0)
@@ -5,11 +5,13 @@ from rest_framework.status import (
 )
 from rest_framework.test import APITestCase
 from commerce.models import Tag
+from common.cache import get_response_cache
 from common.models import User
 
 
 class TagTests(APITestCase):
     def setUp(self):
+        get_response_cache().clear()
         user = User.objects.create(is_staff=True)
         self.client.force_authenticate(user=user)
 
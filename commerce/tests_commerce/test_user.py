@@ -1,11 +1,15 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.status import HTTP_200_OK
 from rest_framework.test import APITestCase
+from commerce.models import Category, Order, Product, Review
 from common.models import User
 
 
 class UserTests(APITestCase):
     def setUp(self):
-        _ = User.objects.create()
+        user = User.objects.create()
+        self.client.force_authenticate(user=user)
 
     def test_list_user(self):
         response = self.client.get("/common/users/", data=None, format="json")
@@ -17,3 +21,36 @@ class UserTests(APITestCase):
 
         self.assertEqual(response.status_code, HTTP_200_OK)
         self.assertEqual(response.data["id"], 1)
+
+    def test_list_user_counts(self):
+        user = User.objects.get()
+        category = Category.objects.create(title="category")
+        for index in range(3):
+            product = Product.objects.create(
+                vendor=user, category=category, title="product", price=1
+            )
+            _ = Review.objects.create(reviewer=user, product=product, rating=1)
+        _ = Order.objects.create(customer=user)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                "/commerce/users/", data=None, format="json"
+            )
+        queries_count = len(context.captured_queries)
+        self.assertFalse(
+            any("JOIN" in query["sql"] for query in context.captured_queries)
+        )
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["orders_count"], 1)
+        self.assertEqual(response.data["results"][0]["products_count"], 3)
+        self.assertEqual(response.data["results"][0]["reviews_count"], 3)
+
+        for index in range(9):
+            _ = User.objects.create(username=f"user{index}")
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                "/commerce/users/", data=None, format="json"
+            )
+        self.assertEqual(len(context.captured_queries), queries_count)
@@ -1,5 +1,11 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from commerce.async_views import (
+    CategoryAsyncView,
+    ProductAsyncView,
+    ReviewAsyncView,
+    TagAsyncView,
+)
 from commerce.views import (
     UserViewSet,
     CartViewSet,
@@ -11,6 +17,8 @@ from commerce.views import (
     Order2ProductAdminViewSet,
     ProductViewSet,
     ProductAdminViewSet,
+    ProductSalesViewSet,
+    ProductSearchViewSet,
     ReviewViewSet,
     ReviewAdminViewSet,
     TagViewSet,
@@ -25,6 +33,10 @@ router.register(
     "order2products", Order2ProductViewSet, basename="order2product"
 )
 router.register("products", ProductViewSet, basename="product")
+router.register(
+    "products-search", ProductSearchViewSet, basename="product_search"
+)
+router.register("sales", ProductSalesViewSet, basename="product_sales")
 router.register("reviews", ReviewViewSet, basename="review")
 router.register("tags", TagViewSet, basename="tag")
 router.register("carts-admin", CartAdminViewSet, basename="cart_admin")
@@ -38,6 +50,26 @@ router.register("products-admin", ProductAdminViewSet, basename="product_admin")
 router.register("reviews-admin", ReviewAdminViewSet, basename="review_admin")
 
 
+async_views = [
+    ("categories", CategoryAsyncView, "category"),
+    ("products", ProductAsyncView, "product"),
+    ("reviews", ReviewAsyncView, "review"),
+    ("tags", TagAsyncView, "tag"),
+]
+
 urlpatterns = [
     path("", include(router.urls)),
 ]
+for prefix, view, basename in async_views:
+    urlpatterns += [
+        path(
+            f"async/{prefix}/",
+            view.as_view(),
+            name=f"{basename}_async-list",
+        ),
+        path(
+            f"async/{prefix}/<int:pk>/",
+            view.as_view(),
+            name=f"{basename}_async-detail",
+        ),
+    ]
@@ -1,15 +1,27 @@
 import logging
-from django.contrib.auth.models import AnonymousUser
+from typing import List, Type
+from django.db.models import Count, Model, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
-from rest_framework.request import Request
-from rest_framework.response import Response
-from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
+from rest_framework.mixins import ListModelMixin
+from rest_framework.viewsets import (
+    GenericViewSet,
+    ModelViewSet,
+    ReadOnlyModelViewSet,
+)
+from commerce.filters import (
+    ProductFilter,
+    ProductSalesFilter,
+    ProductSearchFilter,
+)
 from commerce.models import (
     Cart,
     Category,
     Order,
     Order2Product,
     Product,
+    ProductSales,
     Review,
     Tag,
 )
@@ -17,6 +29,7 @@ from commerce.permissions import (
     IsAdminUserOrReadOnly,
     IsCustomer,
     IsReviewerOrReadOnly,
+    IsVendor,
     IsVendorOrReadOnly,
 )
 from commerce.serializers import (
@@ -29,26 +42,56 @@ from commerce.serializers import (
     Order2ProductSerializer,
     ProductSerializer,
     ProductAdminSerializer,
+    ProductSalesSerializer,
     ReviewSerializer,
     ReviewAdminSerializer,
     TagSerializer,
 )
+from common.mixins import (
+    BulkMixin,
+    ConditionalMixin,
+    ExportMixin,
+    PermissionScopeMixin,
+    QueryPlanMixin,
+    ResponseCacheMixin,
+)
 from common.models import User
+from common.pagination import CreatedCursorPagination
+from common.serializers import BulkListSerializer
 
 LOGGER = logging.getLogger(__name__)
 
 
-class UserViewSet(ReadOnlyModelViewSet):
+def count_related(model: Type[Model], relation: str) -> Coalesce:
+    """Gets correlated subquery counting objects of reverse relation.
+
+    Each relation is counted by its own subquery, so counting several \
+        relations does not join them into a cartesian product.
+    """
+    field = model._meta.get_field(relation).field
+    return Coalesce(
+        Subquery(
+            field.model._default_manager.filter(**{field.name: OuterRef("pk")})
+            .order_by()
+            .values(field.name)
+            .annotate(count=Count("pk"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+class UserViewSet(ConditionalMixin, QueryPlanMixin, ReadOnlyModelViewSet):
     """User viewset for read-only.
 
     Fields
     ------
     - `carts` read_only `True`
-    - `orders_count` IntegerField source `orders.count` read_only `True`
+    - `orders_count` CountField relation `orders` read_only `True`
     - `orders` read_only `True`
-    - `products_count` IntegerField source `products.count` read_only `True`
+    - `products_count` CountField relation `products` read_only `True`
     - `products` read_only `True`
-    - `reviews_count` IntegerField source `reviews.count` read_only `True`
+    - `reviews_count` CountField relation `reviews` read_only `True`
     - `reviews` read_only `True`
 
     Permission
@@ -56,12 +99,18 @@ class UserViewSet(ReadOnlyModelViewSet):
     - Authenticated: ~~Create~~ / List / Retrieve / ~~Update~~ / ~~Destroy~~
     """
 
-    queryset = User.objects.all()
+    queryset = User.objects.annotate(
+        orders_count=count_related(User, "orders"),
+        products_count=count_related(User, "products"),
+        reviews_count=count_related(User, "reviews"),
+    ).order_by("created")
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
 
 
-class CartAdminViewSet(ModelViewSet):
+class CartAdminViewSet(
+    BulkMixin, ExportMixin, ConditionalMixin, QueryPlanMixin, ModelViewSet
+):
     """Cart viewset for admin.
 
     Fields
@@ -70,6 +119,14 @@ class CartAdminViewSet(ModelViewSet):
     - `product`
     - `quantity`
 
+    Bulk
+    ----
+    - `bulk/` POST / PATCH / DELETE lists of objects by `BulkMixin`
+
+    Export
+    ------
+    - `export/jsonl/` / `export/csv/` streams objects by `ExportMixin`
+
     Permission
     ----------
     - Admin: Create / List / Retrieve / Update / Destroy
@@ -80,7 +137,7 @@ class CartAdminViewSet(ModelViewSet):
     permission_classes = [IsAdminUser]
 
 
-class CartViewSet(CartAdminViewSet):
+class CartViewSet(PermissionScopeMixin, CartAdminViewSet):
     """Cart viewset.
 
     Fields
@@ -89,38 +146,33 @@ class CartViewSet(CartAdminViewSet):
     - `product`
     - `quantity`
 
+    Bulk
+    ----
+    - `bulk/` POST / PATCH / DELETE lists of objects by `BulkMixin`
+
     Permission
     ----------
-    - Admin: Create / List / Retrieve / Update / Destroy
-    - Customer: Create / List / Retrieve / Update / Destroy
+    - Customer: Create / List / Retrieve / Update / Destroy of own objects, \
+        scoped in SQL by `PermissionScopeMixin` for admin as well
     """
 
     serializer_class = CartSerializer
-    permission_classes = [IsAdminUser | IsCustomer]
-
-    def list(self, request: Request) -> Response:
-        """Lists Cart of the customer who is request user."""
-        if isinstance(request.user, AnonymousUser):
-            queryset = Cart.objects.none()
-        else:
-            queryset = Cart.objects.filter(customer=request.user)
-
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+    permission_classes = [IsCustomer]
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+    def perform_bulk_create(self, serializer: BulkListSerializer) -> List[Cart]:
+        """Creates Carts with request user as customer."""
+        return serializer.save(customer=self.request.user)
 
 
-class CategoryViewSet(ModelViewSet):
+class CategoryViewSet(
+    ResponseCacheMixin, ConditionalMixin, QueryPlanMixin, ModelViewSet
+):
     """Category viewset.
 
     Fields
     ------
     - `title`
-    - `products_count` IntegerField source `products.count` read_only `True`
+    - `products_count` CountField relation `products` read_only `True`
     - `products` read_only `True`
 
     Permission
@@ -129,19 +181,28 @@ class CategoryViewSet(ModelViewSet):
     - Others: ~~Create~~ / List / Retrieve / ~~Update~~ / ~~Destroy~~
     """
 
-    queryset = Category.objects.all()
+    queryset = Category.objects.annotate(
+        products_count=Count("products")
+    ).order_by("title")
     serializer_class = CategorySerializer
     permission_classes = [IsAdminUserOrReadOnly]
 
 
-class OrderAdminViewSet(ModelViewSet):
+class OrderAdminViewSet(
+    ExportMixin, ConditionalMixin, QueryPlanMixin, ModelViewSet
+):
     """Order viewset for admin.
 
     Fields
     ------
     - `customer`
+    - `total` read_only `True`
     - `order2products` read_only `True`
 
+    Export
+    ------
+    - `export/jsonl/` / `export/csv/` streams objects by `ExportMixin`
+
     Permission
     ----------
     - Admin: Create / List / Retrieve / Update / Destroy
@@ -152,22 +213,23 @@ class OrderAdminViewSet(ModelViewSet):
     permission_classes = [IsAdminUser]
 
 
-class OrderViewSet(OrderAdminViewSet):
+class OrderViewSet(PermissionScopeMixin, OrderAdminViewSet):
     """Order viewset.
 
     Fields
     ------
     - `customer` read_only `True`
+    - `total` read_only `True`
     - `order2products` read_only `True`
 
     Permission
     ----------
-    - Admin: Create / List / Retrieve / Update / Destroy
-    - Customer: Create / List / Retrieve / Update / Destroy
+    - Customer: Create / List / Retrieve / Update / Destroy of own objects, \
+        scoped in SQL by `PermissionScopeMixin` for admin as well
     """
 
     serializer_class = OrderSerializer
-    permission_classes = [IsAdminUser | IsCustomer]
+    permission_classes = [IsCustomer]
 
     def get_queryset(self):
         """Overriding to pass User for request data to Order view."""
@@ -175,23 +237,10 @@ class OrderViewSet(OrderAdminViewSet):
             return User.objects.all()
         return super().get_queryset()
 
-    def list(self, request: Request) -> Response:
-        """Lists Order of the customer who is request user."""
-        if isinstance(request.user, AnonymousUser):
-            queryset = Order.objects.none()
-        else:
-            queryset = Order.objects.filter(customer=request.user)
 
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-
-
-class Order2ProductAdminViewSet(ReadOnlyModelViewSet):
+class Order2ProductAdminViewSet(
+    ExportMixin, ConditionalMixin, QueryPlanMixin, ReadOnlyModelViewSet
+):
     """Order to Product quantity relationships viewset for admin.
 
     Fields
@@ -199,6 +248,11 @@ class Order2ProductAdminViewSet(ReadOnlyModelViewSet):
     - `order`
     - `product`
     - `quantity`
+    - `unit_price` read_only `True`
+
+    Export
+    ------
+    - `export/jsonl/` / `export/csv/` streams objects by `ExportMixin`
 
     Permission
     ----------
@@ -208,9 +262,10 @@ class Order2ProductAdminViewSet(ReadOnlyModelViewSet):
     queryset = Order2Product.objects.all()
     serializer_class = Order2ProductSerializer
     permission_classes = [IsAdminUser]
+    pagination_class = CreatedCursorPagination
 
 
-class Order2ProductViewSet(Order2ProductAdminViewSet):
+class Order2ProductViewSet(PermissionScopeMixin, Order2ProductAdminViewSet):
     """Order to Product quantity relationships viewset.
 
     Fields
@@ -218,34 +273,25 @@ class Order2ProductViewSet(Order2ProductAdminViewSet):
     - `order`
     - `product`
     - `quantity`
+    - `unit_price` read_only `True`
 
     Permission
     ----------
-    - Admin: Create / List / Retrieve / Update / Destroy
-    - Customer: Create / List / Retrieve / Update / Destroy
+    - Customer: Create / List / Retrieve / Update / Destroy of own objects, \
+        scoped in SQL by `PermissionScopeMixin` for admin as well
     """
 
-    permission_classes = [IsAdminUser | IsCustomer]
-
-    def list(self, request: Request) -> Response:
-        """Lists Order2Product of the customer who is request user."""
-        if isinstance(request.user, AnonymousUser):
-            queryset = Order2Product.objects.none()
-        else:
-            queryset = Order2Product.objects.filter(
-                order__customer=request.user
-            )
-
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+    permission_classes = [IsCustomer]
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
 
-
-class ProductAdminViewSet(ModelViewSet):
+class ProductAdminViewSet(
+    BulkMixin,
+    ExportMixin,
+    ResponseCacheMixin,
+    ConditionalMixin,
+    QueryPlanMixin,
+    ModelViewSet,
+):
     """Product viewset for admin.
 
     Fields
@@ -256,9 +302,25 @@ class ProductAdminViewSet(ModelViewSet):
     - `title`
     - `price`
     - `description`
+    - `stock`
+    - `rating_avg` read_only `True`
+    - `rating_count` read_only `True`
     - `order2products` read_only `True`
     - `reviews` read_only `True`
 
+    Filtering
+    ---------
+    - `ProductFilter` query params
+    - `ordering` query param by `price`, `created` or `rating_avg`
+
+    Bulk
+    ----
+    - `bulk/` POST / PATCH / DELETE lists of objects by `BulkMixin`
+
+    Export
+    ------
+    - `export/jsonl/` / `export/csv/` streams objects by `ExportMixin`
+
     Permission
     ----------
     - Admin: Create / List / Retrieve / Update / Destroy
@@ -267,9 +329,14 @@ class ProductAdminViewSet(ModelViewSet):
     queryset = Product.objects.all()
     serializer_class = ProductAdminSerializer
     permission_classes = [IsAdminUser]
+    pagination_class = CreatedCursorPagination
+    filter_backends = [ProductFilter, OrderingFilter]
+    ordering_fields = ["price", "created", "rating_avg"]
+    ordering = ["-created", "-id"]
+    cache_anonymous_only = True
 
 
-class ProductViewSet(ProductAdminViewSet):
+class ProductViewSet(PermissionScopeMixin, ProductAdminViewSet):
     """Product viewset.
 
     Fields
@@ -280,9 +347,21 @@ class ProductViewSet(ProductAdminViewSet):
     - `title`
     - `price`
     - `description`
+    - `stock`
+    - `rating_avg` read_only `True`
+    - `rating_count` read_only `True`
     - `order2products` read_only `True`
     - `reviews` read_only `True`
 
+    Filtering
+    ---------
+    - `ProductFilter` query params
+    - `ordering` query param by `price`, `created` or `rating_avg`
+
+    Bulk
+    ----
+    - `bulk/` POST / PATCH / DELETE lists of objects by `BulkMixin`
+
     Permission
     ----------
     - Admin: Create / List / Retrieve / Update / Destroy
@@ -293,8 +372,70 @@ class ProductViewSet(ProductAdminViewSet):
     serializer_class = ProductSerializer
     permission_classes = [IsAdminUser | IsVendorOrReadOnly]
 
+    def perform_bulk_create(
+        self, serializer: BulkListSerializer
+    ) -> List[Product]:
+        """Creates Products with request user as vendor."""
+        return serializer.save(vendor=self.request.user)
 
-class ReviewAdminViewSet(ModelViewSet):
+
+class ProductSalesViewSet(
+    PermissionScopeMixin, QueryPlanMixin, ListModelMixin, GenericViewSet
+):
+    """Daily sales rollup of Product viewset for vendors.
+
+    Reads pre-aggregated `ProductSales` rollups instead of grouping \
+        Order2Products, scoped to the request user as vendor.
+
+    Fields
+    ------
+    - `product` read_only `True`
+    - `date` read_only `True`
+    - `units` read_only `True`
+    - `revenue` read_only `True`
+
+    Filtering
+    ---------
+    - `ProductSalesFilter` query params
+
+    Permission
+    ----------
+    - Vendor: ~~Create~~ / List / ~~Retrieve~~ / ~~Update~~ / ~~Destroy~~ \
+        of own Products
+    """
+
+    queryset = ProductSales.objects.all()
+    serializer_class = ProductSalesSerializer
+    permission_classes = [IsAuthenticated, IsVendor]
+    filter_backends = [ProductSalesFilter]
+
+
+class ProductSearchViewSet(QueryPlanMixin, ListModelMixin, GenericViewSet):
+    """Product full-text search viewset.
+
+    Fields
+    ------
+    Same as `ProductViewSet`
+
+    Filtering
+    ---------
+    - `ProductSearchFilter` `q` query param, ranked by relevance
+    - `ProductFilter` query params
+
+    Permission
+    ----------
+    - Admin / Others: List
+    """
+
+    queryset = Product.objects.all()
+    serializer_class = ProductSerializer
+    permission_classes = [IsAdminUserOrReadOnly]
+    filter_backends = [ProductFilter, ProductSearchFilter]
+
+
+class ReviewAdminViewSet(
+    ExportMixin, ConditionalMixin, QueryPlanMixin, ModelViewSet
+):
     """Review viewset for admin.
 
     Fields
@@ -304,6 +445,10 @@ class ReviewAdminViewSet(ModelViewSet):
     - `rating`
     - `description`
 
+    Export
+    ------
+    - `export/jsonl/` / `export/csv/` streams objects by `ExportMixin`
+
     Permission
     ----------
     - Admin: Create / List / Retrieve / Update / Destroy
@@ -314,7 +459,7 @@ class ReviewAdminViewSet(ModelViewSet):
     permission_classes = [IsAdminUser]
 
 
-class ReviewViewSet(ReviewAdminViewSet):
+class ReviewViewSet(PermissionScopeMixin, ReviewAdminViewSet):
     """Review viewset.
 
     Fields
@@ -336,13 +481,15 @@ class ReviewViewSet(ReviewAdminViewSet):
     permission_classes = [IsAdminUser | IsReviewerOrReadOnly]
 
 
-class TagViewSet(ModelViewSet):
+class TagViewSet(
+    ResponseCacheMixin, ConditionalMixin, QueryPlanMixin, ModelViewSet
+):
     """Tag viewset.
 
     Fields
     ------
     - `title`
-    - `products_count` IntegerField source `products.count` read_only `True`
+    - `products_count` CountField relation `products` read_only `True`
     - `products` read_only `True`
 
     Permission
@@ -351,6 +498,8 @@ class TagViewSet(ModelViewSet):
     - Others: ~~Create~~ / List / Retrieve / ~~Update~~ / ~~Destroy~~
     """
 
-    queryset = Tag.objects.all()
+    queryset = Tag.objects.annotate(products_count=Count("products")).order_by(
+        "title"
+    )
     serializer_class = TagSerializer
     permission_classes = [IsAdminUserOrReadOnly]
@@ -0,0 +1,110 @@
+from hashlib import sha256
+from typing import Any, Dict, Iterable, Type
+from urllib.parse import urlencode
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db.models import Model
+from rest_framework.request import Request
+
+GENERATION_KEY = "response:generation:{}"
+HITS_KEY = "response:hits"
+MISSES_KEY = "response:misses"
+
+
+def get_response_cache() -> BaseCache:
+    """Gets cache of `RESPONSE_CACHE_ALIAS` in settings, `default` if unset.
+
+    Local-memory caches are per process, so deployments with several worker \
+        processes should point the alias to a shared backend, e.g. Redis, \
+        for invalidations to reach every worker.
+    """
+    return caches[getattr(settings, "RESPONSE_CACHE_ALIAS", "default")]
+
+
+def get_response_cache_timeout() -> int:
+    """Gets `RESPONSE_CACHE_TIMEOUT` seconds in settings, `300` if unset."""
+    return getattr(settings, "RESPONSE_CACHE_TIMEOUT", 300)
+
+
+def get_visibility(request: Request) -> str:
+    """Gets visibility class of request user."""
+    if request.user.is_staff:
+        return "staff"
+    if request.user.is_authenticated:
+        return "authenticated"
+    return "anonymous"
+
+
+def get_generation_key(model: Type[Model]) -> str:
+    """Gets cache key of the generation of model."""
+    return GENERATION_KEY.format(model._meta.label_lower)
+
+
+def get_response_key(request: Request, models: Iterable[Type[Model]]) -> str:
+    """Gets cache key of request by path, query params and visibility class.
+
+    Keys embed the current generations of models the response is read from, \
+        so bumping any of them invalidates the cached responses reading it.
+    """
+    cache = get_response_cache()
+    keys = sorted({get_generation_key(model) for model in models})
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            cache.add(key, 0, timeout=None)
+            generations[key] = cache.get(key, 0)
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    digest = sha256(
+        "\n".join(
+            [
+                request.get_host(),
+                request.path,
+                query,
+                get_visibility(request),
+                *[f"{key}:{generations[key]}" for key in keys],
+            ]
+        ).encode()
+    ).hexdigest()
+    return f"response:{digest}"
+
+
+def get_plain_data(data: Any) -> Any:
+    """Gets response data as plain dicts, lists and strs to be cached.
+
+    Pickling str subclasses like `rest_framework.relations.Hyperlink` would \
+        call `__str__` of their objects, querying their relations per row.
+    """
+    if isinstance(data, dict):
+        return {key: get_plain_data(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [get_plain_data(value) for value in data]
+    if isinstance(data, str):
+        return str(data)
+    return data
+
+
+def increment(key: str) -> None:
+    """Increments counter of key in response cache."""
+    cache = get_response_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def invalidate_responses(*models: Type[Model]) -> None:
+    """Invalidates cached responses read from models bumping generations.
+
+    Responses read only from other models stay cached.
+    """
+    for model in set(models):
+        increment(get_generation_key(model))
+
+
+def get_response_cache_stats() -> Dict[str, int]:
+    """Gets hit and miss counters of response cache."""
+    cache = get_response_cache()
+    return {
+        "hits": cache.get(HITS_KEY, 0),
+        "misses": cache.get(MISSES_KEY, 0),
+    }
@@ -0,0 +1,186 @@
+import json
+import logging
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+from django.conf import settings
+
+LOGGER = logging.getLogger(__name__)
+
+BUCKETS = {
+    "queries": [0, 1, 2, 5, 10, 20, 50, 100, 200],
+    "db_ms": [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000],
+    "serialization_ms": [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000],
+    "total_ms": [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000],
+}
+DEFAULT_THRESHOLDS = {"queries": 50, "db_ms": 500, "total_ms": 1000}
+
+CURRENT: ContextVar[Optional["RequestMetrics"]] = ContextVar(
+    "request_metrics", default=None
+)
+REGISTRY: Dict[str, Dict[str, "Histogram"]] = {}
+REGISTRY_LOCK = Lock()
+
+
+class Histogram:
+    """Histogram of observed values by cumulative buckets of upper bounds.
+
+    Attributes
+    ----------
+    - `bounds` upper bounds of buckets, with an implicit `+Inf` bucket
+    - `counts` number of values less than or equal to each bound
+    - `count`
+    - `sum`
+    - `max`
+    """
+
+    def __init__(self, bounds: List[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        for index, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[index] += 1
+        self.counts[-1] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 3),
+            "max": round(self.max, 3),
+            "buckets": dict(
+                zip(
+                    [str(bound) for bound in self.bounds] + ["+Inf"],
+                    self.counts,
+                )
+            ),
+        }
+
+
+class RequestMetrics:
+    """Metrics of the current request, recorded by `RequestMetricsMiddleware`.
+
+    Attributes
+    ----------
+    - `queries` number of database queries
+    - `db_seconds` time spent in database queries
+    - `started` when the request started
+    - `view_started` when the view started, if resolved
+    - `view_ended` when the view returned a response to be rendered
+    - `render_ended` when the response was rendered
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.started = perf_counter()
+        self.view_started: Optional[float] = None
+        self.view_ended: Optional[float] = None
+        self.render_ended: Optional[float] = None
+
+    def get_values(self) -> Dict[str, float]:
+        """Gets values of finished request by metric names of `BUCKETS`.
+
+        Serialization time is the time spent in the view and in rendering \
+            outside database queries, which API views mostly spend in \
+            serializers and renderers.
+        """
+        ended = perf_counter()
+        db_ms = self.db_seconds * 1000
+        serialization_ms = 0.0
+        if self.view_started is not None:
+            view_ended = self.render_ended or self.view_ended or ended
+            serialization_ms = max(
+                (view_ended - self.view_started) * 1000 - db_ms, 0.0
+            )
+        return {
+            "queries": self.queries,
+            "db_ms": db_ms,
+            "serialization_ms": serialization_ms,
+            "total_ms": (ended - self.started) * 1000,
+        }
+
+
+def record_query(
+    execute: Callable, sql: str, params: Any, many: bool, context: dict
+) -> Any:
+    """Database execute wrapper counting queries of the current request."""
+    metrics = CURRENT.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_seconds += perf_counter() - started
+
+
+def get_thresholds() -> Dict[str, float]:
+    """Gets `REQUEST_METRICS_THRESHOLDS` in settings, or defaults if unset.
+
+    Requests exceeding any threshold are logged.
+    """
+    return getattr(settings, "REQUEST_METRICS_THRESHOLDS", DEFAULT_THRESHOLDS)
+
+
+def record_request(
+    route: str, method: str, status: int, values: Dict[str, float]
+) -> None:
+    """Records metric values of request by route, logging if exceeded."""
+    with REGISTRY_LOCK:
+        histograms = REGISTRY.setdefault(
+            route,
+            {name: Histogram(bounds) for name, bounds in BUCKETS.items()},
+        )
+        for name, value in values.items():
+            histograms[name].observe(value)
+
+    exceeded = [
+        name
+        for name, threshold in get_thresholds().items()
+        if values.get(name, 0) > threshold
+    ]
+    if exceeded:
+        LOGGER.warning(
+            json.dumps(
+                {
+                    "event": "request_threshold_exceeded",
+                    "route": route,
+                    "method": method,
+                    "status": status,
+                    "exceeded": exceeded,
+                    **{name: round(value, 3) for name, value in values.items()},
+                }
+            )
+        )
+
+
+def get_request_metrics() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Gets histograms of metrics by route.
+
+    Histograms are kept per process, so deployments with several worker \
+        processes report the worker which served the request.
+    """
+    with REGISTRY_LOCK:
+        return {
+            route: {
+                name: histogram.to_dict()
+                for name, histogram in histograms.items()
+            }
+            for route, histograms in sorted(REGISTRY.items())
+        }
+
+
+def reset_request_metrics() -> None:
+    """Resets histograms of every route."""
+    with REGISTRY_LOCK:
+        REGISTRY.clear()
@@ -0,0 +1,84 @@
+from time import perf_counter
+from typing import Callable
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpRequest, HttpResponse
+from django.template.response import SimpleTemplateResponse
+from common.metrics import CURRENT, RequestMetrics, record_request
+
+
+class RequestMetricsMiddleware:
+    """Middleware recording query count and timings per resolved route.
+
+    Records number of queries, database time, serialization time and total \
+        time of every resolved request into histograms by route name, e.g. \
+        `product-list`, served by `common.views.RequestMetricsView`.
+    Queries are counted by `common.metrics.record_query` installed on every \
+        database connection, for sync and async views alike.
+    Place it first in `MIDDLEWARE` so total time covers every middleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = CURRENT.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            CURRENT.reset(token)
+        self.record(request, response, metrics)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        metrics = RequestMetrics()
+        token = CURRENT.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            CURRENT.reset(token)
+        self.record(request, response, metrics)
+        return response
+
+    def process_view(self, request: HttpRequest, *args, **kwargs) -> None:
+        metrics = CURRENT.get()
+        if metrics is not None:
+            metrics.view_started = perf_counter()
+
+    def process_template_response(
+        self, request: HttpRequest, response: SimpleTemplateResponse
+    ) -> SimpleTemplateResponse:
+        """Marks the end of view and the end of rendering of response."""
+        metrics = CURRENT.get()
+        if metrics is not None:
+            metrics.view_ended = perf_counter()
+
+            def rendered(response: SimpleTemplateResponse) -> None:
+                metrics.render_ended = perf_counter()
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    def record(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+        metrics: RequestMetrics,
+    ) -> None:
+        """Records metrics of request by route name if resolved."""
+        match = request.resolver_match
+        if match is None or not match.view_name:
+            return
+        record_request(
+            match.view_name,
+            request.method,
+            response.status_code,
+            metrics.get_values(),
+        )
@@ -0,0 +1,836 @@
+import csv
+import json
+from datetime import datetime
+from functools import lru_cache
+from hashlib import sha256
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+from asgiref.sync import sync_to_async
+from django.core.exceptions import FieldDoesNotExist
+from django.core.handlers.asgi import ASGIRequest
+from django.db import IntegrityError, transaction
+from django.db.models import (
+    Count,
+    ForeignObjectRel,
+    Max,
+    Model,
+    OuterRef,
+    Prefetch,
+    QuerySet,
+    Subquery,
+)
+from django.db.models.constants import LOOKUP_SEP
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import DictField, Field, IntegerField, ListField
+from rest_framework.permissions import (
+    BasePermission,
+    IsAdminUser,
+    IsAuthenticated,
+)
+from rest_framework.relations import ManyRelatedField, RelatedField
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer, ListSerializer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_204_NO_CONTENT,
+    HTTP_304_NOT_MODIFIED,
+)
+from common.cache import (
+    HITS_KEY,
+    MISSES_KEY,
+    get_plain_data,
+    get_response_cache,
+    get_response_cache_timeout,
+    get_response_key,
+    increment,
+)
+from common.permissions import scope_queryset
+from common.serializers import (
+    Fieldset,
+    get_fieldset,
+    resolve_related_objects,
+)
+
+
+@lru_cache(maxsize=256)
+def get_query_plan(
+    model: Type[Model],
+    serializer_class: Type[BaseSerializer],
+    fields: FrozenSet[str] = frozenset(),
+    omit: FrozenSet[str] = frozenset(),
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """Gets related lookups needed to serialize model by serializer fields.
+
+    Forward relations rendered only by primary key (e.g. hyperlinks) are read \
+        from the `*_id` column and need no join.
+    Forward relations read deeper (e.g. `owner.username`) are select_related.
+    Reverse and many-to-many relations are prefetch_related, so sources like \
+        `orders.count` are also answered from the prefetch cache.
+    Fields removed by `fields` and `omit` of `common.serializers.Fieldset` \
+        are not planned.
+
+    Returns
+    -------
+    - select_related lookups
+    - prefetch_related lookups
+    - prefetch_related lookups of reverse many related fields, which may \
+        be capped
+    """
+    select_related, prefetch_related, cappable = set(), set(), set()
+    serializer_fields = serializer_class().fields
+    for name in Fieldset(fields, omit).filter(serializer_fields):
+        field = serializer_fields[name]
+        if field.write_only or field.source == "*":
+            continue
+
+        current_model, path, many = model, [], False
+        for index, attr in enumerate(field.source_attrs):
+            try:
+                model_field = current_model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                break
+            if not model_field.is_relation:
+                break
+
+            is_leaf = index == len(field.source_attrs) - 1
+            if (
+                is_leaf
+                and isinstance(field, RelatedField)
+                and field.use_pk_only_optimization()
+            ):
+                break
+
+            path.append(attr)
+            lookup = LOOKUP_SEP.join(path)
+            if model_field.many_to_many or model_field.one_to_many:
+                many = True
+            if isinstance(field, ManyRelatedField) or many:
+                prefetch_related.add(lookup)
+                if (
+                    isinstance(field, ManyRelatedField)
+                    and model_field.one_to_many
+                    and len(path) == 1
+                ):
+                    cappable.add(lookup)
+            else:
+                select_related.add(lookup)
+            current_model = model_field.related_model
+
+    return (
+        tuple(sorted(select_related)),
+        tuple(sorted(prefetch_related)),
+        tuple(sorted(cappable)),
+    )
+
+
+class CappedPrefetch(Prefetch):
+    """Prefetch of reverse relation limited to `cap` objects per object.
+
+    The sliced queryset is limited per object by the database in the single \
+        prefetch query, in the ordering of the related model.
+    Related managers are cached with the unsliced queryset, since Django \
+        cannot filter sliced querysets into managers without `to_attr`.
+    """
+
+    def __init__(self, lookup: str, queryset: QuerySet, cap: int):
+        super().__init__(lookup, queryset=queryset)
+        self.cap = cap
+
+    def get_current_queryset(self, level: int) -> Optional[QuerySet]:
+        queryset = super().get_current_queryset(level)
+        return None if queryset is None else queryset[: self.cap]
+
+
+def get_capped_prefetch(model: Type[Model], lookup: str, cap: int) -> Prefetch:
+    """Gets prefetch of reverse relation limited to `cap` objects per object."""
+    related_model = model._meta.get_field(lookup).related_model
+    queryset = related_model._default_manager.all()
+    if not queryset.ordered:
+        queryset = queryset.order_by("pk")
+    return CappedPrefetch(lookup, queryset, cap)
+
+
+def plan_queryset(
+    queryset: QuerySet,
+    serializer_class: Type[BaseSerializer],
+    fieldset: Fieldset = Fieldset(),
+) -> QuerySet:
+    """Applies related lookups of serializer fields to queryset.
+
+    With `cap` of fieldset, reverse many related fields prefetch at most \
+        `cap` objects per object.
+    """
+    select_related, prefetch_related, cappable = get_query_plan(
+        queryset.model, serializer_class, fieldset.fields, fieldset.omit
+    )
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    for lookup in prefetch_related:
+        if fieldset.cap is not None and lookup in cappable:
+            lookup = get_capped_prefetch(queryset.model, lookup, fieldset.cap)
+        queryset = queryset.prefetch_related(lookup)
+    return queryset
+
+
+def get_related_paths(
+    model: Type[Model], lookups: Iterable[str]
+) -> List[Tuple[Type[Model], List[str]]]:
+    """Gets models related by lookups with their paths back to model.
+
+    Many-to-many relations also relate their through models.
+
+    Returns
+    -------
+    - related model and lookup path from it back to model, e.g. \
+        `(Review, ["product"])` of `reviews` lookup of Product
+    """
+    related = []
+    for lookup in lookups:
+        current_model, path = model, []
+        for attr in lookup.split(LOOKUP_SEP):
+            field = current_model._meta.get_field(attr)
+            if isinstance(field, ForeignObjectRel):
+                if field.many_to_many:
+                    name = field.field.m2m_reverse_field_name()
+                    related.append((field.through, [name, *path]))
+                path = [field.field.name, *path]
+            else:
+                if field.many_to_many:
+                    name = field.m2m_field_name()
+                    related.append((field.remote_field.through, [name, *path]))
+                path = [field.related_query_name(), *path]
+            current_model = field.related_model
+        related.append((current_model, path))
+    return related
+
+
+def get_related_validators(
+    model: Type[Model], lookups: Iterable[str]
+) -> Dict[str, Subquery]:
+    """Gets correlated subqueries validating objects related by lookups.
+
+    Objects related by every lookup of `get_related_paths` annotate their \
+        latest `updated` and count, and rows of many-to-many through tables \
+        their latest id and count, since ids of added rows grow.
+    So creating, updating, deleting or (un)relating any related object \
+        changes the annotations of the objects it is related to.
+
+    Returns
+    -------
+    - annotations by name, named `*_updated` for latest `updated`, \
+        `*_latest` for latest id and `*_count` for counts
+    """
+    related = get_related_paths(model, lookups)
+
+    annotations = {}
+    for index, (related_model, path) in enumerate(related):
+        lookup = LOOKUP_SEP.join(path)
+        objects = (
+            related_model._default_manager.filter(**{lookup: OuterRef("pk")})
+            .order_by()
+            .values(lookup)
+        )
+        try:
+            related_model._meta.get_field("updated")
+            latest, suffix = Max("updated"), "updated"
+        except FieldDoesNotExist:
+            latest, suffix = Max("pk"), "latest"
+        for name, function in [(suffix, latest), ("count", Count("pk"))]:
+            annotations[f"validator_{index}_{name}"] = Subquery(
+                objects.annotate(value=function).values("value")
+            )
+    return annotations
+
+
+class QueryPlanMixin:
+    """Viewset mixin planning related lookups from serializer fields.
+
+    Listing or retrieving objects costs a constant number of queries \
+        regardless of the number of objects.
+    """
+
+    def get_queryset(self) -> QuerySet:
+        """Gets queryset with related lookups of serializer fields."""
+        return self.plan_queryset(super().get_queryset())
+
+    def plan_queryset(self, queryset: QuerySet) -> QuerySet:
+        """Applies related lookups of serializer class fields to queryset.
+
+        Only fields of sparse fieldset of the request are planned.
+        """
+        return plan_queryset(
+            queryset, self.get_serializer_class(), get_fieldset(self.request)
+        )
+
+
+class PermissionScopeMixin:
+    """Viewset mixin scoping querysets of every action by permissions in SQL.
+
+    Querysets are scoped by `common.permissions.scope_queryset` with every \
+        permission of the view, so list, object lookups and bulk writes \
+        never fetch objects of others, e.g. lookups do not find them rather \
+        than load and reject them.
+    """
+
+    def get_queryset(self) -> QuerySet:
+        """Gets queryset of objects permitted to the request user."""
+        queryset = super().get_queryset()
+        for permission in self.get_permissions():
+            queryset = scope_queryset(permission, self.request, self, queryset)
+        return queryset
+
+
+class ResponseCacheMixin:
+    """Viewset mixin caching list and retrieve response data.
+
+    Responses are cached by path, query params and visibility class of the \
+        request user, and invalidated by `common.cache.invalidate_responses` \
+        of any model they are read from, i.e. the queryset model, models \
+        related by the query plan of the serializer and `cache_models`.
+    `ETag` and `Last-Modified` headers, e.g. of `ConditionalMixin` following \
+        in the MRO, are cached along, so cached responses answer conditional \
+        GETs with 304 without any query.
+    Data is cached as plain dicts, lists and strs by \
+        `common.cache.get_plain_data`, so caching costs no query.
+    Responses carry `X-Cache` header of `HIT` or `MISS`.
+
+    Attributes
+    ----------
+    - `cache_anonymous_only` caches only responses to anonymous users
+    - `cache_headers` names of response headers cached along data
+    - `cache_models` other models responses are read from, e.g. by filters
+    """
+
+    cache_anonymous_only = False
+    cache_headers = ["ETag", "Last-Modified"]
+    cache_models: List[Type[Model]] = []
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """Lists objects from response cache if cached."""
+        return self.get_cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        """Retrieves object from response cache if cached."""
+        return self.get_cached_response(
+            request, super().retrieve, *args, **kwargs
+        )
+
+    def get_cached_response(
+        self, request: Request, handler, *args, **kwargs
+    ) -> Response:
+        """Gets response from cache or from handler caching it."""
+        key = self.get_cache_key(request)
+        if key is None:
+            return handler(request, *args, **kwargs)
+        response = self.get_cache_hit(request, key)
+        if response is None:
+            response = self.set_cache_miss(
+                key, handler(request, *args, **kwargs)
+            )
+        return response
+
+    def get_cache_key(self, request: Request) -> Optional[str]:
+        """Gets response cache key of request, `None` if not cached."""
+        if self.cache_anonymous_only and request.user.is_authenticated:
+            return None
+        return get_response_key(request, self.get_cache_models())
+
+    def get_cache_hit(self, request: Request, key: str) -> Optional[Response]:
+        """Gets cached response of key, or 304 if not modified, if cached."""
+        cached = get_response_cache().get(key)
+        if cached is None:
+            return None
+        increment(HITS_KEY)
+        data, headers = cached
+        response = get_conditional_response(
+            request,
+            etag=headers.get("ETag"),
+            last_modified=parse_http_date_safe(headers.get("Last-Modified")),
+        )
+        if response is None:
+            response = Response(data)
+        for header, value in {**headers, "X-Cache": "HIT"}.items():
+            response[header] = value
+        return response
+
+    def set_cache_miss(self, key: str, response: Response) -> Response:
+        """Caches response of key if successful, marking it a miss."""
+        increment(MISSES_KEY)
+        if response.status_code == HTTP_200_OK:
+            headers = {
+                header: response[header]
+                for header in self.cache_headers
+                if response.has_header(header)
+            }
+            get_response_cache().set(
+                key,
+                (get_plain_data(response.data), headers),
+                get_response_cache_timeout(),
+            )
+        response["X-Cache"] = "MISS"
+        return response
+
+    def get_cache_models(self) -> List[Type[Model]]:
+        """Gets models responses are read from, invalidating them by writes."""
+        model = self.queryset.model
+        select_related, prefetch_related, _ = get_query_plan(
+            model, self.get_serializer_class()
+        )
+        related = get_related_paths(model, [*select_related, *prefetch_related])
+        return [
+            model,
+            *[related_model for related_model, _ in related],
+            *self.cache_models,
+        ]
+
+
+class ConditionalMixin:
+    """Viewset mixin answering conditional GETs by `updated` of objects.
+
+    List and retrieve responses carry `ETag` and `Last-Modified` headers \
+        derived from `updated` of the objects of the page and its links, or \
+        of the object, and of the objects related by the query plan of the \
+        serializer, by `get_related_validators`.
+    `If-None-Match` or `If-Modified-Since` requests are answered with 304 \
+        without serializing.
+    Validators of related objects are correlated subqueries annotated on \
+        the page or the object, so validating costs no query beyond them, \
+        and never aggregates the whole filtered queryset.
+    `Last-Modified` reflects no deletion of related objects, which only \
+        `ETag` does, and `If-None-Match` takes precedence.
+    """
+
+    def get_queryset(self) -> QuerySet:
+        """Gets queryset annotated with related validators of objects read."""
+        queryset = super().get_queryset()
+        if self.action in ["list", "retrieve"]:
+            queryset = queryset.annotate(**self.get_related_validators())
+        return queryset
+
+    def get_related_validators(self) -> Dict[str, Subquery]:
+        """Gets related validators of the query plan of serializer class."""
+        select_related, prefetch_related, _ = get_query_plan(
+            self.queryset.model, self.get_serializer_class()
+        )
+        return get_related_validators(
+            self.queryset.model, [*select_related, *prefetch_related]
+        )
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """Lists page of objects unless not modified."""
+        objects, paginated = self.get_list_objects()
+        return self.list_objects(request, objects, paginated)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        """Retrieves object unless not modified."""
+        return self.retrieve_object(request, self.get_object())
+
+    def get_list_objects(self) -> Tuple[List[Model], bool]:
+        """Gets objects of the page, or all objects if not paginated.
+
+        Returns
+        -------
+        - objects annotated with related validators
+        - whether objects are paginated
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return list(queryset), False
+        return page, True
+
+    def list_objects(
+        self, request: Request, objects: List[Model], paginated: bool
+    ) -> Response:
+        """Lists objects of `get_list_objects` unless not modified.
+
+        Serializing queries nothing beyond objects planned by the queryset.
+        """
+        names = ["updated", *self.get_related_validators()]
+        values = [
+            {name: getattr(obj, name) for name in names} for obj in objects
+        ]
+        validators = [
+            [obj.pk, *[value[name] for name in sorted(value)]]
+            for obj, value in zip(objects, values)
+        ]
+        if paginated:
+            validators.append(
+                [
+                    self.paginator.get_next_link(),
+                    self.paginator.get_previous_link(),
+                ]
+            )
+        updated = max(
+            filter(None, map(self.get_last_updated, values)), default=None
+        )
+
+        def handler(request: Request) -> Response:
+            serializer = self.get_serializer(objects, many=True)
+            if paginated:
+                return self.get_paginated_response(serializer.data)
+            return Response(serializer.data)
+
+        return self.get_conditional_response(
+            request, validators, updated, handler
+        )
+
+    def retrieve_object(self, request: Request, instance: Model) -> Response:
+        """Retrieves object of `get_object` unless not modified."""
+        values = {
+            name: getattr(instance, name)
+            for name in ["updated", *self.get_related_validators()]
+        }
+
+        def handler(request: Request) -> Response:
+            return Response(self.get_serializer(instance).data)
+
+        return self.get_conditional_response(
+            request,
+            [instance.pk, *[values[name] for name in sorted(values)]],
+            self.get_last_updated(values),
+            handler,
+        )
+
+    def get_last_updated(self, values: Dict[str, Any]) -> Optional[datetime]:
+        """Gets latest of `updated` and related `*_updated` values."""
+        return max(
+            (
+                value
+                for name, value in values.items()
+                if name.endswith("updated") and value is not None
+            ),
+            default=None,
+        )
+
+    def get_object(self) -> Model:
+        """Gets object once per request."""
+        if getattr(self, "_object", None) is None:
+            self._object = super().get_object()
+        return self._object
+
+    def get_conditional_response(
+        self,
+        request: Request,
+        validators: List[Any],
+        updated: Optional[datetime],
+        handler,
+        *args,
+        **kwargs,
+    ) -> Response:
+        """Gets 304 response if not modified, or response from handler.
+
+        ETag is validated with full path and request user as well, since \
+            representations vary by query params and by user.
+        """
+        etag = quote_etag(
+            sha256(
+                repr(
+                    [request.get_full_path(), request.user.pk, *validators]
+                ).encode()
+            ).hexdigest()
+        )
+        last_modified = int(updated.timestamp()) if updated else None
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        if response.status_code in [HTTP_200_OK, HTTP_304_NOT_MODIFIED]:
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+        return response
+
+
+class BulkMixin:
+    """Viewset mixin writing lists of objects in bulk at `bulk/`.
+
+    - POST creates objects of list items.
+    - PATCH partially updates objects of list items by `id`.
+    - DELETE destroys objects by `ids` list.
+
+    Items are validated in batch, resolving hyperlinks of every item by \
+        `common.serializers.resolve_related_objects` in one query per \
+        relation, and, if any is invalid, nothing is written and 400 is \
+        returned with a list of per-item errors, `{}` for valid items.
+    Bulk writes require authentication on top of the viewset permissions.
+    Objects are written in one transaction by `Meta.list_serializer_class` \
+        of the serializer, e.g. `common.serializers.BulkListSerializer`.
+
+    Attributes
+    ----------
+    - `bulk_max_items` maximum number of items per request
+    """
+
+    bulk_max_items = 1000
+
+    def get_permissions(self) -> List[BasePermission]:
+        """Gets permissions, requiring authentication for bulk writes."""
+        permissions = super().get_permissions()
+        if self.action in [
+            "bulk_create",
+            "bulk_partial_update",
+            "bulk_destroy",
+        ]:
+            permissions.insert(0, IsAuthenticated())
+        return permissions
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request: Request, *args, **kwargs) -> Response:
+        """Creates objects of list items."""
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=self.bulk_max_items,
+        )
+        serializer.is_valid(raise_exception=True)
+        instances = self.perform_bulk_write(
+            self.perform_bulk_create, serializer
+        )
+        return Response(
+            self.get_bulk_data([instance.pk for instance in instances]),
+            status=HTTP_201_CREATED,
+        )
+
+    @bulk_create.mapping.patch
+    def bulk_partial_update(
+        self, request: Request, *args, **kwargs
+    ) -> Response:
+        """Partially updates objects of list items by `id`."""
+        items = self.validate_bulk(DictField(), request.data)
+        ids = [item.get("id") for item in items]
+        instances = self.get_queryset().in_bulk(
+            [pk for pk in ids if type(pk) is int]
+        )
+        context = self.get_serializer_context()
+        context["related_objects"] = resolve_related_objects(
+            self.get_serializer(), items
+        )
+
+        seen, serializers, errors = set(), [], []
+        for pk, item in zip(ids, items):
+            if pk not in instances or pk in seen:
+                errors.append({"id": ["Not found or duplicated."]})
+                continue
+            seen.add(pk)
+            self.check_object_permissions(request, instances[pk])
+            serializer = self.get_serializer(
+                instances[pk], data=item, partial=True, context=context
+            )
+            errors.append({} if serializer.is_valid() else serializer.errors)
+            serializers.append(serializer)
+        if any(errors):
+            raise ValidationError(errors)
+
+        list_serializer = self.get_serializer(
+            [serializer.instance for serializer in serializers],
+            many=True,
+            context=context,
+        )
+        self.perform_bulk_write(
+            self.perform_bulk_update,
+            list_serializer,
+            [serializer.validated_data for serializer in serializers],
+        )
+        return Response(self.get_bulk_data(ids))
+
+    @bulk_create.mapping.delete
+    def bulk_destroy(self, request: Request, *args, **kwargs) -> Response:
+        """Destroys objects by `ids` list."""
+        data = request.data if isinstance(request.data, dict) else {}
+        ids = self.validate_bulk(
+            IntegerField(min_value=1), data.get("ids"), "ids"
+        )
+        instances = self.get_queryset().in_bulk(ids)
+        errors = {
+            index: ["Not found."]
+            for index, pk in enumerate(ids)
+            if pk not in instances
+        }
+        if errors:
+            raise ValidationError({"ids": errors})
+        for instance in instances.values():
+            self.check_object_permissions(request, instance)
+        self.perform_bulk_write(
+            self.perform_bulk_destroy,
+            self.get_queryset().model._default_manager.filter(pk__in=ids),
+        )
+        return Response(status=HTTP_204_NO_CONTENT)
+
+    def validate_bulk(
+        self,
+        child: Field,
+        data: Any,
+        key: str = api_settings.NON_FIELD_ERRORS_KEY,
+    ) -> list:
+        """Validates list payload of child items up to `bulk_max_items`."""
+        field = ListField(
+            child=child, allow_empty=False, max_length=self.bulk_max_items
+        )
+        try:
+            return field.run_validation(data)
+        except ValidationError as error:
+            raise ValidationError({key: error.detail})
+
+    def get_bulk_data(self, ids: List[int]) -> list:
+        """Gets serialized data of objects by ids in the order of ids."""
+        instances = self.get_queryset().in_bulk(ids)
+        return self.get_serializer(
+            [instances[pk] for pk in ids], many=True
+        ).data
+
+    def perform_bulk_write(self, perform, *args) -> Any:
+        """Performs bulk write in a transaction, raising 400 on conflicts."""
+        try:
+            with transaction.atomic():
+                return perform(*args)
+        except IntegrityError:
+            raise ValidationError(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: [
+                        "Items conflict with each other or existing objects."
+                    ]
+                }
+            )
+
+    def perform_bulk_create(self, serializer: ListSerializer) -> List[Model]:
+        return serializer.save()
+
+    def perform_bulk_update(
+        self, serializer: ListSerializer, validated_data: List[dict]
+    ) -> List[Model]:
+        return serializer.bulk_update(serializer.instance, validated_data)
+
+    def perform_bulk_destroy(self, queryset: QuerySet) -> None:
+        queryset.delete()
+
+
+class EchoBuffer:
+    """Pseudo-buffer returning written values, for streaming `csv.writer`."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+async def iterate_async(rows: Iterator[str], size: int) -> AsyncIterator[str]:
+    """Iterates rows of sync iterator asynchronously, chunk by chunk.
+
+    Chunks of size rows are read in the thread of `sync_to_async`, so rows \
+        querying the database are streamed by ASGI without buffering them all.
+    """
+    while True:
+        chunk = await sync_to_async(list)(islice(rows, size))
+        if not chunk:
+            return
+        for row in chunk:
+            yield row
+
+
+class ExportMixin:
+    """Viewset mixin streaming every filtered object at `export/<format>/`.
+
+    - `export/jsonl/` streams JSON Lines, one object per line.
+    - `export/csv/` streams CSV with a header row of field names, nested \
+        values (e.g. hyperlink lists) encoded as JSON.
+
+    Objects are iterated by `QuerySet.iterator` in chunks of \
+        `export_chunk_size`, with related lookups prefetched per chunk, and \
+        serialized one by one into a `StreamingHttpResponse`, so memory stays \
+        flat regardless of the number of objects.
+    Under ASGI, rows are streamed by an async iterator of `iterate_async`, \
+        since Django buffers sync iterators of ASGI responses in memory.
+    Exports are admin only and not paginated.
+
+    Attributes
+    ----------
+    - `export_chunk_size` number of objects fetched per query
+    """
+
+    export_chunk_size = 2000
+
+    @action(
+        detail=False,
+        url_path="export/(?P<export_format>csv|jsonl)",
+        permission_classes=[IsAdminUser],
+    )
+    def export(
+        self, request: Request, export_format: str, *args, **kwargs
+    ) -> StreamingHttpResponse:
+        """Streams every filtered object as JSON Lines or CSV.
+
+        Queryset and serializer are built before streaming, so invalid \
+            query params are answered with 400 instead of breaking the stream.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer()
+        if export_format == "csv":
+            rows = self.export_csv(queryset, serializer)
+            content_type = "text/csv"
+        else:
+            rows = self.export_jsonl(queryset, serializer)
+            content_type = "application/jsonl"
+        if isinstance(request._request, ASGIRequest):
+            rows = iterate_async(rows, self.export_chunk_size)
+        response = StreamingHttpResponse(rows, content_type=content_type)
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.basename}.{export_format}"'
+        )
+        return response
+
+    def export_objects(
+        self, queryset: QuerySet, serializer: BaseSerializer
+    ) -> Iterator[dict]:
+        """Iterates serialized data of every object of queryset."""
+        for instance in queryset.iterator(chunk_size=self.export_chunk_size):
+            yield serializer.to_representation(instance)
+
+    def export_jsonl(
+        self, queryset: QuerySet, serializer: BaseSerializer
+    ) -> Iterator[str]:
+        """Iterates JSON Lines of every object of queryset."""
+        for data in self.export_objects(queryset, serializer):
+            yield json.dumps(data, cls=JSONEncoder) + "\n"
+
+    def export_csv(
+        self, queryset: QuerySet, serializer: BaseSerializer
+    ) -> Iterator[str]:
+        """Iterates CSV rows of every object of queryset after header row."""
+        writer = csv.writer(EchoBuffer())
+        names = [
+            name
+            for name, field in serializer.fields.items()
+            if not field.write_only
+        ]
+        yield writer.writerow(names)
+        for data in self.export_objects(queryset, serializer):
+            yield writer.writerow(
+                [
+                    (
+                        json.dumps(data[name], cls=JSONEncoder)
+                        if isinstance(data[name], (dict, list))
+                        else data[name]
+                    )
+                    for name in names
+                ]
+            )
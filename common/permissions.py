@@ -1,11 +1,98 @@
-from rest_framework.permissions import BasePermission, SAFE_METHODS
+from django.db.models import Model, QuerySet
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework.permissions import (
+    AND,
+    OR,
+    BasePermission,
+    SAFE_METHODS,
+)
 from rest_framework.request import Request
 from rest_framework.views import View
-from common.models import User
 
 
-class IsOwnerOrReadOnly(BasePermission):
+class IsOwner(BasePermission):
+    """Permission of objects owned by the request user.
+
+    Ownership compares the owner id column of objects with the request user \
+        id, without loading the owner, and `filter_queryset` scopes \
+        querysets to owned objects in SQL.
+
+    Attributes
+    ----------
+    - `owner_field` lookup of owner id column, e.g. `customer_id`, or \
+        `order__customer_id` across a ForeignKey
+    - `others_read_only` permits safe methods on objects of others, \
+        leaving them unscoped
+    """
+
+    owner_field = "owner_id"
+    others_read_only = False
+
+    def get_owner_field(self, model: type) -> str:
+        return self.owner_field
+
     def has_object_permission(
-        self, request: Request, view: View, object: User
+        self, request: Request, view: View, object: Model
     ) -> bool:
-        return object == request.user or request.method in SAFE_METHODS
+        if self.others_read_only and request.method in SAFE_METHODS:
+            return True
+        owner_id = object
+        for name in self.get_owner_field(type(object)).split(LOOKUP_SEP):
+            owner_id = getattr(owner_id, name)
+        return owner_id == request.user.pk
+
+    def filter_queryset(
+        self, request: Request, view: View, queryset: QuerySet
+    ) -> QuerySet:
+        """Filters queryset to objects owned by the request user.
+
+        ForeignKeys joined by the owner lookup are selected as well, so \
+            object permission checks need no further query.
+        """
+        if self.others_read_only and request.method in SAFE_METHODS:
+            return queryset
+        owner_field = self.get_owner_field(queryset.model)
+        related = owner_field.rpartition(LOOKUP_SEP)[0]
+        if related:
+            queryset = queryset.select_related(related)
+        return queryset.filter(**{owner_field: request.user.pk})
+
+
+class IsOwnerOrReadOnly(IsOwner):
+    owner_field = "pk"
+    others_read_only = True
+
+
+def scope_queryset(
+    permission: BasePermission,
+    request: Request,
+    view: View,
+    queryset: QuerySet,
+) -> QuerySet:
+    """Scopes queryset to objects which permission may grant in SQL.
+
+    Permissions defining `filter_queryset` filter the queryset, others leave \
+        it whole if granted and empty otherwise.
+    `|` composed permissions scope to the union of operands, `&` to the \
+        intersection, and `~` leaves the queryset whole.
+    """
+    if isinstance(permission, OR):
+        scoped = [
+            scope_queryset(operand, request, view, queryset)
+            for operand in [permission.op1, permission.op2]
+        ]
+        if any(operand is queryset for operand in scoped):
+            return queryset
+        return scoped[0] | scoped[1]
+    if isinstance(permission, AND):
+        queryset = scope_queryset(permission.op1, request, view, queryset)
+        return scope_queryset(permission.op2, request, view, queryset)
+    if hasattr(permission, "filter_queryset"):
+        if not permission.has_permission(request, view):
+            return queryset.none()
+        return permission.filter_queryset(request, view, queryset)
+    if hasattr(permission, "op1"):
+        return queryset
+    if not permission.has_permission(request, view):
+        return queryset.none()
+    return queryset
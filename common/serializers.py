@@ -1,8 +1,313 @@
-from rest_framework.serializers import HyperlinkedModelSerializer
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection
+from django.db.models import Model
+from django.http import HttpRequest
+from django.utils.timezone import now
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import IntegerField
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.relations import HyperlinkedRelatedField, ManyRelatedField
+from rest_framework.serializers import (
+    BaseSerializer,
+    HyperlinkedModelSerializer,
+    ListSerializer,
+)
 from common.models import User
 
 
-class UserAdminSerializer(HyperlinkedModelSerializer):
+class Fieldset(NamedTuple):
+    """Sparse fieldset of request.
+
+    Attributes
+    ----------
+    - `fields` names of fields to keep, every field if empty
+    - `omit` names of fields to remove
+    - `cap` maximum number of objects of reverse relations, unlimited if \
+        `None`
+    """
+
+    fields: FrozenSet[str] = frozenset()
+    omit: FrozenSet[str] = frozenset()
+    cap: Optional[int] = None
+
+    def filter(self, names: Iterable[str]) -> List[str]:
+        """Filters field names by `fields` and `omit`.
+
+        Raises 400 `ValidationError` if `fields` or `omit` name any field \
+            not in names.
+        """
+        names = list(names)
+        errors = {
+            param: [f"Unknown field: {name}." for name in sorted(unknown)]
+            for param, unknown in [
+                ("fields", self.fields.difference(names)),
+                ("omit", self.omit.difference(names)),
+            ]
+            if unknown
+        }
+        if errors:
+            raise ValidationError(errors)
+        return [
+            name
+            for name in names
+            if (not self.fields or name in self.fields)
+            and name not in self.omit
+        ]
+
+
+def get_fieldset(request: Optional[HttpRequest]) -> Fieldset:
+    """Gets sparse fieldset of request by query params.
+
+    Query Params
+    ------------
+    - `fields` comma-separated names of fields to keep
+    - `omit` comma-separated names of fields to remove
+    - `cap` maximum number of objects of reverse relations, e.g. `0` to leave \
+        them empty and rely on count fields as a summary
+
+    Only reads are sparse, so writes always validate every field.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return Fieldset()
+    params = getattr(request, "query_params", request.GET)
+
+    def get_names(param: str) -> FrozenSet[str]:
+        return frozenset(
+            name.strip()
+            for name in params.get(param, "").split(",")
+            if name.strip()
+        )
+
+    cap = None
+    if "cap" in params:
+        try:
+            cap = IntegerField(min_value=0).run_validation(params["cap"])
+        except ValidationError as error:
+            raise ValidationError({"cap": error.detail})
+    return Fieldset(get_names("fields"), get_names("omit"), cap)
+
+
+class SparseFieldsetMixin:
+    """Serializer mixin removing fields by sparse fieldset of request.
+
+    Fields are removed before serializing, and `common.mixins.plan_queryset` \
+        plans lookups of remaining fields only, so omitted relations are \
+        never queried.
+    Only top-level serializers, or children of top-level list serializers, \
+        are sparse.
+    """
+
+    def get_fields(self) -> dict:
+        fields = super().get_fields()
+        parent = self.parent
+        if isinstance(parent, ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return fields
+        fieldset = get_fieldset(self.context.get("request"))
+        return {name: fields[name] for name in fieldset.filter(fields)}
+
+
+class BulkHyperlinkedRelatedField(HyperlinkedRelatedField):
+    """Hyperlinked related field reading objects resolved in bulk.
+
+    Objects of hyperlinks in `related_objects` of the context, resolved by \
+        `resolve_related_objects` for every item of a list payload, are read \
+        instead of being queried one by one.
+    Select it per serializer with `serializer_related_field`.
+    """
+
+    collecting = False
+
+    def get_object(self, view_name: str, view_args: list, view_kwargs: dict):
+        lookup_value = str(view_kwargs[self.lookup_url_kwarg])
+        if self.collecting:
+            return lookup_value
+        objects = self.context.get("related_objects", {}).get(
+            self.get_objects_key()
+        )
+        if objects is None:
+            return super().get_object(view_name, view_args, view_kwargs)
+        try:
+            return objects[lookup_value]
+        except KeyError:
+            raise ObjectDoesNotExist
+
+    def get_objects_key(self) -> Tuple[Type[Model], str]:
+        """Gets key of resolved objects by model and lookup field."""
+        return self.get_queryset().model, self.lookup_field
+
+    def resolve_objects(self, data: Iterable[Any]) -> Dict[str, Model]:
+        """Gets objects of valid hyperlinks of data by lookup value.
+
+        Hyperlinks are parsed by `to_internal_value` collecting lookup \
+            values, and objects are read in one query.
+        """
+        lookup_values = set()
+        self.collecting = True
+        try:
+            for value in data:
+                try:
+                    lookup_values.add(self.to_internal_value(value))
+                except ValidationError:
+                    continue
+        finally:
+            self.collecting = False
+        return {
+            str(getattr(obj, self.lookup_field)): obj
+            for obj in self.get_queryset().filter(
+                **{f"{self.lookup_field}__in": lookup_values}
+            )
+        }
+
+
+def resolve_related_objects(
+    serializer: BaseSerializer, data: Any
+) -> Dict[Tuple[Type[Model], str], Dict[str, Model]]:
+    """Resolves objects of hyperlinks of list items in one query per relation.
+
+    Returns
+    -------
+    - objects by lookup value by key of `BulkHyperlinkedRelatedField`, to \
+        pass as `related_objects` of the context of serializers of the items
+    """
+    items = [item for item in data if isinstance(item, dict)]
+    related_objects = {}
+    for field in serializer.fields.values():
+        many = isinstance(field, ManyRelatedField)
+        relation = field.child_relation if many else field
+        if field.read_only or not isinstance(
+            relation, BulkHyperlinkedRelatedField
+        ):
+            continue
+        values = []
+        for item in items:
+            value = item.get(field.field_name)
+            if many and isinstance(value, list):
+                values.extend(value)
+            elif not many and value is not None:
+                values.append(value)
+        related_objects.setdefault(relation.get_objects_key(), {}).update(
+            relation.resolve_objects(values)
+        )
+    return related_objects
+
+
+class BulkListSerializer(ListSerializer):
+    """List serializer writing objects in bulk.
+
+    Objects are written by one `bulk_create` or `bulk_update`, and \
+        many-to-many relations by one insert of through rows per relation, \
+        instead of saving every object.
+    As with `QuerySet.bulk_create`, no model signals are sent.
+    Hyperlinks of items are resolved by `resolve_related_objects` in one \
+        query per relation before validating the items.
+    Select it per serializer with `Meta.list_serializer_class`.
+    """
+
+    def create(self, validated_data: List[dict]) -> List[Model]:
+        """Creates objects and their many-to-many relations in bulk.
+
+        Databases which cannot return primary keys of bulk inserts, e.g. \
+            MySQL, insert objects one by one instead, sending model signals, \
+            since relations and responses need the primary keys.
+        """
+        model = self.child.Meta.model
+        pairs = [self.split_many_to_many(attrs) for attrs in validated_data]
+        instances = [model(**attrs) for attrs, _ in pairs]
+        if connection.features.can_return_rows_from_bulk_insert:
+            instances = model.objects.bulk_create(instances)
+        else:
+            for instance in instances:
+                instance.save(force_insert=True)
+        self.set_many_to_many(
+            list(zip(instances, [relations for _, relations in pairs]))
+        )
+        return instances
+
+    def to_internal_value(self, data: Any) -> List[dict]:
+        """Validates items reading objects of their hyperlinks in bulk."""
+        if (
+            isinstance(data, list)
+            and len(data) <= (self.max_length or len(data))
+            and "related_objects" not in self.context
+        ):
+            self.context["related_objects"] = resolve_related_objects(
+                self.child, data
+            )
+        return super().to_internal_value(data)
+
+    def bulk_update(
+        self, instances: List[Model], validated_data: List[dict]
+    ) -> List[Model]:
+        """Partially updates objects and their many-to-many relations in bulk.
+
+        Many-to-many relations given for an object replace its current ones.
+        """
+        model = self.child.Meta.model
+        fields, updated, pairs = {"updated"}, now(), []
+        for instance, attrs in zip(instances, validated_data):
+            attrs, relations = self.split_many_to_many(attrs)
+            for attr, value in attrs.items():
+                setattr(instance, attr, value)
+                fields.add(attr)
+            instance.updated = updated
+            pairs.append((instance, relations))
+        model.objects.bulk_update(instances, sorted(fields))
+        self.set_many_to_many(pairs, clear=True)
+        return instances
+
+    def split_many_to_many(self, attrs: dict) -> Tuple[dict, Dict[str, list]]:
+        """Splits attrs into field attrs and many-to-many relations."""
+        model = self.child.Meta.model
+        attrs, relations = dict(attrs), {}
+        for attr in list(attrs):
+            if model._meta.get_field(attr).many_to_many:
+                relations[attr] = attrs.pop(attr)
+        return attrs, relations
+
+    def set_many_to_many(
+        self, pairs: List[Tuple[Model, Dict[str, list]]], clear: bool = False
+    ) -> None:
+        """Sets many-to-many relations of objects by through rows.
+
+        Inserts through rows of every object in one query per relation, \
+            deleting current rows of the objects first if `clear`.
+        """
+        model = self.child.Meta.model
+        for attr in sorted(
+            {attr for _, relations in pairs for attr in relations}
+        ):
+            field = model._meta.get_field(attr)
+            through = field.remote_field.through
+            source = field.m2m_field_name()
+            target = field.m2m_reverse_field_name()
+            instances = [
+                instance for instance, relations in pairs if attr in relations
+            ]
+            if clear:
+                through.objects.filter(**{f"{source}__in": instances}).delete()
+            through.objects.bulk_create(
+                [
+                    through(**{source: instance, target: related})
+                    for instance, relations in pairs
+                    for related in dict.fromkeys(relations.get(attr, []))
+                ]
+            )
+
+
+class UserAdminSerializer(SparseFieldsetMixin, HyperlinkedModelSerializer):
     """User serializer for admin.
 
     Fields
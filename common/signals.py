@@ -0,0 +1,13 @@
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from common.metrics import record_query
+
+
+@receiver(connection_created, dispatch_uid="install_record_query")
+def install_record_query(
+    sender, connection: BaseDatabaseWrapper, **kwargs
+) -> None:
+    """Installs query recording of request metrics on new connection."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
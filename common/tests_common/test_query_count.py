@@ -0,0 +1,149 @@
+from datetime import date
+from itertools import count
+from typing import Dict, Optional, Tuple
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.status import HTTP_200_OK
+from rest_framework.test import APITestCase
+from commerce.models import (
+    Cart,
+    Category,
+    Order,
+    Order2Product,
+    Product,
+    ProductSales,
+    Review,
+    Tag,
+)
+from commerce.urls import router as commerce_router
+from common.cache import get_response_cache
+from common.models import User
+from common.urls import router as common_router
+from snippets.models import Snippet
+from snippets.urls import router as snippets_router
+
+ROUTERS = [commerce_router, common_router, snippets_router]
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "dummy": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+        "snippets": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "snippets",
+        },
+    },
+    RESPONSE_CACHE_ALIAS="dummy",
+    SNIPPETS_HIGHLIGHT_WORKERS=0,
+)
+class QueryCountTests(APITestCase):
+    """Query count regression tests of every registered router endpoint.
+
+    Requests every list, detail and extra GET route of `ROUTERS` after \
+        seeding objects at two sizes, failing if the number of queries grows \
+        with the number of objects, e.g. by an N+1 query.
+    Routes are requested as admin without response cache, and as admin and \
+        anonymous on cache misses of a local-memory response cache, \
+        anonymous requests checking the routes readable anonymously.
+    """
+
+    small, large = 2, 6
+    query_params = {"product_search-list": {"q": "product"}}
+
+    def setUp(self):
+        self.indexes = count(1)
+        self.admin = User.objects.create(
+            username="admin", is_staff=True, is_superuser=True
+        )
+
+    def seed(self, size: int) -> None:
+        """Seeds size objects of every model, related to each other."""
+        for _ in range(size):
+            index = next(self.indexes)
+            user = User.objects.create(username=f"user{index}")
+            category = Category.objects.create(title=f"category{index}")
+            tag = Tag.objects.create(title=f"tag{index}")
+            product = Product.objects.create(
+                vendor=user, category=category, title=f"product{index}", price=1
+            )
+            product.tags.add(tag)
+            _ = Cart.objects.create(customer=self.admin, product=product)
+            order = Order.objects.create(customer=self.admin)
+            _ = Order2Product.objects.create(order=order, product=product)
+            _ = Review.objects.create(reviewer=user, product=product, rating=1)
+            _ = ProductSales.objects.create(
+                vendor=self.admin, product=product, date=date(2026, 1, index)
+            )
+            _ = Snippet.objects.create(owner=user, code=f"print({index})")
+
+    def get_paths(self) -> Dict[str, str]:
+        """Gets paths of list, detail and extra GET routes by route name."""
+        paths = {}
+        for router in ROUTERS:
+            for _, viewset, basename in router.registry:
+                pk = viewset.queryset.model.objects.order_by("pk").first().pk
+                paths[f"{basename}-list"] = reverse(f"{basename}-list")
+                if hasattr(viewset, "retrieve"):
+                    paths[f"{basename}-detail"] = reverse(
+                        f"{basename}-detail", kwargs={"pk": pk}
+                    )
+                for action in viewset.get_extra_actions():
+                    if "get" not in action.mapping or "(?P" in action.url_path:
+                        continue
+                    name = f"{basename}-{action.url_name}"
+                    kwargs = {"pk": pk} if action.detail else {}
+                    paths[name] = reverse(name, kwargs=kwargs)
+        return paths
+
+    def count_queries(self, name: str, path: str) -> Tuple[int, int]:
+        """Counts queries of path on a response cache miss.
+
+        Returns
+        -------
+        - status code
+        - number of queries
+        """
+        get_response_cache().clear()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(path, data=self.query_params.get(name))
+        return response.status_code, len(context.captured_queries)
+
+    def assert_query_counts(self, user: Optional[User]) -> None:
+        """Asserts query counts of routes readable by user do not grow."""
+        self.client.force_authenticate(user=user)
+        self.seed(self.small)
+        paths = self.get_paths()
+        counts = {
+            name: self.count_queries(name, path) for name, path in paths.items()
+        }
+        if user is not None:
+            for name, (status, _) in counts.items():
+                self.assertEqual(status, HTTP_200_OK, paths[name])
+        counts = {
+            name: queries
+            for name, (status, queries) in counts.items()
+            if status == HTTP_200_OK
+        }
+        self.assertTrue(counts)
+
+        self.seed(self.large - self.small)
+        for name, queries in counts.items():
+            with self.subTest(route=name):
+                self.assertEqual(
+                    self.count_queries(name, paths[name]),
+                    (HTTP_200_OK, queries),
+                )
+
+    def test_query_count(self):
+        self.assert_query_counts(self.admin)
+
+    @override_settings(RESPONSE_CACHE_ALIAS="default")
+    def test_query_count_cache_miss(self):
+        self.assert_query_counts(self.admin)
+
+    @override_settings(RESPONSE_CACHE_ALIAS="default")
+    def test_query_count_anonymous(self):
+        self.assert_query_counts(None)
@@ -2,8 +2,10 @@ from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_403_FORBIDDEN,
 )
 from rest_framework.test import APITestCase
+from common.metrics import reset_request_metrics
 from common.models import User
 
 
@@ -54,3 +56,36 @@ class UserTests(APITestCase):
 
         self.assertEqual(response.status_code, HTTP_204_NO_CONTENT)
         self.assertEqual(User.objects.all().count(), 0)
+
+    def test_retrieve_user_sparse_fieldset(self):
+        response = self.client.get(
+            "/common/users/1/", data={"omit": "password"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertNotIn("password", response.data)
+        self.assertEqual(response.data["username"], "user1")
+
+    def test_request_metrics(self):
+        reset_request_metrics()
+        for _ in range(3):
+            response = self.client.get("/common/users/", data=None)
+            self.assertEqual(response.status_code, HTTP_200_OK)
+
+        response = self.client.get("/common/request-metrics/", data=None)
+        self.assertEqual(response.status_code, HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(
+            user=User.objects.create(username="admin", is_staff=True)
+        )
+        response = self.client.get("/common/request-metrics/", data=None)
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        metrics = response.data["user-list"]
+        self.assertEqual(metrics["total_ms"]["count"], 3)
+        self.assertEqual(metrics["queries"]["buckets"]["+Inf"], 3)
+        self.assertGreater(metrics["queries"]["sum"], 0)
+
+        with self.settings(REQUEST_METRICS_THRESHOLDS={"queries": 0}):
+            with self.assertLogs("common.metrics", level="WARNING") as logs:
+                self.client.get("/common/users/1/", data=None)
+        self.assertIn('"route": "user-detail"', logs.output[0])
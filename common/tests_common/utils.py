@@ -0,0 +1,63 @@
+import os
+import re
+import sqlite3
+from contextlib import contextmanager
+from tempfile import TemporaryDirectory
+from typing import Dict, Iterable, Iterator, List
+from django.db import connection
+
+
+@contextmanager
+def file_database() -> Iterator[None]:
+    """Moves the default test database to a temporary SQLite file in context.
+
+    Threads lock the file like production databases, instead of failing at \
+        once on the shared cache of the in-memory test database, which is \
+        kept open and restored on exit.
+    """
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "db.sqlite3")
+        connection.ensure_connection()
+        database, name = connection.connection, connection.settings_dict["NAME"]
+        target = sqlite3.connect(path)
+        database.backup(target)
+        target.close()
+        connection.settings_dict["NAME"], connection.connection = path, None
+        try:
+            yield
+        finally:
+            connection.close()
+            connection.settings_dict["NAME"] = name
+            connection.connection = database
+
+
+def get_unbounded_queries(queries: Iterable[Dict[str, str]]) -> List[str]:
+    """Gets SQL of captured queries reading whole tables.
+
+    Queries are unbounded if, outside of parenthesized subqueries, they have \
+        neither `WHERE` nor `LIMIT`, e.g. `COUNT(*)` or aggregates of \
+        annotated subqueries over the table.
+    """
+    unbounded = []
+    for query in queries:
+        sql, outer = query["sql"], None
+        while outer != sql:
+            outer, sql = sql, re.sub(r"\([^()]*\)", "", sql)
+        if " WHERE " not in sql and " LIMIT " not in sql:
+            unbounded.append(query["sql"])
+    return unbounded
+
+
+class FileDatabaseMixin:
+    """Transaction test case mixin running the class on a file database.
+
+    For tests writing from several threads, e.g. concurrent requests or \
+        callbacks of background workers, by `file_database`.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        context = file_database()
+        context.__enter__()
+        cls.addClassCleanup(context.__exit__, None, None, None)
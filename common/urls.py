@@ -1,6 +1,11 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from common.views import UserViewSet, UserAdminViewSet
+from common.views import (
+    RequestMetricsView,
+    ResponseCacheStatsView,
+    UserViewSet,
+    UserAdminViewSet,
+)
 
 router = DefaultRouter()
 router.register("users", UserViewSet, basename="user")
@@ -9,4 +14,14 @@ router.register("users-admin", UserAdminViewSet, basename="user_admin")
 
 urlpatterns = [
     path("", include(router.urls)),
+    path(
+        "response-cache-stats/",
+        ResponseCacheStatsView.as_view(),
+        name="response_cache_stats",
+    ),
+    path(
+        "request-metrics/",
+        RequestMetricsView.as_view(),
+        name="request_metrics",
+    ),
 ]
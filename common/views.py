@@ -1,6 +1,13 @@
 import logging
 from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.status import HTTP_204_NO_CONTENT
+from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
+from common.cache import get_response_cache_stats
+from common.metrics import get_request_metrics, reset_request_metrics
+from common.mixins import ConditionalMixin, ExportMixin, PermissionScopeMixin
 from common.models import User
 from common.permissions import IsOwnerOrReadOnly
 from common.serializers import UserSerializer, UserAdminSerializer
@@ -8,7 +15,7 @@ from common.serializers import UserSerializer, UserAdminSerializer
 LOGGER = logging.getLogger(__name__)
 
 
-class UserAdminViewSet(ModelViewSet):
+class UserAdminViewSet(ExportMixin, ConditionalMixin, ModelViewSet):
     """User viewset for admin.
 
     Model Attributes
@@ -39,6 +46,10 @@ class UserAdminViewSet(ModelViewSet):
     - `last_login` read_only
     - `date_joined` read_only
 
+    Export
+    ------
+    - `export/jsonl/` / `export/csv/` streams objects by `ExportMixin`
+
     Permission
     ----------
     - Admin: Create / List / Retrieve / Update / Destroy
@@ -49,7 +60,7 @@ class UserAdminViewSet(ModelViewSet):
     permission_classes = [IsAdminUser]
 
 
-class UserViewSet(UserAdminViewSet):
+class UserViewSet(PermissionScopeMixin, UserAdminViewSet):
     """User viewset for admin.
 
     Model Attributes
@@ -85,3 +96,49 @@ class UserViewSet(UserAdminViewSet):
 
     serializer_class = UserSerializer
     permission_classes = [IsOwnerOrReadOnly]
+
+
+class ResponseCacheStatsView(APIView):
+    """Response cache statistics view for admin.
+
+    Fields
+    ------
+    - `hits`
+    - `misses`
+
+    Permission
+    ----------
+    - Admin: ~~Create~~ / ~~List~~ / Retrieve / ~~Update~~ / ~~Destroy~~
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Request) -> Response:
+        """Retrieves hit and miss counters of response cache."""
+        return Response(get_response_cache_stats())
+
+
+class RequestMetricsView(APIView):
+    """Request metrics view for admin.
+
+    Fields
+    ------
+    - histograms of `queries`, `db_ms`, `serialization_ms` and `total_ms` \
+        by route name, each with `count`, `sum`, `max` and cumulative \
+        `buckets` by upper bound
+
+    Permission
+    ----------
+    - Admin: ~~Create~~ / ~~List~~ / Retrieve / ~~Update~~ / Destroy
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Request) -> Response:
+        """Retrieves histograms of request metrics by route."""
+        return Response(get_request_metrics())
+
+    def delete(self, request: Request) -> Response:
+        """Resets histograms of request metrics."""
+        reset_request_metrics()
+        return Response(status=HTTP_204_NO_CONTENT)
@@ -55,6 +55,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "common.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -153,6 +154,44 @@ AUTH_USER_MODEL = "common.User"
 
 ASGI_APPLICATION = "djarf.asgi.application"
 
+CHANNEL_LAYERS = {
+    "default": {
+        "BACKEND": "channels.layers.InMemoryChannelLayer",
+    }
+}
+
+# if os.environ.get("DJARF_PROD"):
+#     CHANNEL_LAYERS = {
+#         "default": {
+#             "BACKEND": "channels_redis.core.RedisChannelLayer",
+#             "CONFIG": {"hosts": [(os.environ["REDIS_HOST"], 6379)]},
+#         }
+#     }
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Highlighted fragments never expire, so they must not evict responses
+    "snippets": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "snippets",
+    },
+}
+
+RESPONSE_CACHE_ALIAS = "default"
+
+RESPONSE_CACHE_TIMEOUT = 300
+
+# Requests exceeding any threshold are logged by common.metrics
+REQUEST_METRICS_THRESHOLDS = {"queries": 50, "db_ms": 500, "total_ms": 1000}
+
+SNIPPETS_HIGHLIGHT_CACHE_ALIAS = "snippets"
+
+SNIPPETS_HIGHLIGHT_CSS = "inline"
+
+SNIPPETS_HIGHLIGHT_WORKERS = 2
+
 REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
@@ -193,5 +232,9 @@ LOGGING = {
             "handlers": ["console", "file"],
             "level": "INFO",
         },
+        "common": {
+            "handlers": ["console", "file"],
+            "level": "INFO",
+        },
     },
 }
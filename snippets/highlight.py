@@ -0,0 +1,198 @@
+import logging
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from hashlib import sha256
+from threading import Lock
+from typing import Optional
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db import close_old_connections
+from django.db.models.functions import Now
+from django.urls import reverse
+from pygments import highlight
+from pygments.formatters.html import (
+    DOC_FOOTER,
+    DOC_HEADER,
+    DOC_HEADER_EXTERNALCSS,
+    HtmlFormatter,
+)
+from pygments.lexers import get_lexer_by_name
+
+LOGGER = logging.getLogger(__name__)
+
+CSS_INLINE = "inline"
+CSS_EXTERNAL = "external"
+
+PLACEHOLDER = "<p>Highlighting is in progress.</p>"
+
+EXECUTOR: Optional[ProcessPoolExecutor] = None
+EXECUTOR_LOCK = Lock()
+
+
+def get_highlight_cache() -> BaseCache:
+    """Gets cache of `SNIPPETS_HIGHLIGHT_CACHE_ALIAS`, `default` if unset."""
+    return caches[
+        getattr(settings, "SNIPPETS_HIGHLIGHT_CACHE_ALIAS", "default")
+    ]
+
+
+def get_css_mode() -> str:
+    """Gets `SNIPPETS_HIGHLIGHT_CSS` in settings, `inline` if unset.
+
+    - `inline` embeds the style CSS in every highlighted document.
+    - `external` links every highlighted document to the style CSS served \
+        once per style by `snippet-style` view.
+    """
+    return getattr(settings, "SNIPPETS_HIGHLIGHT_CSS", CSS_INLINE)
+
+
+def get_workers() -> int:
+    """Gets `SNIPPETS_HIGHLIGHT_WORKERS` in settings, `0` if unset.
+
+    With `0` workers, snippets are highlighted synchronously on save.
+    """
+    return getattr(settings, "SNIPPETS_HIGHLIGHT_WORKERS", 0)
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """Gets process pool of highlighting workers, created once per process."""
+    global EXECUTOR
+    with EXECUTOR_LOCK:
+        if EXECUTOR is None:
+            EXECUTOR = ProcessPoolExecutor(max_workers=get_workers())
+        return EXECUTOR
+
+
+def shutdown_executor() -> None:
+    """Shuts down process pool of highlighting workers if created.
+
+    Waits for enqueued renderings and their Snippet updates to finish.
+    """
+    global EXECUTOR
+    with EXECUTOR_LOCK:
+        if EXECUTOR is not None:
+            EXECUTOR.shutdown()
+            EXECUTOR = None
+
+
+def get_digest(*options) -> str:
+    """Gets content address of highlighting options."""
+    return sha256(repr(options).encode()).hexdigest()
+
+
+def get_fragment_key(
+    code: str, language: str, style: str, linenos: bool
+) -> str:
+    """Gets cache key of highlighted fragment."""
+    return "highlight:" + get_digest(code, language, style, linenos)
+
+
+def render_fragment(code: str, language: str, style: str, linenos: bool) -> str:
+    """Highlights code into HTML fragment.
+
+    Pure function of its arguments, to be run in highlighting workers.
+    """
+    formatter = HtmlFormatter(
+        style=style, linenos="table" if linenos else False
+    )
+    return highlight(code, get_lexer_by_name(language), formatter)
+
+
+def get_cached_fragment(
+    code: str, language: str, style: str, linenos: bool
+) -> Optional[str]:
+    """Gets cached highlighted fragment, `None` if not cached."""
+    return get_highlight_cache().get(
+        get_fragment_key(code, language, style, linenos)
+    )
+
+
+def highlight_code(code: str, language: str, style: str, linenos: bool) -> str:
+    """Highlights code into HTML fragment, reusing cached fragment if any."""
+    fragment = get_cached_fragment(code, language, style, linenos)
+    if fragment is None:
+        fragment = render_fragment(code, language, style, linenos)
+        get_highlight_cache().set(
+            get_fragment_key(code, language, style, linenos), fragment, None
+        )
+    return fragment
+
+
+@lru_cache(maxsize=None)
+def get_style_css(style: str) -> str:
+    """Gets CSS of style for highlighted document body."""
+    return HtmlFormatter(style=style).get_style_defs("body")
+
+
+def wrap_document(fragment: str, style: str, title: str) -> str:
+    """Wraps fragment into HTML document, as `HtmlFormatter(full=True)` does.
+
+    Style CSS is embedded or linked depending on `get_css_mode`.
+    """
+    if get_css_mode() == CSS_EXTERNAL:
+        header = DOC_HEADER_EXTERNALCSS % dict(
+            title=title,
+            cssfile=reverse("snippet-style", kwargs={"style": style}),
+            encoding=None,
+        )
+    else:
+        header = DOC_HEADER % dict(
+            title=title, styledefs=get_style_css(style), encoding=None
+        )
+    return header + fragment + DOC_FOOTER
+
+
+def render_document(
+    code: str, language: str, style: str, linenos: bool, title: str
+) -> str:
+    """Renders highlighted HTML document synchronously."""
+    return wrap_document(
+        highlight_code(code, language, style, linenos), style, title
+    )
+
+
+def enqueue_document(
+    pk: int,
+    digest: str,
+    code: str,
+    language: str,
+    style: str,
+    linenos: bool,
+    title: str,
+) -> Future:
+    """Enqueues rendering of Snippet document to highlighting workers.
+
+    Once rendered, the Snippet is updated to `ready` unless its digest has \
+        changed meanwhile, so stale renderings never overwrite newer ones.
+    The update bumps `updated`, so clients holding the pending Snippet are \
+        not answered 304 to conditional GETs.
+    Falls back to rendering synchronously if the worker fails.
+    """
+
+    def done(future: Future) -> None:
+        from snippets.models import Snippet
+
+        close_old_connections()
+        try:
+            fragment = future.result()
+            get_highlight_cache().set(
+                get_fragment_key(code, language, style, linenos),
+                fragment,
+                None,
+            )
+            document = wrap_document(fragment, style, title)
+        except Exception:
+            LOGGER.exception("Highlighting worker failed for Snippet %s", pk)
+            document = render_document(code, language, style, linenos, title)
+        Snippet.objects.filter(pk=pk, highlighted_digest=digest).update(
+            highlighted=document,
+            highlight_status=Snippet.STATUS_READY,
+            updated=Now(),
+        )
+        close_old_connections()
+
+    future = get_executor().submit(
+        render_fragment, code, language, style, linenos
+    )
+    future.add_done_callback(done)
+    return future
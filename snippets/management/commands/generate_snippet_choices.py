@@ -0,0 +1,62 @@
+from pathlib import Path
+import json
+from django.core.management.base import BaseCommand, CommandError
+from pygments.lexers import get_all_lexers
+from pygments.styles import get_all_styles
+
+OUTPUT = Path(__file__).resolve().parents[2] / "choices.py"
+
+TEMPLATE = '''"""Snippet language and style choices.
+
+Generated by `python manage.py generate_snippet_choices` from installed \\
+    Pygments, so that importing models does not discover every lexer and \\
+    style plugin. Regenerate after upgrading Pygments.
+"""
+
+LANGUAGE_CHOICES = {languages}
+
+STYLE_CHOICES = {styles}
+'''
+
+
+def render_list(choices: list) -> str:
+    """Renders list of choice pairs as formatted Python literal."""
+    lines = [
+        f"    ({json.dumps(value)}, {json.dumps(label, ensure_ascii=False)}),"
+        for value, label in choices
+    ]
+    return "\n".join(["[", *lines, "]"])
+
+
+def render_choices() -> str:
+    """Renders choices module from installed Pygments lexers and styles."""
+    lexers = [item for item in get_all_lexers() if item[1]]
+    languages = sorted([(item[1][0], item[0]) for item in lexers])
+    styles = sorted([(item, item) for item in get_all_styles()])
+    return TEMPLATE.format(
+        languages=render_list(languages), styles=render_list(styles)
+    )
+
+
+class Command(BaseCommand):
+    help = "Generates snippets.choices from installed Pygments."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output", default=str(OUTPUT), help="Path of choices module."
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Exits with error if choices module is stale.",
+        )
+
+    def handle(self, *args, **options):
+        output = Path(options["output"])
+        choices = render_choices()
+        if options["check"]:
+            if not output.exists() or output.read_text() != choices:
+                raise CommandError(f"{output} is stale.")
+            return
+        output.write_text(choices)
+        self.stdout.write(f"Generated {output}.")
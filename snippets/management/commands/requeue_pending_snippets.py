@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from snippets.highlight import shutdown_executor
+from snippets.models import Snippet
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-enqueues highlighting of Snippets left pending, e.g. by a "
+        "process which died before its workers finished."
+    )
+
+    def handle(self, *args, **options):
+        count = 0
+        snippets = Snippet.objects.filter(
+            highlight_status=Snippet.STATUS_PENDING
+        )
+        for snippet in snippets.iterator():
+            snippet.highlighted_digest = ""
+            snippet.save()
+            count += 1
+        shutdown_executor()
+        self.stdout.write(f"Re-enqueued {count} pending snippets.")
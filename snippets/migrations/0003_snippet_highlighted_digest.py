@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-18 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("snippets", "0002_snippet_updated"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="snippet",
+            name="highlighted_digest",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=64
+            ),
+        ),
+    ]
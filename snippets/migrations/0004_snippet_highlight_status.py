@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("snippets", "0003_snippet_highlighted_digest"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="snippet",
+            name="highlight_status",
+            field=models.CharField(
+                choices=[("pending", "Pending"), ("ready", "Ready")],
+                default="ready",
+                editable=False,
+                max_length=10,
+            ),
+        ),
+    ]
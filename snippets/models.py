@@ -1,16 +1,22 @@
-from django.db import models
-from pygments import highlight
-from pygments.formatters.html import HtmlFormatter
-from pygments.lexers import get_all_lexers, get_lexer_by_name
-from pygments.styles import get_all_styles
-
-LEXERS = [item for item in get_all_lexers() if item[1]]
-LANGUAGE_CHOICES = sorted([(item[1][0], item[0]) for item in LEXERS])
-STYLE_CHOICES = sorted([(item, item) for item in get_all_styles()])
+from django.db import models, transaction
+from snippets.choices import LANGUAGE_CHOICES, STYLE_CHOICES
+from snippets.highlight import (
+    enqueue_document,
+    get_cached_fragment,
+    get_css_mode,
+    get_digest,
+    get_workers,
+    render_document,
+)
 
 
 class Snippet(models.Model):
+    STATUS_PENDING = "pending"
+    STATUS_READY = "ready"
+    STATUS_CHOICES = [(STATUS_PENDING, "Pending"), (STATUS_READY, "Ready")]
+
     created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True, db_index=True)
     title = models.CharField(max_length=100, blank=True, default="")
     code = models.TextField()
     linenos = models.BooleanField(default=False)
@@ -24,16 +30,35 @@ class Snippet(models.Model):
         "common.User", related_name="snippets", on_delete=models.CASCADE
     )
     highlighted = models.TextField()
+    highlighted_digest = models.CharField(
+        max_length=64, blank=True, default="", editable=False
+    )
+    highlight_status = models.CharField(
+        choices=STATUS_CHOICES,
+        default=STATUS_READY,
+        max_length=10,
+        editable=False,
+    )
 
     class Meta:
         ordering = ["created"]
 
     def save(self, *args, **kwargs):
-        lexer = get_lexer_by_name(self.language)
-        linenos = "table" if self.linenos else False
-        options = {"title": self.title} if self.title else {}
-        formatter = HtmlFormatter(
-            style=self.style, linenos=linenos, full=True, **options
-        )
-        self.highlighted = highlight(self.code, lexer, formatter)
+        options = (self.code, self.language, self.style, self.linenos)
+        digest = get_digest(*options, self.title, get_css_mode())
+        enqueue = False
+        if digest != self.highlighted_digest:
+            self.highlighted_digest = digest
+            if get_workers() and get_cached_fragment(*options) is None:
+                self.highlighted = ""
+                self.highlight_status = self.STATUS_PENDING
+                enqueue = True
+            else:
+                self.highlighted = render_document(*options, self.title)
+                self.highlight_status = self.STATUS_READY
         super().save(*args, **kwargs)
+
+        if enqueue:
+            transaction.on_commit(
+                lambda: enqueue_document(self.pk, digest, *options, self.title)
+            )
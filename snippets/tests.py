@@ -1,3 +1,162 @@
-from django.test import TestCase
+from unittest.mock import patch
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import sleep
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from pygments import highlight
+from pygments.formatters.html import HtmlFormatter
+from pygments.lexers import get_lexer_by_name
+from rest_framework.status import HTTP_200_OK, HTTP_202_ACCEPTED
+from rest_framework.test import APITransactionTestCase
+from common.cache import get_response_cache
+from common.models import User
+from common.tests_common.utils import FileDatabaseMixin
+from snippets.highlight import (
+    enqueue_document,
+    get_highlight_cache,
+    shutdown_executor,
+)
+from snippets.models import Snippet
 
-# Create your tests here.
+
+@override_settings(SNIPPETS_HIGHLIGHT_WORKERS=0)
+class SnippetTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create()
+
+    def test_save_highlighted(self):
+        snippet = Snippet.objects.create(
+            owner=self.user, title="title", code="print(1)", linenos=True
+        )
+
+        formatter = HtmlFormatter(
+            style="friendly", linenos="table", full=True, title="title"
+        )
+        self.assertEqual(
+            snippet.highlighted,
+            highlight("print(1)", get_lexer_by_name("python"), formatter),
+        )
+
+    def test_save_highlighted_reused(self):
+        snippet = Snippet.objects.create(owner=self.user, code="print(2)")
+
+        with patch("snippets.highlight.highlight") as mock:
+            snippet.save()
+            snippet.title = "title"
+            snippet.save()
+            _ = Snippet.objects.create(owner=self.user, code="print(2)")
+
+        mock.assert_not_called()
+        self.assertIn("<title>title</title>", snippet.highlighted)
+
+    def test_highlight_cache_separate(self):
+        get_highlight_cache().set("fragment", "highlighted")
+
+        self.assertIsNone(get_response_cache().get("fragment"))
+
+    @override_settings(SNIPPETS_HIGHLIGHT_CSS="external")
+    def test_save_highlighted_external_css(self):
+        snippet = Snippet.objects.create(owner=self.user, code="print(3)")
+
+        self.assertIn("/snippets/styles/friendly.css", snippet.highlighted)
+        self.assertNotIn("<style", snippet.highlighted)
+
+        response = self.client.get("/snippets/styles/friendly.css")
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/css")
+
+
+class GenerateSnippetChoicesTests(TestCase):
+    def test_generate_snippet_choices(self):
+        with TemporaryDirectory() as directory:
+            output = Path(directory) / "choices.py"
+            call_command(
+                "generate_snippet_choices", output=output, stdout=StringIO()
+            )
+            call_command("generate_snippet_choices", output=output, check=True)
+
+            namespace = {}
+            exec(output.read_text(), namespace)
+            self.assertIn(("python", "Python"), namespace["LANGUAGE_CHOICES"])
+            self.assertIn(("friendly", "friendly"), namespace["STYLE_CHOICES"])
+
+            output.write_text("")
+            with self.assertRaises(CommandError):
+                call_command(
+                    "generate_snippet_choices", output=output, check=True
+                )
+
+
+@override_settings(SNIPPETS_HIGHLIGHT_WORKERS=1)
+class SnippetWorkerTests(FileDatabaseMixin, APITransactionTestCase):
+    """Snippets highlighted by workers, updated from their callback threads."""
+
+    def setUp(self):
+        user = User.objects.create()
+        self.client.force_authenticate(user=user)
+
+    def test_create_snippet_highlighted_by_worker(self):
+        response = self.client.post(
+            "/snippets/snippets/",
+            data={"code": "print('worker')"},
+            format="json",
+        )
+        self.assertEqual(response.data["highlight_status"], "pending")
+        url = f"/snippets/snippets/{response.data['id']}/highlight/"
+
+        for _ in range(100):
+            response = self.client.get(url)
+            if response.status_code != HTTP_202_ACCEPTED:
+                break
+            sleep(0.1)
+
+        self.assertEqual(response.status_code, HTTP_200_OK)
+        self.assertEqual(
+            Snippet.objects.get().highlight_status, Snippet.STATUS_READY
+        )
+        self.assertIn("worker", response.content.decode())
+
+    def test_enqueue_document_updated(self):
+        with override_settings(SNIPPETS_HIGHLIGHT_WORKERS=0):
+            snippet = Snippet.objects.create(
+                owner=User.objects.get(), code="print('enqueued')"
+            )
+        Snippet.objects.filter(pk=snippet.pk).update(
+            highlighted="", highlight_status=Snippet.STATUS_PENDING
+        )
+
+        enqueue_document(
+            snippet.pk,
+            snippet.highlighted_digest,
+            snippet.code,
+            snippet.language,
+            snippet.style,
+            snippet.linenos,
+            snippet.title,
+        )
+        shutdown_executor()
+
+        updated = snippet.updated
+        snippet.refresh_from_db()
+        self.assertEqual(snippet.highlight_status, Snippet.STATUS_READY)
+        self.assertGreater(snippet.updated, updated)
+
+    def test_requeue_pending_snippets(self):
+        with override_settings(SNIPPETS_HIGHLIGHT_WORKERS=0):
+            snippet = Snippet.objects.create(
+                owner=User.objects.get(), code="print('requeued')"
+            )
+        Snippet.objects.filter(pk=snippet.pk).update(
+            highlighted="", highlight_status=Snippet.STATUS_PENDING
+        )
+        get_highlight_cache().clear()
+
+        stdout = StringIO()
+        call_command("requeue_pending_snippets", stdout=stdout)
+
+        snippet.refresh_from_db()
+        self.assertEqual(snippet.highlight_status, Snippet.STATUS_READY)
+        self.assertIn("requeued", snippet.highlighted)
+        self.assertIn("Re-enqueued 1 pending snippets.", stdout.getvalue())
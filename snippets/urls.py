@@ -8,4 +8,5 @@ router.register(r"users", views.UserViewSet, basename="snippets.user")
 
 urlpatterns = [
     path("", include(router.urls)),
+    path("styles/<str:style>.css", views.style, name="snippet-style"),
 ]
@@ -1,13 +1,18 @@
+from django.http import Http404, HttpRequest, HttpResponse
+from django.views.decorators.cache import cache_control
 from rest_framework import permissions, renderers, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.status import HTTP_202_ACCEPTED
+from common.mixins import ConditionalMixin, QueryPlanMixin
 from common.models import User
-from snippets.models import Snippet
+from snippets.highlight import PLACEHOLDER, get_style_css
+from snippets.models import STYLE_CHOICES, Snippet
 from snippets.permissions import IsOwnerOrReadOnly
 from snippets.serializers import SnippetSerializer, UserSerializer
 
 
-class SnippetViewSet(viewsets.ModelViewSet):
+class SnippetViewSet(ConditionalMixin, QueryPlanMixin, viewsets.ModelViewSet):
     queryset = Snippet.objects.all()
     serializer_class = SnippetSerializer
     permission_classes = [
@@ -21,9 +26,24 @@ class SnippetViewSet(viewsets.ModelViewSet):
     @action(detail=True, renderer_classes=[renderers.StaticHTMLRenderer])
     def highlight(self, request, *args, **kwargs):
         snippet = self.get_object()
+        if snippet.highlight_status == Snippet.STATUS_PENDING:
+            return Response(
+                PLACEHOLDER,
+                status=HTTP_202_ACCEPTED,
+                headers={"Retry-After": "1"},
+            )
         return Response(snippet.highlighted)
 
 
-class UserViewSet(viewsets.ReadOnlyModelViewSet):
+class UserViewSet(
+    ConditionalMixin, QueryPlanMixin, viewsets.ReadOnlyModelViewSet
+):
     queryset = User.objects.all()
     serializer_class = UserSerializer
+
+
+@cache_control(public=True, max_age=86400)
+def style(request: HttpRequest, style: str) -> HttpResponse:
+    if style not in dict(STYLE_CHOICES):
+        raise Http404
+    return HttpResponse(get_style_css(style), content_type="text/css")